@@ -0,0 +1,279 @@
+import os
+import tempfile
+from collections import deque
+from itertools import islice
+from random import Random
+
+from bench_harness import add_exercise_paths
+
+add_exercise_paths()
+
+import ft_achievement_bitset as ex3_bitset  # noqa: E402
+import ft_achievement_snapshot as ex3_snapshot  # noqa: E402
+import ft_achievement_tracker as ex3  # noqa: E402
+import ft_analytics_dashboard as ex6  # noqa: E402
+import ft_coordinate_batch as ex2_batch  # noqa: E402
+import ft_coordinate_loader as ex2_loader  # noqa: E402
+import ft_coordinate_system as ex2  # noqa: E402
+import ft_dashboard_views as ex6_views  # noqa: E402
+import ft_data_stream as ex5  # noqa: E402
+import ft_inventory_system as ex4  # noqa: E402
+import ft_player_indexes as ex6_indexes  # noqa: E402
+import ft_player_table as ex6_table  # noqa: E402
+import ft_region_groupby as ex6_groupby  # noqa: E402
+import ft_score_analytics as ex1  # noqa: E402
+
+
+CASES: dict[str, tuple[object, int]] = {}
+
+ACHIEVEMENTS = [f"achievement_{i}" for i in range(64)]
+REGIONS = ["north", "south", "east", "west", "central"]
+
+
+def case(name: str, max_size: int = 10**7) -> object:
+    """
+    Registers a benchmark case factory.
+
+    A factory receives the element count, builds its input data (not
+    timed) and returns the zero-argument workload that gets timed.
+
+    Args:
+        name: Unique case name, "module.function".
+        max_size: Largest element count the case is run with; bigger
+            sizes are skipped because the workload would not finish.
+
+    Returns:
+        The registering decorator.
+    """
+    def register(factory: object) -> object:
+        CASES[name] = (factory, max_size)
+        return factory
+    return register
+
+
+def drain(iterator: object) -> None:
+    """Consumes an iterator at C speed, keeping nothing."""
+    deque(iterator, maxlen=0)
+
+
+def make_positions(n: int, rng: Random) -> list[tuple[int, int, int]]:
+    """Random 3D integer positions."""
+    r = rng.randrange
+    return [(r(-10**4, 10**4), r(-10**4, 10**4), r(-10**4, 10**4))
+            for _ in range(n)]
+
+
+def make_achievement_sets(n: int, rng: Random) -> dict[str, set]:
+    """Players holding 4 to 12 achievements each."""
+    return {
+        f"player_{i}": set(rng.sample(ACHIEVEMENTS, rng.randint(4, 12)))
+        for i in range(n)
+    }
+
+
+def make_dashboard_players(n: int, rng: Random) -> dict[str, dict]:
+    """Synthetic players in the ex6 dashboard layout."""
+    r = rng.randint
+    return {
+        f"player_{i}": {
+            'level': r(1, 50),
+            'score': r(0, 10000),
+            'sessions_played': r(0, 100),
+            'region': rng.choice(REGIONS),
+            'achievements': set(rng.sample(ACHIEVEMENTS, r(1, 8)))
+        }
+        for i in range(n)
+    }
+
+
+@case("ex1.scores_analysis")
+def bench_scores_analysis(n: int) -> object:
+    rng = Random(1)
+    scores = [rng.randrange(10**6) for _ in range(n)]
+    return lambda: ex1.scores_analysis(scores)
+
+
+@case("ex2.calculating_distance")
+def bench_calculating_distance(n: int) -> object:
+    rng = Random(2)
+    pairs = list(zip(make_positions(n, rng), make_positions(n, rng)))
+    distance = ex2.calculating_distance
+    return lambda: drain(distance(a, b) for a, b in pairs)
+
+
+@case("ex2.batch.distances_from")
+def bench_batch_distances(n: int) -> object:
+    packed = ex2_batch.pack_positions(make_positions(n, Random(2)))
+    return lambda: ex2_batch.distances_from((0, 0, 0), packed)
+
+
+@case("ex2.position_parsing")
+def bench_position_parsing(n: int) -> object:
+    lines = [f"{x},{y},{z}" for x, y, z in make_positions(n, Random(3))]
+    return lambda: drain(map(ex2.position_parsing, lines))
+
+
+@case("ex2.load_positions")
+def bench_load_positions(n: int) -> object:
+    path = os.path.join(tempfile.mkdtemp(), "positions.txt")
+    with open(path, "w") as stream:
+        stream.writelines(f"{x},{y},{z}\n"
+                          for x, y, z in make_positions(n, Random(3)))
+    return lambda: ex2_loader.load_positions(path)
+
+
+@case("ex3.get_all_unique_achievements", 10**6)
+def bench_all_unique(n: int) -> object:
+    players = make_achievement_sets(n, Random(4))
+    return lambda: ex3.get_all_unique_achievements(players)
+
+
+@case("ex3.get_common_to_all", 10**6)
+def bench_common_to_all(n: int) -> object:
+    players = make_achievement_sets(n, Random(5))
+    return lambda: ex3.get_common_to_all(players)
+
+
+@case("ex3.get_rare_achievements", 10**6)
+def bench_rare(n: int) -> object:
+    players = make_achievement_sets(n, Random(6))
+    return lambda: ex3.get_rare_achievements(players)
+
+
+@case("ex3.bitset.all_unique", 10**6)
+def bench_bitset_all_unique(n: int) -> object:
+    tracker = ex3_bitset.BitsetTracker.from_sets(
+        make_achievement_sets(n, Random(4))
+    )
+    return tracker.all_unique
+
+
+@case("ex3.bitset.common_to_all", 10**6)
+def bench_bitset_common_to_all(n: int) -> object:
+    tracker = ex3_bitset.BitsetTracker.from_sets(
+        make_achievement_sets(n, Random(5))
+    )
+    return tracker.common_to_all
+
+
+@case("ex3.bitset.rare", 10**6)
+def bench_bitset_rare(n: int) -> object:
+    tracker = ex3_bitset.BitsetTracker.from_sets(
+        make_achievement_sets(n, Random(6))
+    )
+    return tracker.rare
+
+
+@case("ex3.snapshot.load", 10**6)
+def bench_snapshot_load(n: int) -> object:
+    tracker = ex3_bitset.BitsetTracker.from_sets(
+        make_achievement_sets(n, Random(7))
+    )
+    path = os.path.join(tempfile.mkdtemp(), "achievements.snap")
+    ex3_snapshot.save_snapshot(tracker, path)
+    probe = tracker.players[n // 2]
+
+    def run() -> None:
+        with ex3_snapshot.load_snapshot(path) as snapshot:
+            snapshot.count(probe)
+    return run
+
+
+@case("ex3.diff_in_two_players")
+def bench_diff_in_two_players(n: int) -> object:
+    a = set(range(0, n))
+    b = set(range(n // 2, n + n // 2))
+    return lambda: ex3.diff_in_two_players("p1", a, "p2", b)
+
+
+@case("ex4.inventory_analysis", 10**4)
+def bench_inventory_analysis(n: int) -> object:
+    rng = Random(7)
+    inventory = {f"Item{i}": rng.randint(1, 1000) for i in range(n)}
+    return lambda: ex4.inventory_analysis(inventory)
+
+
+@case("ex5.lol_event_generator")
+def bench_lol_event_generator(n: int) -> object:
+    return lambda: drain(islice(ex5.lol_event_generator(seed=8), n))
+
+
+@case("ex5.lol_event_batches")
+def bench_lol_event_batches(n: int) -> object:
+    size = min(n, 65536)
+    blocks = -(-n // size)
+    return lambda: drain(islice(ex5.lol_event_batches(size, seed=9), blocks))
+
+
+@case("ex5.count_lol_events")
+def bench_count_lol_events(n: int) -> object:
+    return lambda: ex5.count_lol_events(n, seed=10, chunk_size=4096)
+
+
+@case("ex5.fibonacci_gen", 10**5)
+def bench_fibonacci_gen(n: int) -> object:
+    return lambda: drain(ex5.fibonacci_gen(n))
+
+
+@case("ex5.fib_nth")
+def bench_fib_nth(n: int) -> object:
+    def run() -> None:
+        ex5._fib_pair.cache_clear()
+        ex5.fib_nth(n)
+    return run
+
+
+@case("ex5.prime_gen")
+def bench_prime_gen(n: int) -> object:
+    return lambda: drain(ex5.prime_gen(n))
+
+
+@case("ex6.comprehension", 10**6)
+def bench_comprehension(n: int) -> object:
+    players = make_dashboard_players(n, Random(11))
+    return lambda: ex6.comprehension(players)
+
+
+@case("ex6.table.filters", 10**6)
+def bench_table_filters(n: int) -> object:
+    table = ex6_table.PlayerTable.from_dict(
+        make_dashboard_players(n, Random(12))
+    )
+
+    def run() -> None:
+        table.select("score", table.compare("score", ">", 2000))
+        table.select("name", table.compare("sessions_played", ">", 40))
+        table.level_buckets()
+    return run
+
+
+@case("ex6.indexes.range", 10**6)
+def bench_index_range(n: int) -> object:
+    store = ex6_indexes.IndexedPlayers(make_dashboard_players(n, Random(13)))
+
+    def run() -> None:
+        store.query([("score", "between", (2000, 2100))])
+        store.query([("level", "==", 42), ("region", "==", "north")])
+        store.query([("achievements", "contains", "achievement_7"),
+                     ("score", ">", 9000)])
+    return run
+
+
+@case("ex6.views.refresh", 10**6)
+def bench_views_refresh(n: int) -> object:
+    store = ex6_views.PlayerStore(make_dashboard_players(n, Random(14)))
+    views = ex6_views.DashboardViews(store)
+    views.refresh()
+    names = list(islice(store.players, 10))
+
+    def run() -> None:
+        for name in names:
+            store.update(name, {'score': store.players[name]['score'] + 1})
+        views.refresh()
+    return run
+
+
+@case("ex6.groupby.region", 10**6)
+def bench_group_by_region(n: int) -> object:
+    players = make_dashboard_players(n, Random(15))
+    return lambda: ex6_groupby.group_by_region(players)
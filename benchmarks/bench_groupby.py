@@ -0,0 +1,72 @@
+import argparse
+import os
+import time
+from random import Random
+
+from bench_harness import add_exercise_paths, percentile
+
+add_exercise_paths()
+
+from ft_region_groupby import group_by_region  # noqa: E402
+
+REGIONS = ["north", "south", "east", "west", "central"]
+
+
+def make_players(n: int, rng: Random) -> dict[str, dict]:
+    """Synthetic players with the fields the group-by reads."""
+    r = rng.randint
+    return {
+        f"player_{i}": {
+            'level': r(1, 50),
+            'score': r(0, 10000),
+            'sessions_played': r(0, 100),
+            'region': rng.choice(REGIONS)
+        }
+        for i in range(n)
+    }
+
+
+def main() -> None:
+    """Scaling of the group-by-region aggregation from 1 to N workers."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--players", type=int, default=1_000_000)
+    parser.add_argument("--workers", default=None,
+                        help="comma-separated worker counts "
+                             "(default: 1, 2, 4, ... up to the CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.workers:
+        counts = [int(count) for count in args.workers.split(",")]
+    else:
+        cpus = os.cpu_count() or 1
+        counts = sorted({min(2 ** i, cpus)
+                         for i in range(cpus.bit_length() + 1)})
+
+    players = make_players(args.players, Random(19))
+    print("=== Group-by-Region Scaling ===")
+    print(f"{args.players} players, chunk size {args.chunk_size}, "
+          f"{os.cpu_count()} CPUs\n")
+
+    reference, base = None, None
+    for workers in counts:
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = group_by_region(players, workers, args.chunk_size)
+            times.append(time.perf_counter() - start)
+        summary = {region: stats.to_dict() for region, stats in result.items()}
+        if reference is None:
+            reference = summary
+        elif summary != reference:
+            raise SystemExit(f"Results differ with {workers} workers")
+        median = percentile(times, 50)
+        base = base or median
+        print(f"workers {workers:<3} p50 {median:8.3f} s  "
+              f"speedup {base / median:5.2f}x  "
+              f"efficiency {base / median / workers:6.1%}")
+
+
+if __name__ == "__main__":
+    main()
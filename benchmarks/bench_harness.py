@@ -0,0 +1,171 @@
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+
+SIZES = {"small": 100, "1e5": 10**5, "1e7": 10**7}
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a list of samples.
+
+    Args:
+        samples: The measured values.
+        pct: Percentile between 0 and 100.
+
+    Returns:
+        The smallest sample covering pct percent of the data.
+    """
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def measure(
+    func: object, repeat: int = 5, warmup: int = 1, memory: bool = True
+) -> dict[str, float]:
+    """
+    Times a zero-argument callable with warmup and repetition.
+
+    Anything the callable prints is discarded. Peak memory is measured in
+    one extra tracemalloc run, kept apart from the timed runs because
+    tracing slows allocation down.
+
+    Args:
+        func: The workload to measure.
+        repeat: Number of timed runs.
+        warmup: Number of untimed runs first.
+        memory: Whether to record peak traced memory.
+
+    Returns:
+        p50/p95/min/mean seconds, the run count and peak_bytes.
+    """
+    if repeat <= 0:
+        raise ValueError("repeat must be positive")
+    samples = []
+    with open(os.devnull, "w") as null, redirect_stdout(null):
+        for _ in range(warmup):
+            func()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - start)
+        peak = 0
+        if memory:
+            tracemalloc.start()
+            try:
+                func()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+    return {
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "min": min(samples),
+        "mean": sum(samples) / len(samples),
+        "runs": repeat,
+        "peak_bytes": peak
+    }
+
+
+def environment() -> dict[str, str]:
+    """
+    Describes the machine a result file was produced on.
+
+    Returns:
+        Python version, implementation, platform and timestamp.
+    """
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": str(os.cpu_count()),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")
+    }
+
+
+def save_results(path: str, results: dict[str, dict]) -> None:
+    """
+    Writes benchmark results as a JSON baseline.
+
+    Args:
+        path: Destination file; parent directories are created.
+        results: Measurements keyed by "case@size".
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(
+            {"environment": environment(), "results": results},
+            file, indent=2, sort_keys=True
+        )
+        file.write("\n")
+
+
+def load_results(path: str) -> dict[str, dict]:
+    """
+    Reads the measurements of a JSON baseline.
+
+    Args:
+        path: The baseline file.
+
+    Returns:
+        Measurements keyed by "case@size".
+    """
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["results"]
+
+
+def compare(
+    baseline: dict[str, dict], current: dict[str, dict],
+    threshold: float = 0.10, metric: str = "p50"
+) -> list[str]:
+    """
+    Prints a side-by-side comparison of two result sets, then the keys
+    only one of them measured.
+
+    Args:
+        baseline: Reference measurements.
+        current: New measurements.
+        threshold: Relative slowdown tolerated before flagging.
+        metric: Timing statistic compared.
+
+    Returns:
+        The keys whose metric regressed beyond the threshold.
+    """
+    regressions = []
+    for key in sorted(baseline.keys() & current.keys()):
+        old, new = baseline[key][metric], current[key][metric]
+        ratio = new / old if old else float("inf")
+        status = "ok"
+        if ratio > 1 + threshold:
+            status = "REGRESSION"
+            regressions.append(key)
+        elif ratio < 1 - threshold:
+            status = "faster"
+        print(
+            f"{key:<40} {old * 1e3:>12.3f} ms {new * 1e3:>12.3f} ms "
+            f"{ratio:>7.2f}x  {status}"
+        )
+    for key in sorted(baseline.keys() - current.keys()):
+        print(f"{key:<40} missing from current results")
+    for key in sorted(current.keys() - baseline.keys()):
+        print(f"{key:<40} new, not in the baseline")
+    return regressions
+
+
+def add_exercise_paths() -> None:
+    """Makes the exN modules importable from the benchmark scripts."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for name in sorted(os.listdir(root)):
+        path = os.path.join(root, name)
+        if name.startswith("ex") and os.path.isdir(path):
+            if path not in sys.path:
+                sys.path.append(path)
@@ -0,0 +1,103 @@
+import argparse
+import time
+from random import Random
+
+from bench_harness import add_exercise_paths, percentile
+
+add_exercise_paths()
+
+from ft_achievement_similarity import SimilarityIndex  # noqa: E402
+
+
+def make_clustered_players(
+    n: int, catalog: int, archetypes: int, rng: Random
+) -> dict[str, set]:
+    """
+    Players derived from a few archetypes, with random additions and
+    removals, so true near neighbours exist.
+    """
+    names = [f"achievement_{i}" for i in range(catalog)]
+    bases = [set(rng.sample(names, rng.randint(6, 20)))
+             for _ in range(archetypes)]
+    players = {}
+    for i in range(n):
+        achievements = set(rng.choice(bases))
+        for _ in range(rng.randint(0, 3)):
+            achievements.discard(rng.choice(names))
+            achievements.add(rng.choice(names))
+        players[f"player_{i}"] = achievements
+    return players
+
+
+def recall_at_k(
+    approx: list[tuple[str, float]], exact: list[tuple[str, float]]
+) -> float:
+    """
+    Share of the exact top-k reached by the approximate answer. Ties are
+    counted by similarity, so any neighbour as similar as the k-th exact
+    one is a hit.
+    """
+    if not exact:
+        return 1.0
+    floor = exact[-1][1]
+    hits = sum(1 for _, similarity in approx if similarity >= floor)
+    return min(hits, len(exact)) / len(exact)
+
+
+def main() -> None:
+    """Recall versus speed of LSH top-k queries against brute force."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--catalog", type=int, default=200)
+    parser.add_argument("--archetypes", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--num-perm", type=int, default=64)
+    parser.add_argument("--bands", default="8,16,32",
+                        help="comma-separated band counts to compare")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = Random(13)
+    players = make_clustered_players(
+        args.players, args.catalog, args.archetypes, rng
+    )
+    queries = rng.sample(list(players), args.queries)
+
+    print("=== Player Similarity Benchmark ===")
+    print(f"{args.players} players, {args.queries} queries, k={args.k}\n")
+
+    exact = None
+    for bands in map(int, args.bands.split(",")):
+        index = SimilarityIndex(args.num_perm, bands)
+        start = time.perf_counter()
+        index.add_many(players, workers=args.workers)
+        build = time.perf_counter() - start
+
+        if exact is None:
+            brute_times = []
+            exact = {}
+            for name in queries:
+                start = time.perf_counter()
+                exact[name] = index.brute_force(name, args.k)
+                brute_times.append(time.perf_counter() - start)
+            print(f"Brute force: p50 {percentile(brute_times, 50) * 1e3:.2f}"
+                  f" ms/query")
+
+        lsh_times, recalls, pool = [], [], 0
+        for name in queries:
+            start = time.perf_counter()
+            found = index.query(name, args.k)
+            lsh_times.append(time.perf_counter() - start)
+            recalls.append(recall_at_k(found, exact[name]))
+            pool += len(index.candidates(players[name]))
+
+        print(f"LSH bands={bands:<3} rows={index.rows:<3} "
+              f"build {build:.2f} s  "
+              f"p50 {percentile(lsh_times, 50) * 1e3:.2f} ms/query  "
+              f"candidates {pool / len(queries):.0f}  "
+              f"recall@{args.k} {sum(recalls) / len(recalls):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import argparse
+import time
+from bisect import bisect_right
+from random import Random
+
+from bench_harness import add_exercise_paths
+
+add_exercise_paths()
+
+from ft_score_sketches import KLLSketch, ScoreHistogram  # noqa: E402
+
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+def make_scores(n: int, distribution: str, rng: Random) -> list[int]:
+    """Uniform or long-tailed (lognormal) non-negative scores."""
+    if distribution == "uniform":
+        return [rng.randrange(1_000_000) for _ in range(n)]
+    return [int(rng.lognormvariate(8, 1.2)) for _ in range(n)]
+
+
+def rank_errors(ordered: list[int], estimates: list[float]) -> list[float]:
+    """|true rank of each estimate - its target fraction|."""
+    n = len(ordered)
+    return [abs(bisect_right(ordered, estimate) / n - q)
+            for q, estimate in zip(QUANTILES, estimates)]
+
+
+def timed_fill(sketch: object, scores: list[int], batch: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(scores), batch):
+        sketch.update(scores[i:i + batch])
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Accuracy and throughput of score sketches against exact sorting."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--scores", type=int, default=2_000_000)
+    parser.add_argument("--batch", type=int, default=65536)
+    parser.add_argument("-k", type=int, default=200)
+    parser.add_argument("--buckets", type=int, default=1000)
+    args = parser.parse_args()
+
+    print("=== Score Sketch Benchmark ===")
+    print(f"{args.scores} scores, batches of {args.batch}, "
+          f"quantiles {', '.join(f'p{q * 100:g}' for q in QUANTILES)}\n")
+
+    for distribution in ("uniform", "lognormal"):
+        scores = make_scores(args.scores, distribution, Random(22))
+        start = time.perf_counter()
+        ordered = sorted(scores)
+        exact = time.perf_counter() - start
+        rate = len(scores) / exact / 1e6
+        print(f"[{distribution}] sort {exact:.2f} s ({rate:.1f} M/s), "
+              f"{8 * len(scores) / 2**20:.0f} MiB of pointers")
+
+        sketch = KLLSketch(args.k, seed=1)
+        elapsed = timed_fill(sketch, scores, args.batch)
+        errors = rank_errors(ordered, sketch.quantiles(list(QUANTILES)))
+        print(f"  KLL k={args.k:<5} {elapsed:.2f} s "
+              f"({len(scores) / elapsed / 1e6:.1f} M/s)  "
+              f"{len(sketch.to_bytes())} bytes  "
+              f"max rank error {max(errors):.4f}")
+
+        halves = KLLSketch(args.k, seed=2), KLLSketch(args.k, seed=3)
+        middle = len(scores) // 2
+        halves[0].update(scores[:middle])
+        halves[1].update(scores[middle:])
+        merged = KLLSketch.from_bytes(halves[0].to_bytes()).merge(
+            KLLSketch.from_bytes(halves[1].to_bytes())
+        )
+        errors = rank_errors(ordered, merged.quantiles(list(QUANTILES)))
+        print(f"  KLL merged of 2 serialized halves: "
+              f"max rank error {max(errors):.4f}")
+
+        histogram = ScoreHistogram(0, ordered[-1] + 1, args.buckets)
+        elapsed = timed_fill(histogram, scores, args.batch)
+        errors = rank_errors(ordered, [histogram.quantile(q)
+                                       for q in QUANTILES])
+        print(f"  histogram {args.buckets} buckets {elapsed:.2f} s "
+              f"({len(scores) / elapsed / 1e6:.1f} M/s)  "
+              f"{len(histogram.to_bytes())} bytes  "
+              f"max rank error {max(errors):.4f}\n")
+
+
+if __name__ == "__main__":
+    main()
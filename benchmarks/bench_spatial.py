@@ -0,0 +1,122 @@
+import argparse
+import heapq
+import time
+from array import array
+from math import sqrt
+from random import Random
+
+from bench_harness import add_exercise_paths, percentile
+
+add_exercise_paths()
+
+from ft_coordinate_batch import squared_distances_from  # noqa: E402
+from ft_spatial_index import GridIndex, KDTree  # noqa: E402
+
+
+def brute_force(
+    packed: array, ids: list, center: tuple, radius: float, k: int
+) -> tuple[list, list]:
+    """Radius and k-NN answers from one full distance pass."""
+    squared = squared_distances_from(center, packed).tolist()
+    limit = radius * radius
+    inside = sorted((i for i, d2 in enumerate(squared) if d2 <= limit),
+                    key=squared.__getitem__)
+    closest = heapq.nsmallest(k, range(len(squared)),
+                              key=squared.__getitem__)
+    return ([(ids[i], sqrt(squared[i])) for i in inside],
+            [(ids[i], sqrt(squared[i])) for i in closest])
+
+
+def latency(index: object, queries: list, radius: float, k: int) -> str:
+    within, nearest = [], []
+    for center in queries:
+        start = time.perf_counter()
+        index.within(center, radius)
+        within.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        index.nearest(center, k)
+        nearest.append(time.perf_counter() - start)
+    return (f"radius p50 {percentile(within, 50) * 1e3:7.3f} ms "
+            f"p95 {percentile(within, 95) * 1e3:7.3f} ms  "
+            f"{k}-NN p50 {percentile(nearest, 50) * 1e3:7.3f} ms "
+            f"p95 {percentile(nearest, 95) * 1e3:7.3f} ms")
+
+
+def check(
+    index: object, packed: array, ids: list, queries: list, radius: float,
+    k: int
+) -> None:
+    """Compares distances with brute force; ties may list other ids."""
+    for center in queries:
+        within, nearest = brute_force(packed, ids, center, radius, k)
+        if sorted(index.within(center, radius)) != sorted(within):
+            raise SystemExit(f"{type(index).__name__} radius query of "
+                             f"{center} differs from brute force")
+        found = [distance for _, distance in index.nearest(center, k)]
+        if found != [distance for _, distance in nearest]:
+            raise SystemExit(f"{type(index).__name__} {k}-NN of "
+                             f"{center} differs from brute force")
+
+
+def main() -> None:
+    """Query latency of the grid hash and the k-d tree at scale."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--positions", type=int, default=1_000_000)
+    parser.add_argument("--span", type=int, default=100_000,
+                        help="coordinates are drawn from [-span, span]")
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--radius", type=float, default=2000)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--cell-size", type=int, default=2000)
+    parser.add_argument("--check", type=int, default=10,
+                        help="queries cross-checked against brute force")
+    args = parser.parse_args()
+
+    rng = Random(24)
+    span = args.span
+    packed = array("i", (rng.randint(-span, span)
+                         for _ in range(3 * args.positions)))
+    ids = list(range(args.positions))
+    queries = [tuple(rng.randint(-span, span) for _ in range(3))
+               for _ in range(args.queries)]
+    print("=== Spatial Index Benchmark ===")
+    print(f"{args.positions} positions in [-{span}, {span}]^3, "
+          f"{args.queries} queries, radius {args.radius:g}, k {args.k}\n")
+
+    start = time.perf_counter()
+    tree = KDTree(packed)
+    print(f"k-d tree build {time.perf_counter() - start:6.2f} s")
+    start = time.perf_counter()
+    grid = GridIndex(args.cell_size)
+    for i, position in enumerate(zip(packed[0::3], packed[1::3],
+                                     packed[2::3])):
+        grid.insert(i, position)
+    print(f"grid build     {time.perf_counter() - start:6.2f} s "
+          f"({len(grid.cells)} cells)")
+
+    moves = [(rng.randrange(args.positions),
+              tuple(rng.randint(-span, span) for _ in range(3)))
+             for _ in range(args.queries)]
+    start = time.perf_counter()
+    for entity, position in moves:
+        grid.move(entity, position)
+    elapsed = time.perf_counter() - start
+    print(f"grid move      {elapsed / len(moves) * 1e6:6.2f} us each\n")
+    for entity, position in moves:
+        packed[3 * entity:3 * entity + 3] = array("i", position)
+    tree = KDTree(packed)
+
+    start = time.perf_counter()
+    brute_force(packed, ids, queries[0], args.radius, args.k)
+    print(f"brute force    {(time.perf_counter() - start) * 1e3:9.3f} ms "
+          f"per query")
+    print(f"k-d tree       {latency(tree, queries, args.radius, args.k)}")
+    print(f"grid           {latency(grid, queries, args.radius, args.k)}")
+
+    check(tree, packed, ids, queries[:args.check], args.radius, args.k)
+    check(grid, packed, ids, queries[:args.check], args.radius, args.k)
+    print(f"\n{args.check} queries per index match brute force")
+
+
+if __name__ == "__main__":
+    main()
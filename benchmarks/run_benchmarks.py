@@ -0,0 +1,137 @@
+import argparse
+import os
+import sys
+
+from bench_harness import SIZES, compare, load_results, measure, save_results
+
+
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), "baselines")
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Measures every selected case at every selected size.
+
+    Args:
+        args: Parsed command-line options.
+
+    Returns:
+        The process exit status.
+    """
+    from bench_cases import CASES
+
+    results = {}
+    sizes = args.sizes.split(",")
+    for label in sizes:
+        if label not in SIZES:
+            print(f"Unknown size '{label}', expected one of {list(SIZES)}")
+            return 2
+
+    for name, (factory, max_size) in CASES.items():
+        if args.filter and args.filter not in name:
+            continue
+        for label in sizes:
+            key = f"{name}@{label}"
+            n = SIZES[label]
+            if n > max_size:
+                print(f"{key:<40} skipped (max size {max_size})")
+                continue
+            workload = factory(n)
+            stats = measure(
+                workload, args.repeat, args.warmup, not args.no_memory
+            )
+            results[key] = stats
+            print(
+                f"{key:<40} p50 {stats['p50'] * 1e3:>10.3f} ms  "
+                f"p95 {stats['p95'] * 1e3:>10.3f} ms  "
+                f"peak {stats['peak_bytes'] / 2**20:>8.2f} MiB"
+            )
+            del workload
+
+    save_results(args.output, results)
+    print(f"\nResults written to {args.output}")
+    return 0
+
+
+def run_compare(args: argparse.Namespace) -> int:
+    """
+    Compares two result files and flags regressions.
+
+    Args:
+        args: Parsed command-line options.
+
+    Returns:
+        1 when a regression exceeds the threshold, 2 when a file is
+        missing, 0 otherwise.
+    """
+    for role, path in (("Baseline", args.baseline),
+                       ("Current results", args.current)):
+        if not os.path.isfile(path):
+            print(f"{role} file not found: {path}\n"
+                  "Record one with: python3 benchmarks/run_benchmarks.py "
+                  "run --sizes small --output PATH")
+            return 2
+    regressions = compare(
+        load_results(args.baseline), load_results(args.current),
+        args.threshold, args.metric
+    )
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond "
+              f"{args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+def main() -> None:
+    """
+    Command-line entry point.
+
+    Usage: python3 benchmarks/run_benchmarks.py run [options]
+           python3 benchmarks/run_benchmarks.py compare BASELINE [CURRENT]
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="measure the hot paths")
+    run_parser.add_argument(
+        "--sizes", default="small,1e5",
+        help=f"comma-separated subset of {','.join(SIZES)}"
+    )
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument("--filter", help="only cases containing this")
+    run_parser.add_argument(
+        "--output", default=os.path.join(BASELINE_DIR, "current.json")
+    )
+    run_parser.add_argument(
+        "--no-memory", action="store_true", help="skip the tracemalloc run"
+    )
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser(
+        "compare", help="flag regressions against a baseline"
+    )
+    compare_parser.add_argument(
+        "baseline", help="result file recorded by 'run' on this machine"
+    )
+    compare_parser.add_argument(
+        "current", nargs="?", help="defaults to the last 'run' output",
+        default=os.path.join(BASELINE_DIR, "current.json")
+    )
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+    compare_parser.add_argument(
+        "--metric", choices=("p50", "p95", "min", "mean"), default="p50"
+    )
+    compare_parser.set_defaults(handler=run_compare)
+
+    args = parser.parse_args()
+    try:
+        sys.exit(args.handler(args))
+    except (OSError, KeyError, ValueError) as error:
+        print(f"Error: {error}")
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,146 @@
+import sys
+from math import sqrt
+from operator import mul
 from sys import argv
 
+from ft_score_sketches import KLLSketch
+
+
+READ_SIZE = 1 << 20
+ECHO_LIMIT = 20
+
+
+class ScoreStats:
+    """
+    Running count, total, mean, variance, min and max of scores.
+
+    Scores are folded in chunks: each chunk is reduced with C builtins
+    (its integer sum and sum of squares give an exact M2), then merged
+    into the running state with Welford's parallel update. Memory is
+    O(1) whatever the number of scores, apart from the first ECHO_LIMIT
+    scores kept to echo small inputs.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: int | None = None
+        self.max: int | None = None
+        self.head: list[int] = []
+
+    def update(self, scores: list[int]) -> None:
+        """
+        Folds a chunk of scores into the statistics.
+
+        Args:
+            scores: The next scores.
+        """
+        n = len(scores)
+        if not n:
+            return
+        if len(self.head) < ECHO_LIMIT:
+            self.head.extend(scores[:ECHO_LIMIT - len(self.head)])
+        total = sum(scores)
+        squares = sum(map(mul, scores, scores))
+        self.merge(n, total, (n * squares - total * total) / n,
+                   min(scores), max(scores))
+
+    def merge(
+        self, count: int, total: int, m2: float, low: int, high: int
+    ) -> None:
+        """
+        Combines the statistics of another batch of scores.
+
+        Args:
+            count: Number of scores in the batch.
+            total: Their sum.
+            m2: Sum of squared deviations from the batch mean.
+            low: Their minimum.
+            high: Their maximum.
+        """
+        n = self.count + count
+        delta = total / count - self.mean
+        self.m2 += m2 + delta * delta * self.count * count / n
+        self.count = n
+        self.total += total
+        self.mean = self.total / n
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+    @property
+    def variance(self) -> float:
+        """Population variance."""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def echoable(self) -> bool:
+        return self.count <= ECHO_LIMIT
+
+
+def read_scores(stream: object, chunk_size: int = READ_SIZE) -> object:
+    """
+    Parses whitespace-separated integers from a binary stream.
+
+    Args:
+        stream: A binary file object, e.g. sys.stdin.buffer.
+        chunk_size: Bytes read at a time.
+
+    Yields:
+        Lists of scores, one per chunk read.
+    """
+    tail = b""
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        block = tail + block
+        cut = max(block.rfind(b" "), block.rfind(b"\n"),
+                  block.rfind(b"\t"), block.rfind(b"\r"))
+        tail = block[cut + 1:]
+        yield list(map(int, block[:cut + 1].split()))
+    if tail.strip():
+        yield list(map(int, tail.split()))
+
+
+def print_report(
+    stats: ScoreStats, scores: list[int] | None = None,
+    spread: bool = False, sketch: KLLSketch | None = None
+) -> None:
+    """
+    Prints the score analytics.
+
+    Args:
+        stats: The computed statistics.
+        scores: The full score list to echo; None echoes the first scores
+            of small inputs and only the count of large ones.
+        spread: Also print the variance and standard deviation.
+        sketch: Quantile sketch of the scores, to print p50/p90/p99.
+    """
+    if scores is None:
+        scores = stats.head if stats.echoable else None
+    if scores is None:
+        print(f"Scores processed: {stats.count} scores (not echoed)")
+    else:
+        print(f"Scores processed: {scores}")
+    print(f"Total players: {stats.count}")
+    print(f"Total score: {stats.total}")
+    print(f"Average score: {stats.total / stats.count:.1f}")
+    print(f"High score: {stats.max}")
+    print(f"Low score: {stats.min}")
+    lines = []
+    if spread:
+        lines.append(f"Score variance: {stats.variance:.1f}")
+        lines.append(f"Score std dev: {sqrt(stats.variance):.1f}")
+    if sketch is not None and sketch.count:
+        p50, p90, p99 = sketch.quantiles([0.5, 0.9, 0.99])
+        lines.append(f"Percentiles: p50 {p50}, p90 {p90}, p99 {p99}")
+    print(f"Score range: {stats.max - stats.min}")
+    for line in lines:
+        print(line)
+    print()
+
 
 def scores_analysis(scores: list[int]) -> None:
     """
@@ -9,22 +150,53 @@ def scores_analysis(scores: list[int]) -> None:
         scores (list[int]): A list of integer scores to be analyzed.
     """
 
-    n_scores = len(scores)
-    t_scores = sum(scores)
-    max_scores = max(scores)
-    min_scores = min(scores)
-    print(f"Scores processed: {scores}")
-    print(f"Total players: {n_scores}")
-    print(f"Total score: {t_scores}")
-    print(f"Average score: {t_scores / n_scores:.1f}")
-    print(f"High score: {max_scores}")
-    print(f"Low score: {min_scores}")
-    print(f"Score range: {max_scores - min_scores}", end="\n\n")
+    stats = ScoreStats()
+    stats.update(scores)
+    print_report(stats, scores)
+
+
+def stream_analysis(
+    paths: list[str], sketch: KLLSketch | None = None
+) -> ScoreStats:
+    """
+    Computes the score statistics of files, or of stdin, in one pass.
+
+    Args:
+        paths: Files of whitespace-separated scores; empty or "-" reads
+            stdin.
+        sketch: Quantile sketch fed with the same chunks, if given.
+
+    Returns:
+        The statistics of every score read.
+
+    Raises:
+        ValueError: On a token that is not an integer.
+    """
+    stats = ScoreStats()
+    for path in paths or ["-"]:
+        if path == "-":
+            chunks = read_scores(sys.stdin.buffer)
+            stream = None
+        else:
+            stream = open(path, "rb")
+            chunks = read_scores(stream)
+        try:
+            for chunk in chunks:
+                stats.update(chunk)
+                if sketch is not None:
+                    sketch.update(chunk)
+        finally:
+            if stream is not None:
+                stream.close()
+    return stats
 
 
 def main() -> None:
     """
     Entry point of the script that handles command-line input.
+
+    Usage: python3 ft_score_analytics.py <score1> <score2> ...
+           python3 ft_score_analytics.py --stream [FILE | -] ...
     """
 
     args = argv[1:]
@@ -36,12 +208,32 @@ def main() -> None:
               end="\n\n")
         return
 
+    if args[0] == "--stream":
+        try:
+            sketch = KLLSketch()
+            stats = stream_analysis(args[1:], sketch)
+        except ValueError as error:
+            print(f"Pleas enter a valide numbers, {error}")
+            return
+        except OSError as error:
+            print(f"Error reading scores. {error}")
+            return
+        if not stats.count:
+            print("No scores provided.", end="\n\n")
+        elif stats.min < 0:
+            print("Score cannot be negative")
+        else:
+            print_report(stats, spread=True, sketch=sketch)
+        return
+
     try:
         scores = [int(score) for score in (args)]
-        if min(scores) < 0:
+        stats = ScoreStats()
+        stats.update(scores)
+        if stats.min < 0:
             print("Score cannot be negative")
             return
-        scores_analysis(scores)
+        print_report(stats, scores)
     except ValueError as error:
         print(f"Pleas enter a valide numbers, {error}")
     except Exception as error:
@@ -0,0 +1,359 @@
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, repeat
+from operator import add
+from random import Random
+
+
+KLL_MAGIC = b"KLL1"
+KLL_HEADER = struct.Struct("<4sIIQqq")
+HIST_MAGIC = b"HST1"
+HIST_HEADER = struct.Struct("<4sqqIQQ")
+LEVEL_SIZE = struct.Struct("<I")
+
+
+def _int64(values: list[int]) -> bytes:
+    return struct.pack(f"<{len(values)}q", *values)
+
+
+def _from_int64(data: bytes) -> list[int]:
+    return list(struct.unpack(f"<{len(data) // 8}q", data))
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch of integer scores.
+
+    Level h holds items of weight 2^h. When a level outgrows its
+    capacity (k at the top level, shrinking by 2/3 per level below it,
+    at least 2), it is sorted and every other item, starting at a random
+    offset, moves up one level. The bottom levels of capacity 2 act as a
+    sampler: batches skip them by keeping one score drawn independently
+    from each block of 2^h, so large streams do not sort every score.
+    Memory is O(k) items whatever the number of scores, and a quantile's
+    rank error is about 1.7 / k with high probability. Sketches merge
+    level by level, so per-process or per-file sketches combine into the
+    sketch of all their scores.
+    """
+
+    def __init__(self, k: int = 200, seed: int | None = None) -> None:
+        """
+        Args:
+            k: Accuracy parameter; memory grows linearly with it.
+            seed: Seed of the compaction coin flips.
+        """
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.levels: list[list[int]] = [[]]
+        self.count = 0
+        self.min: int | None = None
+        self.max: int | None = None
+        self._rng = Random(seed)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(self.k * (2 / 3) ** depth))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) >= self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append([])
+                items.sort()
+                keep = items[-1:] if len(items) % 2 else []
+                pairs = items[:len(items) - len(keep)]
+                self.levels[level + 1].extend(
+                    pairs[self._rng.randrange(2)::2]
+                )
+                self.levels[level] = keep
+            level += 1
+
+    def update(self, scores: list[int]) -> None:
+        """
+        Adds a batch of scores.
+
+        Args:
+            scores: The scores to add.
+        """
+        if not scores:
+            return
+        low, high = min(scores), max(scores)
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+        self.count += len(scores)
+        sampled = 0
+        while sampled < len(self.levels) - 1 \
+                and self._capacity(sampled) == 2:
+            sampled += 1
+        if sampled:
+            step = 1 << sampled
+            cut = len(scores) - len(scores) % step
+            offsets = map(
+                self._rng.getrandbits, repeat(sampled, cut >> sampled)
+            )
+            self.levels[sampled].extend(map(
+                scores.__getitem__, map(add, range(0, cut, step), offsets)
+            ))
+            scores = scores[cut:]
+        self.levels[0].extend(scores)
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """
+        Adds another sketch's scores to this one.
+
+        Args:
+            other: A sketch of other scores.
+
+        Returns:
+            This sketch.
+        """
+        if not other.count:
+            return self
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for items, extra in zip(self.levels, other.levels):
+            items.extend(extra)
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._compress()
+        return self
+
+    def _weighted(self) -> tuple[list[int], list[int]]:
+        """Retained items in order with their cumulative weights."""
+        pairs = sorted(
+            (item, 1 << level)
+            for level, items in enumerate(self.levels) for item in items
+        )
+        return ([item for item, _ in pairs],
+                list(accumulate(weight for _, weight in pairs)))
+
+    def quantiles(self, fractions: list[float]) -> list[int]:
+        """
+        Args:
+            fractions: Quantile fractions in [0, 1], e.g. [0.5, 0.99].
+
+        Returns:
+            The estimated score at each fraction.
+
+        Raises:
+            ValueError: If the sketch is empty or a fraction is invalid.
+        """
+        if not self.count:
+            raise ValueError("Quantile of an empty sketch")
+        items, ranks = self._weighted()
+        total = ranks[-1]
+        result = []
+        for q in fractions:
+            if not 0 <= q <= 1:
+                raise ValueError(f"Quantile fraction out of [0, 1]: {q}")
+            if q == 0:
+                result.append(self.min)
+            elif q == 1:
+                result.append(self.max)
+            else:
+                i = bisect_left(ranks, q * total)
+                result.append(items[min(i, len(items) - 1)])
+        return result
+
+    def quantile(self, q: float) -> int:
+        """The estimated score at fraction q."""
+        return self.quantiles([q])[0]
+
+    def rank(self, score: int) -> float:
+        """
+        Args:
+            score: A score.
+
+        Returns:
+            The estimated fraction of scores <= it.
+        """
+        if not self.count:
+            return 0.0
+        items, ranks = self._weighted()
+        i = bisect_right(items, score)
+        return ranks[i - 1] / ranks[-1] if i else 0.0
+
+    def retained(self) -> int:
+        """Number of items held in memory."""
+        return sum(map(len, self.levels))
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns:
+            A little-endian serialization: header, then each level as a
+            u32 length and int64 items.
+        """
+        empty = self.min is None
+        parts = [KLL_HEADER.pack(
+            KLL_MAGIC, self.k, len(self.levels), self.count,
+            0 if empty else self.min, 0 if empty else self.max
+        )]
+        for items in self.levels:
+            parts.append(LEVEL_SIZE.pack(len(items)))
+            parts.append(_int64(items))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, seed: int | None = None) -> "KLLSketch":
+        """
+        Args:
+            data: Bytes produced by to_bytes().
+            seed: Seed of future compactions.
+
+        Returns:
+            The sketch.
+
+        Raises:
+            ValueError: If the data is not a KLL sketch.
+        """
+        if len(data) < KLL_HEADER.size:
+            raise ValueError("Truncated KLL sketch")
+        magic, k, levels, count, low, high = KLL_HEADER.unpack_from(data)
+        if magic != KLL_MAGIC:
+            raise ValueError("Not a KLL sketch")
+        sketch = cls(k, seed)
+        sketch.count = count
+        if count:
+            sketch.min, sketch.max = low, high
+        offset = KLL_HEADER.size
+        sketch.levels = []
+        for _ in range(levels):
+            (size,) = LEVEL_SIZE.unpack_from(data, offset)
+            offset += LEVEL_SIZE.size
+            sketch.levels.append(_from_int64(data[offset:offset + 8 * size]))
+            offset += 8 * size
+        if offset != len(data):
+            raise ValueError("Corrupted KLL sketch")
+        return sketch
+
+
+class ScoreHistogram:
+    """
+    Fixed-bucket histogram of integer scores in [low, high).
+
+    The range is split into equal-width buckets, plus an underflow and
+    an overflow count. Batches are counted by sorting them and bisecting
+    the bucket edges, so the per-score work stays in C. Histograms with
+    the same bounds merge by adding their counts.
+    """
+
+    def __init__(self, low: int, high: int, buckets: int = 100) -> None:
+        """
+        Args:
+            low: Inclusive lower bound of the first bucket.
+            high: Exclusive upper bound of the last bucket.
+            buckets: Number of buckets.
+        """
+        if high <= low or buckets <= 0:
+            raise ValueError("Histogram needs low < high and buckets > 0")
+        self.low = low
+        self.high = high
+        self.counts = array("Q", bytes(8 * buckets))
+        self.underflow = 0
+        self.overflow = 0
+        span = high - low
+        self.edges = [low + span * i // buckets for i in range(buckets + 1)]
+
+    def __len__(self) -> int:
+        return sum(self.counts) + self.underflow + self.overflow
+
+    def update(self, scores: list[int]) -> None:
+        """
+        Counts a batch of scores.
+
+        Args:
+            scores: The scores to add.
+        """
+        ordered = sorted(scores)
+        positions = [bisect_left(ordered, edge) for edge in self.edges]
+        self.underflow += positions[0]
+        self.overflow += len(ordered) - positions[-1]
+        counts = self.counts
+        for i in range(len(counts)):
+            counts[i] += positions[i + 1] - positions[i]
+
+    def merge(self, other: "ScoreHistogram") -> "ScoreHistogram":
+        """
+        Adds another histogram's counts to this one.
+
+        Raises:
+            ValueError: If the bucket layouts differ.
+        """
+        if self.edges != other.edges:
+            raise ValueError("Histograms with different buckets")
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        return self
+
+    def buckets(self) -> list[tuple[int, int, int]]:
+        """
+        Returns:
+            (bucket low, bucket high, count) triples.
+        """
+        return [(self.edges[i], self.edges[i + 1], count)
+                for i, count in enumerate(self.counts)]
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates a quantile by interpolating inside its bucket.
+
+        Under- and overflowing scores clamp to the histogram bounds.
+        """
+        total = len(self)
+        if not total:
+            raise ValueError("Quantile of an empty histogram")
+        target = q * total - self.underflow
+        if target <= 0:
+            return float(self.low)
+        for (start, stop, count) in self.buckets():
+            if target <= count:
+                return start + (stop - start) * target / count
+            target -= count
+        return float(self.high)
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns:
+            A little-endian serialization: bounds, bucket count,
+            under/overflow, then u64 counts.
+        """
+        return HIST_HEADER.pack(
+            HIST_MAGIC, self.low, self.high, len(self.counts),
+            self.underflow, self.overflow
+        ) + struct.pack(f"<{len(self.counts)}Q", *self.counts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ScoreHistogram":
+        """
+        Args:
+            data: Bytes produced by to_bytes().
+
+        Returns:
+            The histogram.
+
+        Raises:
+            ValueError: If the data is not a histogram.
+        """
+        if len(data) < HIST_HEADER.size:
+            raise ValueError("Truncated histogram")
+        magic, low, high, buckets, under, over = HIST_HEADER.unpack_from(data)
+        if magic != HIST_MAGIC \
+                or len(data) != HIST_HEADER.size + 8 * buckets:
+            raise ValueError("Not a score histogram")
+        histogram = cls(low, high, buckets)
+        histogram.underflow, histogram.overflow = under, over
+        histogram.counts = array("Q", struct.unpack_from(
+            f"<{buckets}Q", data, HIST_HEADER.size
+        ))
+        return histogram
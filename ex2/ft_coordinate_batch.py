@@ -0,0 +1,255 @@
+from array import array
+from itertools import repeat
+from math import sqrt
+from operator import add, mul, sub
+
+from ft_coordinate_system import calculating_distance
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+EXACT_LIMIT = 1 << 29
+BLOCK_BYTES = 32 << 20
+
+
+def pack_positions(positions: object) -> array:
+    """
+    Packs (x, y, z) tuples into a flat array('i') of xyz triples.
+
+    Args:
+        positions: Iterable of 3D integer coordinates.
+
+    Returns:
+        The packed coordinates.
+    """
+    packed = array("i")
+    for position in positions:
+        if len(position) != 3:
+            raise ValueError(f"Expected (x, y, z), got {position!r}")
+        packed.extend(position)
+    return packed
+
+
+def _columns(positions: object) -> tuple[object, object, object]:
+    """x, y and z columns of packed or tuple positions."""
+    if np is not None and isinstance(positions, np.ndarray):
+        if positions.ndim != 2 or positions.shape[1] != 3:
+            raise ValueError("Expected an N x 3 array of positions")
+        return positions[:, 0], positions[:, 1], positions[:, 2]
+    if not isinstance(positions, array):
+        positions = pack_positions(positions)
+    if len(positions) % 3:
+        raise ValueError("Packed positions must hold xyz triples")
+    return positions[0::3], positions[1::3], positions[2::3]
+
+
+def _numpy_ready(use_numpy: bool, *columns: object) -> bool:
+    """
+    NumPy is used when asked for and installed, and when every |coord|
+    stays under EXACT_LIMIT so int64 squared sums cannot overflow.
+    """
+    if not use_numpy or np is None:
+        return False
+    for column in columns:
+        values = np.asarray(column)
+        if values.size and int(np.abs(values.astype(np.int64)).max()) \
+                >= EXACT_LIMIT:
+            return False
+    return True
+
+
+def _squared_python(
+    origin: tuple[int, int, int], xs: object, ys: object, zs: object
+) -> object:
+    ox, oy, oz = map(int, origin)
+    if np is not None and isinstance(xs, np.ndarray):
+        xs, ys, zs = xs.tolist(), ys.tolist(), zs.tolist()
+    dx = list(map(sub, xs, repeat(ox)))
+    dy = list(map(sub, ys, repeat(oy)))
+    dz = list(map(sub, zs, repeat(oz)))
+    return map(add, map(add, map(mul, dx, dx), map(mul, dy, dy)),
+               map(mul, dz, dz))
+
+
+def _packed_squares(values: object) -> object:
+    """array('q') of squared distances, or a list past the int64 range."""
+    values = list(values)
+    try:
+        return array("q", values)
+    except OverflowError:
+        return values
+
+
+def _squared_numpy(
+    origin: tuple[int, int, int], xs: object, ys: object, zs: object
+) -> object:
+    ox, oy, oz = origin
+    total = (np.asarray(xs, dtype=np.int64) - ox) ** 2
+    total += (np.asarray(ys, dtype=np.int64) - oy) ** 2
+    total += (np.asarray(zs, dtype=np.int64) - oz) ** 2
+    return total
+
+
+def squared_distances_from(
+    origin: tuple[int, int, int], positions: object, use_numpy: bool = True
+) -> object:
+    """
+    Squared distances from one point to many, exact integers.
+
+    Use them when only comparisons matter: they order points like the
+    distances do, without any sqrt.
+
+    Args:
+        origin: The (x, y, z) reference point.
+        positions: Packed array('i') triples, an N x 3 NumPy array or
+            (x, y, z) tuples.
+        use_numpy: Compute with NumPy when it is installed.
+
+    Returns:
+        An int64 NumPy array, or array('q') without NumPy (a list of
+        ints if coordinates are too far apart for int64).
+    """
+    xs, ys, zs = _columns(positions)
+    if _numpy_ready(use_numpy, xs, ys, zs, origin):
+        return _squared_numpy(origin, xs, ys, zs)
+    return _packed_squares(_squared_python(origin, xs, ys, zs))
+
+
+def distances_from(
+    origin: tuple[int, int, int], positions: object, use_numpy: bool = True
+) -> object:
+    """
+    Distances from one point to many.
+
+    Every value equals calculating_distance(origin, position): both take
+    the correctly rounded sqrt of the exact integer squared distance.
+
+    Args:
+        origin: The (x, y, z) reference point.
+        positions: Packed array('i') triples, an N x 3 NumPy array or
+            (x, y, z) tuples.
+        use_numpy: Compute with NumPy when it is installed.
+
+    Returns:
+        A float64 NumPy array, or array('d') without NumPy.
+    """
+    xs, ys, zs = _columns(positions)
+    if _numpy_ready(use_numpy, xs, ys, zs, origin):
+        return np.sqrt(_squared_numpy(origin, xs, ys, zs))
+    return array("d", map(sqrt, _squared_python(origin, xs, ys, zs)))
+
+
+def pairwise_blocks(
+    first: object, second: object, squared: bool = False,
+    block_bytes: int = BLOCK_BYTES, use_numpy: bool = True
+) -> object:
+    """
+    Distances between every point of `first` and every point of `second`,
+    produced in row blocks so memory stays bounded.
+
+    Args:
+        first: N positions, in any format accepted by distances_from().
+        second: M positions, same formats.
+        squared: Yield exact squared distances instead.
+        block_bytes: Approximate memory budget of one block.
+        use_numpy: Compute with NumPy when it is installed.
+
+    Yields:
+        (first row index, block) pairs; a block is a rows x M NumPy array,
+        or a list of rows without NumPy, typed like the results of
+        distances_from() and squared_distances_from().
+    """
+    ax, ay, az = _columns(first)
+    bx, by, bz = _columns(second)
+    fast = _numpy_ready(use_numpy, ax, ay, az, bx, by, bz)
+    if fast:
+        ax, ay, az, bx, by, bz = (
+            np.asarray(column, dtype=np.int64)
+            for column in (ax, ay, az, bx, by, bz)
+        )
+    rows = max(1, block_bytes // (16 * max(1, len(bx))))
+    for start in range(0, len(ax), rows):
+        stop = start + rows
+        if fast:
+            block = (ax[start:stop, None] - bx) ** 2
+            block += (ay[start:stop, None] - by) ** 2
+            block += (az[start:stop, None] - bz) ** 2
+            yield start, block if squared else np.sqrt(block)
+            continue
+        block = []
+        for origin in zip(ax[start:stop], ay[start:stop], az[start:stop]):
+            values = _squared_python(origin, bx, by, bz)
+            block.append(_packed_squares(values) if squared
+                         else array("d", map(sqrt, values)))
+        yield start, block
+
+
+def nearest(
+    first: object, second: object, block_bytes: int = BLOCK_BYTES,
+    use_numpy: bool = True
+) -> tuple[list[int], list[float]]:
+    """
+    For every point of `first`, its nearest point in `second`.
+
+    Compares squared distances block by block and takes a single sqrt
+    per result.
+
+    Args:
+        first: N positions.
+        second: M positions, M > 0.
+        block_bytes: Approximate memory budget of one block.
+        use_numpy: Compute with NumPy when it is installed.
+
+    Returns:
+        (index into second, distance) lists, one entry per first point;
+        ties keep the lowest index.
+    """
+    indices: list[int] = []
+    distances: list[float] = []
+    for _, block in pairwise_blocks(first, second, True, block_bytes,
+                                    use_numpy):
+        if np is not None and isinstance(block, np.ndarray):
+            best = block.argmin(axis=1)
+            indices.extend(best.tolist())
+            distances.extend(np.sqrt(
+                block[np.arange(len(best)), best]
+            ).tolist())
+            continue
+        for row in block:
+            low = min(row)
+            indices.append(row.index(low))
+            distances.append(sqrt(low))
+    return indices, distances
+
+
+def main() -> None:
+    """Checks the batch APIs against calculating_distance."""
+    print("=== Batch Coordinate Distances ===\n")
+
+    try:
+        origin = (0, 0, 0)
+        players = [(10, 20, 5), (3, 4, 0), (-7, 2, 9)]
+        objectives = [(0, 0, 0), (10, 20, 0), (-5, 5, 5)]
+        packed = pack_positions(players)
+        distances = list(map(float, distances_from(origin, packed)))
+        print(f"Distances from {origin}: "
+              f"{[round(d, 1) for d in distances]}")
+        same = all(distance == calculating_distance(origin, player)
+                   for distance, player in zip(distances, players))
+        print(f"Matches calculating_distance: {same}")
+        index, distance = nearest(packed, pack_positions(objectives))
+        for player, i, d in zip(players, index, distance):
+            print(f"Player at {player}: nearest objective "
+                  f"{objectives[i]} ({d:.1f})")
+        print(f"NumPy backend: {np is not None}")
+    except ValueError as error:
+        print(f"Error {error}")
+    except Exception as error:
+        print(f"Unexpected Erro: {error}")
+
+
+if __name__ == "__main__":
+    main()
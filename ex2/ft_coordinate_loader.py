@@ -0,0 +1,275 @@
+import mmap
+import os
+import sys
+import tempfile
+from array import array
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+READ_SIZE = 1 << 20
+PARSE_ERROR = "Error in coordinate parsing:\n"
+EXPECTED_VALUES = "Expected 3 values separated by commas, like: 'x,y,z'."
+INT32_RANGE = (-(1 << 31), (1 << 31) - 1)
+
+if np is not None:
+    DIGIT_VALUES = np.zeros(256, dtype=np.int64)
+    DIGIT_VALUES[48:58] = np.arange(10)
+    POWERS_OF_TEN = 10 ** np.arange(11, dtype=np.int64)
+
+
+def _fields(parts: list) -> tuple[int, int, int]:
+    """Converts the three split parts of a line, or raises ValueError."""
+    if len(parts) != 3:
+        raise ValueError(EXPECTED_VALUES)
+    try:
+        return tuple([int(part) for part in parts])
+    except ValueError as error:
+        raise ValueError(
+            f"Error details - Type: ValueError | Error: {error}"
+        )
+
+
+def parse_position(coordinates: str | bytes) -> tuple[int, int, int]:
+    """
+    Converts one "x,y,z" string into a 3D coordinate tuple.
+
+    Args:
+        coordinates: Three integers separated by commas, as str or bytes.
+
+    Returns:
+        The (x, y, z) tuple.
+
+    Raises:
+        ValueError: If the line does not hold three integers.
+    """
+    separator = "," if isinstance(coordinates, str) else b","
+    try:
+        return _fields(coordinates.split(separator))
+    except ValueError as error:
+        raise ValueError(PARSE_ERROR + str(error))
+
+
+def _numpy_values(block: bytes) -> object:
+    """
+    Parses a block of plain "x,y,z" lines (digits, '-', ',' and '\n'
+    only) with NumPy; None when the block needs the general parser.
+
+    Each field's value is the difference of a running sum of
+    digit * 10**place taken at its two ends, so no Python int is built;
+    place counts the characters left before the field's separator.
+    """
+    if not block.endswith(b"\n"):
+        block += b"\n"
+    data = np.frombuffer(block, dtype=np.uint8)
+    comma, newline, minus = data == 44, data == 10, data == 45
+    digit = (data - 48) < 10
+    ends = np.flatnonzero(comma | newline)
+    kinds = newline[ends]
+    if not (comma | newline | minus | digit).all() \
+            or len(ends) != 3 * int(newline.sum()) \
+            or not kinds[2::3].all() or kinds[0::3].any() \
+            or kinds[1::3].any():
+        return None
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    negative = minus[starts]
+    width = ends - starts - negative
+    if int(minus.sum()) != int(negative.sum()) \
+            or width.min() < 1 or width.max() > 10:
+        return None
+    place = np.repeat(ends, ends - starts + 1) - np.arange(len(data)) - 1
+    terms = DIGIT_VALUES[data] * POWERS_OF_TEN[np.clip(place, 0, 10)]
+    totals = np.concatenate(([0], np.cumsum(terms)))
+    values = totals[ends] - totals[starts]
+    values = np.where(negative, -values, values)
+    low, high = INT32_RANGE
+    if values.min() < low or values.max() > high:
+        return None
+    return values.astype(np.int32)
+
+
+class PositionBatch:
+    """
+    Positions parsed in bulk, as packed int32 x, y and z columns, plus
+    the lines that could not be parsed.
+    """
+
+    def __init__(self) -> None:
+        self.xs = array("i")
+        self.ys = array("i")
+        self.zs = array("i")
+        self.errors: list[tuple[int, str]] = []
+        self.lines = 0
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def positions(self) -> object:
+        """Iterates the parsed (x, y, z) tuples."""
+        return zip(self.xs, self.ys, self.zs)
+
+    def packed(self) -> array:
+        """
+        Returns:
+            The positions as one flat array('i') of xyz triples, the
+            layout taken by ft_coordinate_batch and ft_spatial_index.
+        """
+        packed = array("i", bytes(12 * len(self)))
+        packed[0::3] = self.xs
+        packed[1::3] = self.ys
+        packed[2::3] = self.zs
+        return packed
+
+    def _append(self, position: tuple[int, int, int]) -> None:
+        self.xs.append(position[0])
+        self.ys.append(position[1])
+        self.zs.append(position[2])
+
+    def add_block(self, block: bytes, echo: bool = False) -> None:
+        """
+        Parses a block of complete lines.
+
+        Plain blocks are converted by NumPy when it is installed, and
+        otherwise in one pass of C builtins when every line holds two
+        commas; a block with a bad or blank line is parsed line by line
+        so every bad line gets reported with its number.
+
+        Args:
+            block: Newline-separated "x,y,z" lines.
+            echo: Print every parsed position, like position_parsing().
+        """
+        lines = block.split(b"\n")
+        if lines and not lines[-1]:
+            lines.pop()
+        first = self.lines + 1
+        self.lines += len(lines)
+        values = None
+        if np is not None and lines:
+            values = _numpy_values(block)
+            if values is not None:
+                values = array("i", values.tobytes())
+        if values is None and list(
+            map(bytes.count, lines, repeat(b","))
+        ).count(2) == len(lines):
+            try:
+                values = array("i", map(int, b",".join(lines).split(b",")))
+            except (ValueError, OverflowError):
+                pass
+        if values is not None:
+            self.xs.extend(values[0::3])
+            self.ys.extend(values[1::3])
+            self.zs.extend(values[2::3])
+            if echo:
+                for position in zip(values[0::3], values[1::3],
+                                    values[2::3]):
+                    print(f"Parsed position: {position}")
+            return
+        low, high = INT32_RANGE
+        for number, line in enumerate(lines, first):
+            if not line.strip():
+                continue
+            try:
+                position = _fields(
+                    line.decode("utf-8", "replace").split(",")
+                )
+            except ValueError as error:
+                self.errors.append((number, str(error)))
+                continue
+            if not all(low <= value <= high for value in position):
+                self.errors.append(
+                    (number, f"Coordinate out of int32 range: {position}")
+                )
+                continue
+            self._append(position)
+            if echo:
+                print(f"Parsed position: {position}")
+
+
+def _blocks(stream: object, chunk_size: int, use_mmap: bool) -> object:
+    """Yields chunks of about chunk_size bytes that end on a newline."""
+    size = os.fstat(stream.fileno()).st_size
+    if use_mmap and size:
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = 0
+            while start < size:
+                stop = data.rfind(b"\n", start, start + chunk_size) + 1
+                if stop <= start:
+                    stop = data.find(b"\n", start + chunk_size) + 1 or size
+                yield data[start:stop]
+                start = stop
+        return
+    tail = b""
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        block = tail + block
+        cut = block.rfind(b"\n") + 1
+        tail = block[cut:]
+        if cut:
+            yield block[:cut]
+    if tail:
+        yield tail
+
+
+def load_positions(
+    path: str, echo: bool = False, chunk_size: int = READ_SIZE,
+    use_mmap: bool = True
+) -> PositionBatch:
+    """
+    Parses a file of "x,y,z" lines into packed int32 columns.
+
+    Bad lines do not stop the load: they are skipped and reported in
+    the batch's errors with their 1-based line number. Blank lines are
+    skipped silently.
+
+    Args:
+        path: The coordinate file.
+        echo: Print every parsed position.
+        chunk_size: Bytes parsed at a time.
+        use_mmap: Memory-map the file instead of reading it in chunks.
+
+    Returns:
+        The parsed batch.
+    """
+    batch = PositionBatch()
+    with open(path, "rb") as stream:
+        for block in _blocks(stream, chunk_size, use_mmap):
+            batch.add_block(block, echo)
+    return batch
+
+
+def main() -> None:
+    """
+    Loads a coordinate file and reports its bad lines.
+
+    Usage: python3 ft_coordinate_loader.py [FILE]
+    """
+    print("=== Bulk Coordinate Loader ===\n")
+
+    try:
+        if len(sys.argv) > 1:
+            batch = load_positions(sys.argv[1])
+        else:
+            with tempfile.TemporaryDirectory() as folder:
+                path = os.path.join(folder, "map.txt")
+                with open(path, "w") as stream:
+                    stream.write("10,20,5\n3,4,0\nabc,def,ghi\n\n"
+                                 "-7,2,9\n1,2\n0,0,9999999999\n")
+                batch = load_positions(path, echo=True)
+        print(f"\nLines read: {batch.lines}")
+        print(f"Positions loaded: {len(batch)}")
+        for number, error in batch.errors:
+            print(f"Line {number}: {error}")
+    except OSError as error:
+        print(f"Error reading coordinates. {error}")
+    except Exception as error:
+        print(f"Unexpected Erro: {error}")
+
+
+if __name__ == "__main__":
+    main()
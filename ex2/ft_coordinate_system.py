@@ -1,5 +1,7 @@
 from math import sqrt
 
+from ft_coordinate_loader import parse_position
+
 
 def position_parsing(coordinates: str) -> tuple[int, int, int]:
     """
@@ -11,24 +13,12 @@ def position_parsing(coordinates: str) -> tuple[int, int, int]:
 
     Returns:
         tuple: A tuple of three integers (x, y, z).
-    """
-
-    parts = coordinates.split(",")
-
-    if len(parts) != 3:
-        raise ValueError(
-                "Error in coordinate parsing:\n"
-                "Expected 3 values separated by commas, like: 'x,y,z'."
-            )
 
-    try:
-        position = tuple([int(part) for part in parts])
-    except ValueError as error:
-        raise ValueError(
-                "Error in coordinate parsing:\n"
-                f"Error details - Type: ValueError | Error: {error}"
-            )
+    Files of many positions load much faster with
+    ft_coordinate_loader.load_positions().
+    """
 
+    position = parse_position(coordinates)
     print(f"Parsed position: {position}")
     return position
 
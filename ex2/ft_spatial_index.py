@@ -0,0 +1,410 @@
+import heapq
+from array import array
+from itertools import count
+from math import floor, sqrt
+
+from ft_coordinate_batch import pack_positions
+from ft_coordinate_system import calculating_distance
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+CELL_SIZE = 64
+LEAF_SIZE = 16
+
+Position = tuple[int, int, int]
+
+
+def _squared(a: Position, b: Position) -> int:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+def _results(found: list[tuple[int, int, object]]) -> list:
+    """(squared distance, tiebreak, id) -> (id, distance), nearest first."""
+    found.sort(key=lambda entry: entry[:2])
+    return [(entity, sqrt(d2)) for d2, _, entity in found]
+
+
+class GridIndex:
+    """
+    Uniform grid hash of moving entities.
+
+    Space is cut into cubes of `cell_size`; each occupied cube maps to
+    the entities inside it, so insert, move and remove are O(1) and a
+    query only looks at the cubes its search sphere overlaps. Pick a cell
+    size close to the usual query radius.
+    """
+
+    def __init__(self, cell_size: int = CELL_SIZE) -> None:
+        """
+        Args:
+            cell_size: Edge length of a grid cell.
+        """
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+        self.cell_size = cell_size
+        self.cells: dict[Position, dict[object, Position]] = {}
+        self.positions: dict[object, Position] = {}
+        self.order: dict[object, int] = {}
+        self._ticket = count()
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __contains__(self, entity: object) -> bool:
+        return entity in self.positions
+
+    def _cell(self, position: Position) -> Position:
+        size = self.cell_size
+        x, y, z = position
+        return (x // size, y // size, z // size)
+
+    def insert(self, entity: object, position: Position) -> None:
+        """
+        Args:
+            entity: Hashable entity id.
+            position: Its (x, y, z) position.
+
+        Raises:
+            KeyError: If the entity is already indexed.
+        """
+        if entity in self.positions:
+            raise KeyError(f"Entity {entity!r} is already indexed")
+        position = tuple(position)
+        self.positions[entity] = position
+        self.order[entity] = next(self._ticket)
+        self.cells.setdefault(self._cell(position), {})[entity] = position
+
+    def move(self, entity: object, position: Position) -> None:
+        """
+        Raises:
+            KeyError: If the entity is not indexed.
+        """
+        old = self.positions[entity]
+        position = tuple(position)
+        self.positions[entity] = position
+        cell, new_cell = self._cell(old), self._cell(position)
+        if cell == new_cell:
+            self.cells[cell][entity] = position
+            return
+        self._leave(cell, entity)
+        self.cells.setdefault(new_cell, {})[entity] = position
+
+    def remove(self, entity: object) -> None:
+        """
+        Raises:
+            KeyError: If the entity is not indexed.
+        """
+        position = self.positions.pop(entity)
+        del self.order[entity]
+        self._leave(self._cell(position), entity)
+
+    def _leave(self, cell: Position, entity: object) -> None:
+        members = self.cells[cell]
+        del members[entity]
+        if not members:
+            del self.cells[cell]
+
+    def _cells_between(self, low: Position, high: Position) -> object:
+        """Occupied cells with low <= cell <= high on every axis."""
+        volume = 1
+        for start, stop in zip(low, high):
+            volume *= stop - start + 1
+        if volume > len(self.cells):
+            return [members for cell, members in self.cells.items()
+                    if all(a <= c <= b for a, c, b in zip(low, cell, high))]
+        cells = self.cells
+        return [cells[key] for key in (
+            (x, y, z)
+            for x in range(low[0], high[0] + 1)
+            for y in range(low[1], high[1] + 1)
+            for z in range(low[2], high[2] + 1)
+        ) if key in cells]
+
+    def within(self, center: Position, radius: float) -> list:
+        """
+        Entities whose squared distance to center is <= radius ** 2.
+
+        Args:
+            center: The (x, y, z) query point.
+            radius: Search radius.
+
+        Returns:
+            (entity, distance) pairs, nearest first.
+        """
+        size = self.cell_size
+        low = tuple(floor((c - radius) / size) for c in center)
+        high = tuple(floor((c + radius) / size) for c in center)
+        limit = radius * radius
+        order = self.order
+        found = []
+        for members in self._cells_between(low, high):
+            for entity, position in members.items():
+                d2 = _squared(position, center)
+                if d2 <= limit:
+                    found.append((d2, order[entity], entity))
+        return _results(found)
+
+    def _shell(self, cell: Position, ring: int) -> object:
+        """Occupied cells at Chebyshev distance `ring` from cell."""
+        cx, cy, cz = cell
+        cells = self.cells
+        side = range(-ring, ring + 1)
+        for dx in side:
+            for dy in side:
+                if ring in (abs(dx), abs(dy)):
+                    depths = side
+                else:
+                    depths = (-ring, ring) if ring else (0,)
+                for dz in depths:
+                    members = cells.get((cx + dx, cy + dy, cz + dz))
+                    if members:
+                        yield members
+
+    def nearest(self, center: Position, k: int = 1) -> list:
+        """
+        The k entities closest to center, searching rings of cells
+        outwards until no unvisited cell can hold a closer one.
+
+        Args:
+            center: The (x, y, z) query point.
+            k: Number of neighbours.
+
+        Returns:
+            (entity, distance) pairs, nearest first; equal distances keep
+            insertion order.
+        """
+        if k <= 0 or not self.positions:
+            return []
+        size = self.cell_size
+        cell = tuple(int(c // size) for c in center)
+        order = self.order
+        heap: list[tuple[int, int, object]] = []
+        ring = 0
+        seen = 0
+        while seen < len(self.positions):
+            if (2 * ring + 1) ** 3 > len(self.cells):
+                shells = (members for key, members in self.cells.items()
+                          if max(map(abs, map(int.__sub__, key, cell)))
+                          >= ring)
+            else:
+                shells = self._shell(cell, ring)
+            for members in shells:
+                seen += len(members)
+                for entity, position in members.items():
+                    entry = (-_squared(position, center), -order[entity],
+                             entity)
+                    if len(heap) < k:
+                        heapq.heappush(heap, entry)
+                    elif entry[:2] > heap[0][:2]:
+                        heapq.heapreplace(heap, entry)
+            if len(heap) == k and -heap[0][0] <= (ring * self.cell_size) ** 2:
+                break
+            ring += 1
+        return _results([(-d2, -tie, entity) for d2, tie, entity in heap])
+
+
+class KDTree:
+    """
+    Static k-d tree over 3D points, for fixed positions such as spawn
+    points or map objects.
+
+    The tree is built once by median splits cycling over x, y and z down
+    to leaves of LEAF_SIZE points. Coordinates are stored leaf by leaf in
+    packed int32 columns, so a query touches few, contiguous points.
+    Rebuild the tree to change its points.
+    """
+
+    def __init__(
+        self, positions: object, ids: list | None = None,
+        leaf_size: int = LEAF_SIZE
+    ) -> None:
+        """
+        Args:
+            positions: (x, y, z) tuples or packed array('i') triples.
+            ids: Entity id of each position; defaults to its index.
+            leaf_size: Most points held by one leaf.
+        """
+        if not isinstance(positions, array):
+            positions = pack_positions(positions)
+        if len(positions) % 3:
+            raise ValueError("Packed positions must hold xyz triples")
+        columns = (positions[0::3], positions[1::3], positions[2::3])
+        size = len(columns[0])
+        if ids is not None and len(ids) != size:
+            raise ValueError("Expected one id per position")
+        self.ids = ids
+        self.leaf_size = max(1, leaf_size)
+        self.axes = array("b")
+        self.splits = array("i")
+        self.left = array("i")
+        self.right = array("i")
+        self.order = array("i")
+        if np is not None:
+            self._build(np.arange(size), tuple(map(np.asarray, columns)), 0)
+        else:
+            self._build(list(range(size)), columns, 0)
+        self.columns = tuple(array("i", map(column.__getitem__, self.order))
+                             for column in columns)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def _node(self, axis: int, split: int, left: int, right: int) -> int:
+        self.axes.append(axis)
+        self.splits.append(split)
+        self.left.append(left)
+        self.right.append(right)
+        return len(self.axes) - 1
+
+    def _build(self, points: list[int], columns: tuple, depth: int) -> int:
+        """
+        Appends the subtree of `points` and returns its node number.
+
+        Internal nodes store their axis, split value and children; leaves
+        store axis -1 and their [start, stop) range in self.order. With
+        NumPy, points and columns are arrays and the median is found by
+        argpartition in O(n) instead of a sort.
+        """
+        if len(points) <= self.leaf_size:
+            start = len(self.order)
+            self.order.extend(
+                points if isinstance(points, list) else points.tolist()
+            )
+            return self._node(-1, 0, start, len(self.order))
+        axis = depth % 3
+        column = columns[axis]
+        middle = len(points) // 2
+        if isinstance(points, list):
+            points.sort(key=column.__getitem__)
+        else:
+            points = points[np.argpartition(column[points], middle)]
+        node = self._node(axis, int(column[points[middle]]), 0, 0)
+        self.left[node] = self._build(points[:middle], columns, depth + 1)
+        self.right[node] = self._build(points[middle:], columns, depth + 1)
+        return node
+
+    def _entity(self, slot: int) -> object:
+        point = self.order[slot]
+        return point if self.ids is None else self.ids[point]
+
+    def within(self, center: Position, radius: float) -> list:
+        """
+        Points whose squared distance to center is <= radius ** 2.
+
+        Args:
+            center: The (x, y, z) query point.
+            radius: Search radius.
+
+        Returns:
+            (id, distance) pairs, nearest first.
+        """
+        if not len(self):
+            return []
+        xs, ys, zs = self.columns
+        cx, cy, cz = center
+        limit = radius * radius
+        axes, splits, left, right = self.axes, self.splits, self.left, \
+            self.right
+        found = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            axis = axes[node]
+            if axis < 0:
+                for slot in range(left[node], right[node]):
+                    d2 = (xs[slot] - cx) ** 2 + (ys[slot] - cy) ** 2 \
+                        + (zs[slot] - cz) ** 2
+                    if d2 <= limit:
+                        found.append((d2, self.order[slot], slot))
+                continue
+            offset = center[axis] - splits[node]
+            if offset - radius <= 0:
+                stack.append(left[node])
+            if offset + radius >= 0:
+                stack.append(right[node])
+        return [(self._entity(slot), distance)
+                for slot, distance in _results(found)]
+
+    def nearest(self, center: Position, k: int = 1) -> list:
+        """
+        The k points closest to center.
+
+        Args:
+            center: The (x, y, z) query point.
+            k: Number of neighbours.
+
+        Returns:
+            (id, distance) pairs, nearest first; equal distances keep
+            position order.
+        """
+        if k <= 0 or not len(self):
+            return []
+        xs, ys, zs = self.columns
+        cx, cy, cz = center
+        axes, splits, left, right = self.axes, self.splits, self.left, \
+            self.right
+        order = self.order
+        heap: list[tuple[int, int, int]] = []
+        stack = [(0, 0)]
+        while stack:
+            node, bound = stack.pop()
+            if len(heap) == k and bound > -heap[0][0]:
+                continue
+            axis = axes[node]
+            if axis < 0:
+                for slot in range(left[node], right[node]):
+                    entry = (-((xs[slot] - cx) ** 2 + (ys[slot] - cy) ** 2
+                               + (zs[slot] - cz) ** 2), -order[slot], slot)
+                    if len(heap) < k:
+                        heapq.heappush(heap, entry)
+                    elif entry[:2] > heap[0][:2]:
+                        heapq.heapreplace(heap, entry)
+                continue
+            offset = center[axis] - splits[node]
+            near, far = (left[node], right[node]) if offset < 0 \
+                else (right[node], left[node])
+            stack.append((far, offset * offset))
+            stack.append((near, 0))
+        found = _results([(-d2, -tie, slot) for d2, tie, slot in heap])
+        return [(self._entity(slot), distance) for slot, distance in found]
+
+
+def main() -> None:
+    """Indexes a few players and checks the queries by brute force."""
+    print("=== Spatial Index ===\n")
+
+    try:
+        players = {
+            "Alice": (10, 20, 5), "Bob": (3, 4, 0), "Charlie": (-7, 2, 9),
+            "Diana": (150, -40, 12), "Eve": (0, 0, 300)
+        }
+        grid = GridIndex(cell_size=32)
+        for name, position in players.items():
+            grid.insert(name, position)
+        grid.move("Eve", (5, 5, 5))
+        grid.remove("Diana")
+        origin = (0, 0, 0)
+        close = grid.within(origin, 12)
+        print(f"Within 12 of {origin}: "
+              f"{[(name, round(d, 1)) for name, d in close]}")
+        expected = sorted(
+            (calculating_distance(grid.positions[name], origin), name)
+            for name in grid.positions
+        )
+        print(f"Grid 2-NN: {[name for name, _ in grid.nearest(origin, 2)]} "
+              f"(brute force: {[name for _, name in expected[:2]]})")
+        tree = KDTree(list(players.values()), ids=list(players))
+        print(f"k-d tree 2-NN of (140, -30, 10): "
+              f"{[name for name, _ in tree.nearest((140, -30, 10), 2)]}")
+    except (KeyError, ValueError) as error:
+        print(f"Error {error}")
+    except Exception as error:
+        print(f"Unexpected Erro: {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+from array import array
+from functools import reduce
+from operator import and_, or_
+
+
+WORD_BITS = 64
+
+
+class AchievementRegistry:
+    """
+    Interns achievement names to bit positions.
+
+    Bit i of a player's mask is set when the player holds names[i].
+    """
+
+    def __init__(self, names: object = ()) -> None:
+        """
+        Args:
+            names: Achievement names to intern up front, in bit order.
+        """
+        self.bits: dict[str, int] = {}
+        self.names: list[str] = []
+        for name in names:
+            self.intern(name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def intern(self, name: str) -> int:
+        """
+        Returns the bit position of an achievement, adding it if new.
+
+        Args:
+            name: The achievement name.
+
+        Returns:
+            Its bit position.
+        """
+        bit = self.bits.get(name)
+        if bit is None:
+            bit = len(self.names)
+            self.bits[name] = bit
+            self.names.append(name)
+        return bit
+
+    def encode(self, achievements: object, register: bool = True) -> int:
+        """
+        Converts achievement names to a bitmask.
+
+        Args:
+            achievements: Iterable of achievement names.
+            register: Intern unknown names. When False the registry is
+                left untouched and unknown names are skipped, which is
+                what read-only lookups want.
+
+        Returns:
+            The bitmask holding every given (known) achievement.
+        """
+        mask = 0
+        if not register:
+            bits = self.bits
+            for name in achievements:
+                bit = bits.get(name)
+                if bit is not None:
+                    mask |= 1 << bit
+            return mask
+        for name in achievements:
+            mask |= 1 << self.intern(name)
+        return mask
+
+    def decode(self, mask: int) -> set:
+        """
+        Converts a bitmask back to achievement names.
+
+        Args:
+            mask: A bitmask built by this registry.
+
+        Returns:
+            The set of achievement names whose bits are set.
+        """
+        names = self.names
+        found = set()
+        while mask:
+            low = mask & -mask
+            found.add(names[low.bit_length() - 1])
+            mask ^= low
+        return found
+
+
+class BitsetTracker:
+    """
+    Achievement tracker storing each player as a packed bitmask row.
+
+    Rows live in one array('Q') of `words` 64-bit words per player, so a
+    player costs 8 bytes per 64 achievements instead of a set of strings.
+    Set analytics become bitwise reductions over the rows, and the
+    results match the set-based functions of ft_achievement_tracker.
+    """
+
+    def __init__(self, registry: AchievementRegistry | None = None) -> None:
+        """
+        Args:
+            registry: Name table to share; a new one by default.
+        """
+        if registry is None:
+            registry = AchievementRegistry()
+        self.registry = registry
+        self.players: list[str] = []
+        self.index: dict[str, int] = {}
+        self.words = max(1, -(-len(self.registry) // WORD_BITS))
+        self.rows = array("Q")
+
+    @classmethod
+    def from_sets(cls, players_data: dict[str, set]) -> "BitsetTracker":
+        """
+        Builds a tracker from the {player: set of names} layout.
+
+        Args:
+            players_data: Dictionary with player names and their sets.
+
+        Returns:
+            The populated tracker.
+        """
+        registry = AchievementRegistry(
+            sorted(set().union(*players_data.values()))
+        )
+        tracker = cls(registry)
+        if tracker.words == 1:
+            bits = registry.bits
+            tracker.players = list(players_data)
+            tracker.index = {name: i for i, name in enumerate(players_data)}
+            tracker.rows = array("Q", [
+                sum(1 << bits[name] for name in achievements)
+                for achievements in players_data.values()
+            ])
+            return tracker
+        for name, achievements in players_data.items():
+            tracker.add_player(name, achievements)
+        return tracker
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def _widen(self, words: int) -> None:
+        old, old_words = self.rows, self.words
+        self.rows = array("Q", bytes(8 * words * len(self.players)))
+        for row in range(len(self.players)):
+            start = row * words
+            end = (row + 1) * old_words
+            self.rows[start:start + old_words] = old[end - old_words:end]
+        self.words = words
+
+    def _store(self, row: int, mask: int) -> None:
+        words = self.words
+        if mask.bit_length() > words * WORD_BITS:
+            words = -(-mask.bit_length() // WORD_BITS)
+            self._widen(words)
+        start = row * words
+        self.rows[start:start + words] = array(
+            "Q", mask.to_bytes(8 * words, "little")
+        )
+
+    def mask(self, name: str) -> int:
+        """
+        Args:
+            name: A player name.
+
+        Returns:
+            The player's achievement bitmask.
+        """
+        start = self.index[name] * self.words
+        if self.words == 1:
+            return self.rows[start]
+        return int.from_bytes(
+            self.rows[start:start + self.words].tobytes(), "little"
+        )
+
+    def masks(self) -> object:
+        """
+        Returns:
+            An iterable over every player's bitmask, in insertion order.
+        """
+        if self.words == 1:
+            return self.rows
+        data = memoryview(self.rows).cast("B")
+        width = 8 * self.words
+        return (
+            int.from_bytes(data[i:i + width], "little")
+            for i in range(0, len(data), width)
+        )
+
+    def add_player(self, name: str, achievements: object) -> None:
+        """
+        Adds a player, or replaces the achievements of an existing one.
+
+        Args:
+            name: The player name.
+            achievements: Iterable of achievement names.
+        """
+        mask = self.registry.encode(achievements)
+        row = self.index.get(name)
+        if row is None:
+            row = len(self.players)
+            self.index[name] = row
+            self.players.append(name)
+            if self.words == 1 and mask.bit_length() <= WORD_BITS:
+                self.rows.append(mask)
+                return
+            self.rows.extend([0] * self.words)
+        self._store(row, mask)
+
+    def count(self, name: str) -> int:
+        """
+        Args:
+            name: A player name.
+
+        Returns:
+            How many achievements the player holds (popcount).
+        """
+        return self.mask(name).bit_count()
+
+    def all_unique_mask(self) -> int:
+        """Bitmask of achievements held by at least one player."""
+        return reduce(or_, self.masks(), 0)
+
+    def common_mask(self) -> int:
+        """Bitmask of achievements held by every player."""
+        if not self.players:
+            return 0
+        return reduce(and_, self.masks())
+
+    def rare_mask(self) -> int:
+        """Bitmask of achievements held by exactly one player."""
+        once = twice = 0
+        for mask in self.masks():
+            twice |= once & mask
+            once |= mask
+        return once & ~twice
+
+    def all_unique(self) -> set:
+        """Same result as get_all_unique_achievements."""
+        return self.registry.decode(self.all_unique_mask())
+
+    def common_to_all(self) -> set:
+        """Same result as get_common_to_all."""
+        return self.registry.decode(self.common_mask())
+
+    def rare(self) -> set:
+        """Same result as get_rare_achievements."""
+        return self.registry.decode(self.rare_mask())
+
+    def diff(self, p1_name: str, p2_name: str) -> tuple[set, set, set]:
+        """
+        Compares the achievements of two players.
+
+        Args:
+            p1_name: Name of the first player.
+            p2_name: Name of the second player.
+
+        Returns:
+            (common, unique to p1, unique to p2) achievement sets.
+        """
+        m1, m2 = self.mask(p1_name), self.mask(p2_name)
+        decode = self.registry.decode
+        return decode(m1 & m2), decode(m1 & ~m2), decode(m2 & ~m1)
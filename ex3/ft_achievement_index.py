@@ -0,0 +1,132 @@
+class AchievementIndex:
+    """
+    Incrementally maintained holder counts for every achievement.
+
+    Achievements are also bucketed by how many players hold them, so the
+    rare, common and unique queries read a bucket instead of rescanning
+    every player. Each mutation costs O(achievements it changes).
+    """
+
+    def __init__(self, players_data: dict[str, set] | None = None) -> None:
+        """
+        Args:
+            players_data: Initial {player: set of achievements} mapping.
+        """
+        self.players: dict[str, set] = {}
+        self.holders: dict[str, int] = {}
+        self.by_count: dict[int, set] = {}
+        for name, achievements in (players_data or {}).items():
+            self.add_player(name, achievements)
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def _move(self, achievement: str, delta: int) -> None:
+        old = self.holders.get(achievement, 0)
+        new = old + delta
+        if old:
+            bucket = self.by_count[old]
+            bucket.discard(achievement)
+            if not bucket:
+                del self.by_count[old]
+        if new:
+            self.holders[achievement] = new
+            self.by_count.setdefault(new, set()).add(achievement)
+        else:
+            del self.holders[achievement]
+
+    def add_player(self, name: str, achievements: object = ()) -> None:
+        """
+        Registers a new player.
+
+        Args:
+            name: The player name.
+            achievements: The achievements the player starts with.
+
+        Raises:
+            KeyError: If the player is already registered.
+        """
+        if name in self.players:
+            raise KeyError(f"Player '{name}' already exists")
+        self.players[name] = set()
+        for achievement in achievements:
+            self.grant(name, achievement)
+
+    def remove_player(self, name: str) -> set:
+        """
+        Unregisters a player and releases their achievements.
+
+        Args:
+            name: The player name.
+
+        Returns:
+            The achievements the player held.
+        """
+        achievements = self.players.pop(name)
+        for achievement in achievements:
+            self._move(achievement, -1)
+        return achievements
+
+    def grant(self, name: str, achievement: str) -> bool:
+        """
+        Unlocks an achievement for a player.
+
+        Args:
+            name: The player name.
+            achievement: The achievement unlocked.
+
+        Returns:
+            True if the player did not hold it yet.
+        """
+        held = self.players[name]
+        if achievement in held:
+            return False
+        held.add(achievement)
+        self._move(achievement, 1)
+        return True
+
+    def revoke(self, name: str, achievement: str) -> bool:
+        """
+        Removes an achievement from a player.
+
+        Args:
+            name: The player name.
+            achievement: The achievement removed.
+
+        Returns:
+            True if the player held it.
+        """
+        held = self.players[name]
+        if achievement not in held:
+            return False
+        held.remove(achievement)
+        self._move(achievement, -1)
+        return True
+
+    def held_by_exactly(self, k: int) -> set:
+        """
+        Args:
+            k: A number of players, at least 1.
+
+        Returns:
+            The achievements held by exactly k players.
+        """
+        return set(self.by_count.get(k, ()))
+
+    def rare(self) -> set:
+        """Achievements held by exactly one player."""
+        return self.held_by_exactly(1)
+
+    def common_to_all(self) -> set:
+        """Achievements held by every player (empty with no players)."""
+        if not self.players:
+            return set()
+        return self.held_by_exactly(len(self.players))
+
+    def all_unique(self) -> set:
+        """Every achievement held by at least one player."""
+        return set(self.holders)
+
+    def total_unique(self) -> int:
+        """Number of distinct achievements held, in O(1)."""
+        return len(self.holders)
@@ -0,0 +1,286 @@
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import blake2b
+from random import Random
+
+from ft_achievement_bitset import AchievementRegistry
+
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = MERSENNE_PRIME
+
+
+def jaccard(p1_ach: set, p2_ach: set) -> float:
+    """
+    Exact Jaccard similarity of two achievement sets.
+
+    Args:
+        p1_ach: Achievement set of the first player.
+        p2_ach: Achievement set of the second player.
+
+    Returns:
+        |common| / |union|, 1.0 for two empty sets.
+    """
+    union = len(p1_ach | p2_ach)
+    return len(p1_ach & p2_ach) / union if union else 1.0
+
+
+class MinHasher:
+    """
+    MinHash signatures of achievement sets.
+
+    The permutations are num_perm universal hash functions
+    (a * x + b) mod 2^61-1 seeded from `seed`, and x is a blake2b hash of
+    the achievement name, so signatures are identical in every process.
+    The catalog is small, so each achievement's hash vector is computed
+    once and a signature is an element-wise min of a few vectors.
+    """
+
+    def __init__(self, num_perm: int = 64, seed: int = 42) -> None:
+        """
+        Args:
+            num_perm: Signature length.
+            seed: Seed of the hash function parameters.
+        """
+        if num_perm <= 0:
+            raise ValueError("num_perm must be positive")
+        rng = Random(seed)
+        self.num_perm = num_perm
+        self.seed = seed
+        self.params = [
+            (rng.randrange(1, MERSENNE_PRIME), rng.randrange(MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self._vectors: dict[str, tuple[int, ...]] = {}
+
+    def vector(self, achievement: str, cache: bool = True) -> tuple[int, ...]:
+        """
+        Args:
+            achievement: An achievement name.
+            cache: Keep the vector of a new name for later calls.
+
+        Returns:
+            Its value under every hash function.
+        """
+        vector = self._vectors.get(achievement)
+        if vector is None:
+            x = int.from_bytes(
+                blake2b(achievement.encode("utf-8"), digest_size=8).digest(),
+                "little"
+            )
+            p = MERSENNE_PRIME
+            vector = tuple((a * x + b) % p for a, b in self.params)
+            if cache:
+                self._vectors[achievement] = vector
+        return vector
+
+    def signature(
+        self, achievements: object, cache: bool = True
+    ) -> tuple[int, ...]:
+        """
+        Args:
+            achievements: An achievement set.
+            cache: Keep the vectors of new names for later calls.
+
+        Returns:
+            Its MinHash signature; all MAX_HASH for an empty set.
+        """
+        vectors = [self.vector(name, cache) for name in achievements]
+        if not vectors:
+            return (MAX_HASH,) * self.num_perm
+        if len(vectors) == 1:
+            return vectors[0]
+        return tuple(map(min, *vectors))
+
+
+def _signature_chunk(
+    job: tuple[int, int, list[tuple[str, list]]]
+) -> list[tuple[str, tuple[int, ...]]]:
+    """
+    Worker entry point: signs one chunk of players.
+
+    Args:
+        job: (num_perm, seed, [(player, achievements), ...]).
+
+    Returns:
+        (player, signature) pairs for the chunk.
+    """
+    num_perm, seed, items = job
+    hasher = MinHasher(num_perm, seed)
+    return [(name, hasher.signature(ach)) for name, ach in items]
+
+
+class SimilarityIndex:
+    """
+    Approximate "players most similar to X" search.
+
+    Players are bucketed by banded LSH over MinHash signatures: two
+    players land in a common bucket when one band of their signatures
+    matches, which happens with high probability when their Jaccard
+    similarity is high. Queries gather those candidates and re-rank them
+    by exact Jaccard computed on achievement bitmasks. Queries are
+    read-only: achievements no indexed player holds are counted in the
+    union but never interned, so they do not move any bit position.
+    """
+
+    def __init__(
+        self, num_perm: int = 64, bands: int = 16, seed: int = 42
+    ) -> None:
+        """
+        Args:
+            num_perm: Signature length; must be a multiple of bands.
+            bands: Number of LSH bands. More bands raise recall and
+                candidate counts.
+            seed: Seed of the MinHash functions.
+        """
+        if bands <= 0 or num_perm % bands:
+            raise ValueError("num_perm must be a positive multiple of bands")
+        self.hasher = MinHasher(num_perm, seed)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.registry = AchievementRegistry()
+        self.masks: dict[str, int] = {}
+        self.signatures: dict[str, tuple[int, ...]] = {}
+        self.buckets: list[dict[tuple, set]] = [{} for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def _band_keys(self, signature: tuple[int, ...]) -> object:
+        rows = self.rows
+        return (signature[i:i + rows] for i in range(0, len(signature), rows))
+
+    def _insert(
+        self, name: str, achievements: object, signature: tuple[int, ...]
+    ) -> None:
+        if name in self.masks:
+            self.remove(name)
+        self.masks[name] = self.registry.encode(achievements)
+        self.signatures[name] = signature
+        for bucket, key in zip(self.buckets, self._band_keys(signature)):
+            bucket.setdefault(key, set()).add(name)
+
+    def add(self, name: str, achievements: object) -> None:
+        """
+        Indexes a player, replacing any previous entry.
+
+        Args:
+            name: The player name.
+            achievements: The player's achievement set.
+        """
+        self._insert(name, achievements, self.hasher.signature(achievements))
+
+    def add_many(
+        self, players_data: dict[str, set], workers: int = 1,
+        chunk_size: int = 10000
+    ) -> None:
+        """
+        Bulk-indexes players, signing them across processes if asked.
+
+        Args:
+            players_data: Dictionary with player names and their sets.
+            workers: Number of processes computing signatures.
+            chunk_size: Players per worker task.
+        """
+        if workers <= 1:
+            for name, achievements in players_data.items():
+                self.add(name, achievements)
+            return
+        items = [(name, list(ach)) for name, ach in players_data.items()]
+        jobs = [
+            (self.hasher.num_perm, self.hasher.seed,
+             items[i:i + chunk_size])
+            for i in range(0, len(items), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for signed in pool.map(_signature_chunk, jobs):
+                for name, signature in signed:
+                    self._insert(name, players_data[name], signature)
+
+    def remove(self, name: str) -> None:
+        """
+        Drops a player from the index.
+
+        Args:
+            name: The player name.
+        """
+        del self.masks[name]
+        signature = self.signatures.pop(name)
+        for bucket, key in zip(self.buckets, self._band_keys(signature)):
+            members = bucket[key]
+            members.discard(name)
+            if not members:
+                del bucket[key]
+
+    def _target(self, player: object) -> tuple[str | None, set, int]:
+        """(player name or None, achievement set, its mask)."""
+        if isinstance(player, str):
+            mask = self.masks[player]
+            return player, self.registry.decode(mask), mask
+        achievements = set(player)
+        return None, achievements, self.registry.encode(
+            achievements, register=False
+        )
+
+    def _rank(
+        self, achievements: set, mask: int, candidates: object,
+        exclude: str | None, k: int
+    ) -> list[tuple[str, float]]:
+        unknown = len(achievements) - mask.bit_count()
+
+        def score(name: str) -> tuple[float, str]:
+            other = self.masks[name]
+            union = (mask | other).bit_count() + unknown
+            return ((mask & other).bit_count() / union if union else 1.0,
+                    name)
+
+        scored = (score(name) for name in candidates if name != exclude)
+        best = heapq.nsmallest(k, scored, key=lambda s: (-s[0], s[1]))
+        return [(name, similarity) for similarity, name in best]
+
+    def candidates(self, achievements: object) -> set:
+        """
+        Args:
+            achievements: An achievement set.
+
+        Returns:
+            The players sharing at least one LSH bucket with it.
+        """
+        found: set = set()
+        signature = self.hasher.signature(achievements, cache=False)
+        for bucket, key in zip(self.buckets, self._band_keys(signature)):
+            found.update(bucket.get(key, ()))
+        return found
+
+    def query(self, player: object, k: int = 5) -> list[tuple[str, float]]:
+        """
+        Approximate top-k most similar players.
+
+        Args:
+            player: An indexed player name, or an achievement set.
+            k: Number of neighbours wanted.
+
+        Returns:
+            (player, exact Jaccard) pairs, most similar first; the
+            queried player itself is excluded.
+        """
+        name, achievements, mask = self._target(player)
+        return self._rank(
+            achievements, mask, self.candidates(achievements), name, k
+        )
+
+    def brute_force(
+        self, player: object, k: int = 5
+    ) -> list[tuple[str, float]]:
+        """
+        Exact top-k most similar players, scanning every player.
+
+        Args:
+            player: An indexed player name, or an achievement set.
+            k: Number of neighbours wanted.
+
+        Returns:
+            (player, exact Jaccard) pairs, most similar first.
+        """
+        name, achievements, mask = self._target(player)
+        return self._rank(achievements, mask, self.masks, name, k)
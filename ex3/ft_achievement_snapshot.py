@@ -0,0 +1,268 @@
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+from ft_achievement_bitset import AchievementRegistry, BitsetTracker
+
+
+MAGIC = b"FTACHSN1"
+HEADER = struct.Struct("<8sQQQQQQ")
+
+
+def _pad(size: int) -> bytes:
+    return bytes(-size % 8)
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _name_table(names: list[str]) -> bytes:
+    """u64 offsets (len + 1) followed by the UTF-8 names, 8-byte padded."""
+    encoded = [name.encode("utf-8") for name in names]
+    offsets = array("Q", [0])
+    for name in encoded:
+        offsets.append(offsets[-1] + len(name))
+    table = _little_endian(offsets) + b"".join(encoded)
+    return table + _pad(len(table))
+
+
+def save_snapshot(tracker: BitsetTracker, path: str) -> int:
+    """
+    Writes a tracker to a compact binary snapshot.
+
+    Layout, all little-endian: a header (MAGIC, player count, achievement
+    count, words per row, offsets of the player names, the name order and
+    the rows), the achievement name table, the player name table, the
+    player rows sorted by name as u32 row numbers, then one fixed-width
+    row of `words` u64 bitmask words per player.
+
+    Args:
+        tracker: The tracker to save.
+        path: Output file.
+
+    Returns:
+        The snapshot size in bytes.
+    """
+    players = list(tracker.players)
+    achievements = _name_table(tracker.registry.names)
+    names = _name_table(players)
+    order = _little_endian(array("I", sorted(
+        range(len(players)), key=players.__getitem__
+    )))
+    order += _pad(len(order))
+    names_offset = HEADER.size + len(achievements)
+    order_offset = names_offset + len(names)
+    rows_offset = order_offset + len(order)
+    with open(path, "wb") as stream:
+        stream.write(HEADER.pack(
+            MAGIC, len(players), len(tracker.registry), tracker.words,
+            names_offset, order_offset, rows_offset
+        ))
+        stream.write(achievements)
+        stream.write(names)
+        stream.write(order)
+        stream.write(_little_endian(array("Q", tracker.rows)))
+    return rows_offset + 8 * tracker.words * len(players)
+
+
+class _NameTable:
+    """Read-only sequence over a name table, decoding names on access."""
+
+    def __init__(self, view: memoryview, offset: int, count: int) -> None:
+        self.count = count
+        self.offsets = _words(view, offset, count + 1, "Q")
+        self.view = view
+        self.base = offset + 8 * (count + 1)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> str:
+        if not -self.count <= i < self.count:
+            raise IndexError("name index out of range")
+        i %= self.count
+        start, stop = self.offsets[i], self.offsets[i + 1]
+        return bytes(self.view[self.base + start:self.base + stop]).decode(
+            "utf-8"
+        )
+
+    def __iter__(self) -> object:
+        return map(self.__getitem__, range(self.count))
+
+
+class _SortedIndex:
+    """name -> row lookups by binary search over the stored name order."""
+
+    def __init__(self, names: _NameTable, order: object) -> None:
+        self.names = names
+        self.order = order
+
+    def get(self, name: str, default: object = None) -> object:
+        names, order = self.names, self.order
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            if names[order[middle]] < name:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(order) and names[order[low]] == name:
+            return order[low]
+        return default
+
+    def __getitem__(self, name: str) -> int:
+        row = self.get(name)
+        if row is None:
+            raise KeyError(name)
+        return row
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+
+def _words(view: memoryview, offset: int, count: int, code: str) -> object:
+    """count little-endian integers at offset, zero-copy when possible."""
+    size = array(code).itemsize * count
+    if sys.byteorder == "little":
+        return view[offset:offset + size].cast(code)
+    values = array(code, view[offset:offset + size].tobytes())
+    values.byteswap()
+    return values
+
+
+class AchievementSnapshot(BitsetTracker):
+    """
+    A read-only BitsetTracker served from a memory-mapped snapshot.
+
+    Opening one parses the header and the achievement catalog only: the
+    rows are used in place through the map, player names are decoded on
+    access and name lookups binary-search the stored name order, so
+    startup time does not grow with the number of players. Every
+    analytics method of BitsetTracker works unchanged.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path: A file written by save_snapshot().
+
+        Raises:
+            ValueError: If the file is not a snapshot.
+        """
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"'{path}' is empty")
+        view = memoryview(self._map)
+        if len(view) < HEADER.size:
+            view.release()
+            self.close()
+            raise ValueError(f"'{path}' is not an achievement snapshot")
+        (magic, players, achievements, words, names_offset, order_offset,
+         rows_offset) = HEADER.unpack_from(view)
+        if magic != MAGIC \
+                or rows_offset + 8 * words * players > len(view):
+            view.release()
+            self.close()
+            raise ValueError(f"'{path}' is not an achievement snapshot")
+        catalog = _NameTable(view, HEADER.size, achievements)
+        self.registry = AchievementRegistry(catalog)
+        self.players = _NameTable(view, names_offset, players)
+        order = _words(view, order_offset, players, "I")
+        self.index = _SortedIndex(self.players, order)
+        self.words = words
+        self.rows = _words(view, rows_offset, words * players, "Q")
+        self._views = [view, catalog.offsets, self.players.offsets, order,
+                       self.rows]
+
+    def __enter__(self) -> "AchievementSnapshot":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Releases the memory map; the snapshot is unusable afterwards."""
+        for view in reversed(getattr(self, "_views", ())):
+            if isinstance(view, memoryview):
+                view.release()
+        self._views = []
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def add_player(self, name: str, achievements: object) -> None:
+        raise TypeError("Snapshots are read-only; use to_tracker() first")
+
+    def to_tracker(self) -> BitsetTracker:
+        """
+        Returns:
+            A mutable in-memory copy (decodes every player name).
+        """
+        tracker = BitsetTracker(AchievementRegistry(self.registry.names))
+        tracker.players = list(self.players)
+        tracker.index = {name: i for i, name in enumerate(tracker.players)}
+        tracker.words = self.words
+        tracker.rows = array("Q", self.rows.tobytes())
+        return tracker
+
+
+def load_snapshot(path: str) -> AchievementSnapshot:
+    """
+    Opens a snapshot written by save_snapshot().
+
+    Args:
+        path: The snapshot file.
+
+    Returns:
+        The memory-mapped tracker; close() it when done.
+    """
+    return AchievementSnapshot(path)
+
+
+def main() -> None:
+    """Saves the sample players to a snapshot and reads it back."""
+    players = {
+        'Chaos': {'first_kill', 'level_10', 'treasure_hunter', 'speed_demon'},
+        'Spasha': {'first_kill', 'level_10', 'boss_slayer', 'collector'},
+        'Darius': {
+            'level_10', 'treasure_hunter', 'boss_slayer', 'perfectionist'
+        }
+    }
+
+    print("=== Achievement Snapshot ===\n")
+    try:
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "achievements.snap")
+            size = save_snapshot(BitsetTracker.from_sets(players), path)
+            print(f"Snapshot of {len(players)} players: {size} bytes")
+            with load_snapshot(path) as snapshot:
+                print(f"Spasha holds {snapshot.count('Spasha')} "
+                      f"achievements")
+                print(f"All unique achievements: {snapshot.all_unique()}")
+                print(f"Common to all players: {snapshot.common_to_all()}")
+                print(f"Rare achievements (1 player): {snapshot.rare()}")
+    except (KeyError, ValueError) as e:
+        print(f"Error: Invalid snapshot. {e}")
+    except OSError as e:
+        print(f"Error accessing the snapshot file. {e}")
+    except Exception as e:
+        print(f"Unexpected error with the snapshot. {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+from ft_achievement_index import AchievementIndex
+
+
 def get_all_unique_achievements(
     players_data: dict[str, set]
 ) -> set:
@@ -13,7 +16,7 @@ def get_all_unique_achievements(
     all_ach: set = set()
 
     for achievements in players_data.values():
-        all_ach = all_ach.union(achievements)
+        all_ach.update(achievements)
 
     return all_ach
 
@@ -34,10 +37,10 @@ def get_common_to_all(
         return set()
 
     sets_list = list(players_data.values())
-    common = sets_list[0]
+    common = set(sets_list[0])
 
     for other_set in sets_list[1:]:
-        common = common.intersection(other_set)
+        common.intersection_update(other_set)
 
     return common
 
@@ -48,21 +51,16 @@ def get_rare_achievements(
     """
     Identify achievements held by exactly one player.
 
+    Holder counts are built in one pass through AchievementIndex instead
+    of rebuilding the other players' union for every player.
+
     Args:
         players_data: Dictionary with player names and their sets.
 
     Returns:
         A set of rare achievements.
     """
-    rare: set = set()
-
-    for name, ach in players_data.items():
-        others: set = set().union(
-            *(s for n, s in players_data.items() if n != name)
-        )
-        rare = rare.union(ach.difference(others))
-
-    return rare
+    return AchievementIndex(players_data).rare()
 
 
 def diff_in_two_players(
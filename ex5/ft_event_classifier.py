@@ -0,0 +1,185 @@
+import re
+from array import array
+
+
+DEFAULT_RULES = [("Kill", "Kill"), ("Destroyed", "Destroyed")]
+
+
+class EventClassifier:
+    """
+    Precompiled event classification table.
+
+    Event names are interned into small integer codes and every code is
+    classified once, when it is interned, by the first matching rule. A
+    rule is a keyword (substring match), a compiled regex (search) or an
+    explicit set of event names. Players above high_level are counted as
+    "High-level" whatever their event, exactly like the original elif
+    chain.
+
+    Classifying a batch is then a table lookup per code; for byte-sized
+    codes and levels the whole batch is classified with bytes.translate
+    and big-int masking, without a Python-level loop.
+    """
+
+    def __init__(
+        self, events: object = (), rules: list | None = None,
+        high_level: int = 10
+    ) -> None:
+        """
+        Args:
+            events: Event names to intern up front, in code order.
+            rules: (category, rule) pairs, tried in order; defaults to
+                DEFAULT_RULES.
+            high_level: Levels strictly above it count as "High-level".
+        """
+        self.rules = list(DEFAULT_RULES if rules is None else rules)
+        self.categories = [category for category, _ in self.rules]
+        if len(self.categories) > 255:
+            raise ValueError("at most 255 categories are supported")
+        if "High-level" in self.categories:
+            raise ValueError("'High-level' is a reserved category")
+        self.high_level = high_level
+        self.codes: dict[str, int] = {}
+        self.names: list[str] = []
+        self._table = bytearray()
+        self._byte_table = bytes(256)
+        self._low_mask = bytes(
+            0xFF if level <= high_level else 0 for level in range(256)
+        )
+        for event in events:
+            self.intern(event)
+
+    def _match(self, event: str) -> int:
+        for index, (_, rule) in enumerate(self.rules, 1):
+            if isinstance(rule, str):
+                if rule in event:
+                    return index
+            elif isinstance(rule, re.Pattern):
+                if rule.search(event):
+                    return index
+            elif event in rule:
+                return index
+        return 0
+
+    def intern(self, event: str) -> int:
+        """
+        Returns the code of an event name, classifying it on first sight.
+
+        Args:
+            event: The event name.
+
+        Returns:
+            Its integer code.
+        """
+        code = self.codes.get(event)
+        if code is None:
+            code = len(self.names)
+            self.codes[event] = code
+            self.names.append(event)
+            self._table.append(self._match(event))
+            if code < 256:
+                self._byte_table = bytes(self._table[:256]).ljust(256, b"\0")
+        return code
+
+    def encode(self, events: object) -> array:
+        """
+        Interns a sequence of event names.
+
+        Args:
+            events: Event names.
+
+        Returns:
+            Their codes, as an array('H') or wider.
+        """
+        codes = [self.intern(event) for event in events]
+        return array("H" if len(self.names) <= 65536 else "I", codes)
+
+    def category(self, level: int, event: str) -> str | None:
+        """
+        Classifies a single event.
+
+        Args:
+            level: The player's level.
+            event: The event name.
+
+        Returns:
+            "High-level", a rule category, or None.
+        """
+        if level > self.high_level:
+            return "High-level"
+        index = self._table[self.intern(event)]
+        return self.categories[index - 1] if index else None
+
+    def new_counter(self) -> dict[str, int]:
+        """
+        Returns:
+            A zeroed counter with "High-level" and every rule category.
+        """
+        return dict.fromkeys(["High-level", *self.categories], 0)
+
+    def tally_codes(
+        self, counter: dict[str, int], levels: object, codes: object
+    ) -> None:
+        """
+        Classifies a batch of coded events and adds it to counter.
+
+        Args:
+            counter: Counter updated in place.
+            levels: Player levels of the batch.
+            codes: Event codes of the batch, aligned with levels.
+        """
+        level_bytes = _byte_view(levels)
+        code_bytes = _byte_view(codes)
+        if level_bytes is None or code_bytes is None:
+            self._tally_loop(counter, levels, codes)
+            return
+
+        size = len(code_bytes)
+        low = level_bytes.translate(self._low_mask)
+        counter["High-level"] += size - low.count(0xFF)
+        kept = (
+            int.from_bytes(code_bytes.translate(self._byte_table), "little")
+            & int.from_bytes(low, "little")
+        ).to_bytes(size, "little")
+        for index, category in enumerate(self.categories, 1):
+            counter[category] += kept.count(index)
+
+    def _tally_loop(
+        self, counter: dict[str, int], levels: object, codes: object
+    ) -> None:
+        table = self._table
+        high_level = self.high_level
+        counts = [0] * (len(self.categories) + 1)
+        high = 0
+        for level, code in zip(levels, codes):
+            if level > high_level:
+                high += 1
+            else:
+                counts[table[code]] += 1
+        counter["High-level"] += high
+        for index, category in enumerate(self.categories, 1):
+            counter[category] += counts[index]
+
+    def tally(
+        self, counter: dict[str, int], levels: object, events: object
+    ) -> None:
+        """
+        Classifies a batch of named events and adds it to counter.
+
+        Args:
+            counter: Counter updated in place.
+            levels: Player levels of the batch.
+            events: Event names, aligned with levels.
+        """
+        self.tally_codes(counter, levels, [self.intern(e) for e in events])
+
+
+def _byte_view(values: object) -> bytes | None:
+    """
+    Returns values as one byte per item, or None if they do not fit.
+    """
+    if isinstance(values, (bytes, bytearray)):
+        return bytes(values)
+    if isinstance(values, array) and values.typecode == "B":
+        return values.tobytes()
+    return None
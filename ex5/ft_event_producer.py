@@ -0,0 +1,140 @@
+import asyncio
+import time
+from sys import argv
+
+from ft_data_stream import (
+    LOL_EVENTS, LOL_PLAYERS, lol_event_batches, shard_plan
+)
+from ft_stream_async import END_OF_STREAM
+
+
+def event_chunks(
+    event_num: int, seed: int, chunk_size: int = 1024
+) -> object:
+    """
+    Renders mock game events as "player,level,event,sent_ns" lines.
+
+    Every line of a chunk carries the time.time_ns() stamp taken when the
+    chunk is rendered, so the receiver can measure delivery latency.
+
+    Args:
+        event_num: The number of events to render.
+        seed: LCG seed of this producer's stream.
+        chunk_size: Number of events per chunk.
+
+    Yields:
+        Encoded chunks of newline-terminated events.
+    """
+    done = 0
+    for players, levels, events in lol_event_batches(chunk_size, seed):
+        if done >= event_num:
+            return
+        take = min(chunk_size, event_num - done)
+        sent = time.time_ns()
+        yield "".join([
+            f"{LOL_PLAYERS[p]},{level},{LOL_EVENTS[e]},{sent}\n"
+            for p, level, e in zip(players[:take], levels, events)
+        ]).encode("utf-8")
+        done += take
+
+
+async def send_stream(
+    writer: asyncio.StreamWriter, event_num: int, seed: int
+) -> None:
+    """
+    Sends one producer's events, honouring the receiver's backpressure.
+
+    Args:
+        writer: Connected stream to write to.
+        event_num: The number of events to send.
+        seed: LCG seed of this producer's stream.
+    """
+    try:
+        for chunk in event_chunks(event_num, seed):
+            writer.write(chunk)
+            await writer.drain()
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def send_fifo(path: str, event_num: int, seed: int) -> None:
+    """
+    Writes one producer's events to a named pipe, then END_OF_STREAM.
+
+    Args:
+        path: Filesystem path of the FIFO.
+        event_num: The number of events to send.
+        seed: LCG seed of this producer's stream.
+    """
+    with open(path, "wb", buffering=0) as fifo:
+        for chunk in event_chunks(event_num, seed, chunk_size=32):
+            fifo.write(chunk)
+        fifo.write(END_OF_STREAM + b"\n")
+
+
+async def produce(
+    mode: str, target: str, event_num: int, producers: int
+) -> None:
+    """
+    Runs several concurrent producers against the async stream processor.
+
+    The producers send consecutive, disjoint slices of one LCG stream
+    (see shard_plan), so no producer replays another one's events.
+
+    Args:
+        mode: "tcp", "unix" or "fifo".
+        target: "HOST:PORT" for tcp, a filesystem path otherwise.
+        event_num: The total number of events, split across producers.
+        producers: Number of concurrent producers.
+    """
+    jobs = []
+    for count, seed, _ in shard_plan(event_num, producers):
+        if mode == "fifo":
+            jobs.append(asyncio.to_thread(send_fifo, target, count, seed))
+            continue
+        if mode == "tcp":
+            host, port = target.rsplit(":", 1)
+            _, writer = await asyncio.open_connection(host, int(port))
+        else:
+            _, writer = await asyncio.open_unix_connection(target)
+        jobs.append(send_stream(writer, count, seed))
+    await asyncio.gather(*jobs)
+
+
+def main() -> None:
+    """
+    Stand-in event producer for ft_stream_async.py.
+
+    Usage: python3 ft_event_producer.py <tcp HOST:PORT | unix PATH | fifo PATH>
+           <events> [producers]
+    """
+    args = argv[1:]
+
+    print("=== Game Event Producer ===\n")
+    if len(args) not in (3, 4) or args[0] not in ("tcp", "unix", "fifo"):
+        print("Usage: python3 ft_event_producer.py "
+              "<tcp HOST:PORT | unix PATH | fifo PATH> <events> [producers]")
+        return
+
+    try:
+        event_num = int(args[2])
+        producers = int(args[3]) if len(args) == 4 else 1
+        if event_num < 0 or producers < 1:
+            raise ValueError("events must be >= 0 and producers >= 1")
+        start = time.perf_counter()
+        asyncio.run(produce(args[0], args[1], event_num, producers))
+        elapsed = time.perf_counter() - start
+    except ValueError as error:
+        print(f"Error: {error}")
+    except OSError as error:
+        print(f"Error connecting to the stream processor. {error}")
+    except Exception as error:
+        print(f"Unexpected error producing events. {error}")
+    else:
+        print(f"Sent {event_num} events with {producers} producer(s)")
+        print(f"Send time: ({elapsed:.3f}) seconds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+import asyncio
+import json
+import os
+import time
+from array import array
+from sys import argv
+
+from ft_data_stream import LOL_CLASSIFIER, LOL_EVENTS, print_stream_summary
+from ft_stream_sinks import NullSink, QuietSink, TextSink
+
+
+END_OF_STREAM = b"#end"
+EVENT_CODES = {event: LOL_CLASSIFIER.codes[event] for event in LOL_EVENTS}
+
+
+def parse_event_line(line: bytes) -> tuple[str, int, str, int | None]:
+    """
+    Decodes one newline-delimited event.
+
+    Two wire formats are accepted: "player,level,event[,sent_ns]" and a
+    JSON object as written by JsonLinesSink, with an optional "sent_ns".
+
+    Args:
+        line: The raw line, with or without its trailing newline.
+
+    Returns:
+        (player, level, event, sent_ns); sent_ns is the producer's
+        time.time_ns() stamp, or None when the line has none.
+
+    Raises:
+        ValueError: If the line is not a valid event.
+    """
+    if line.lstrip().startswith(b"{"):
+        try:
+            data = json.loads(line)
+            sent = data.get("sent_ns")
+            return (
+                str(data["player"]), int(data["level"]), str(data["event"]),
+                None if sent is None else int(sent)
+            )
+        except (KeyError, TypeError, AttributeError) as error:
+            raise ValueError(f"Invalid JSON event: {error}")
+
+    parts = line.decode("utf-8").rstrip("\r\n").split(",")
+    if len(parts) not in (3, 4):
+        raise ValueError(
+            "Expected 'player,level,event' or 'player,level,event,sent_ns'."
+        )
+    sent = int(parts[3]) if len(parts) == 4 else None
+    return parts[0], int(parts[1]), parts[2], sent
+
+
+class AsyncStreamProcessor:
+    """
+    Feeds newline-delimited events from async producers into the stream
+    analytics, through a bounded queue.
+
+    Producers read lines, parse them and put batches on the queue; when
+    the queue is full they stop reading, so the OS buffers fill up and
+    the remote writers are slowed down (backpressure). A single consumer
+    classifies each batch with the same classifier as process_lol_events
+    and hands the records to the sink. Only LOL_EVENTS names are
+    accepted, so the classifier's tables cannot be grown from the
+    network.
+    """
+
+    def __init__(
+        self, sink: NullSink | None = None, queue_size: int = 64,
+        batch_size: int = 256
+    ) -> None:
+        """
+        Args:
+            sink: Receives the per-event records; defaults to a TextSink.
+            queue_size: Maximum number of batches waiting in the queue.
+            batch_size: Number of events per queued batch.
+        """
+        if queue_size <= 0 or batch_size <= 0:
+            raise ValueError("queue_size and batch_size must be positive")
+        self.sink = TextSink() if sink is None else sink
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.counter = LOL_CLASSIFIER.new_counter()
+        self.events = 0
+        self.rejected = 0
+        self.latency_samples = 0
+        self.latency_total_ns = 0
+        self.latency_max_ns = 0
+        self.first_batch_at = 0.0
+        self.last_batch_at = 0.0
+        self._queue: asyncio.Queue | None = None
+        self._writers_left = 0
+        self._keeper: int | None = None
+
+    async def produce(self, reader: asyncio.StreamReader) -> None:
+        """
+        Reads one event stream until EOF and queues it in batches.
+
+        Malformed lines and unknown event names are counted in
+        self.rejected and skipped. An END_OF_STREAM line marks the end of
+        one FIFO writer.
+
+        Args:
+            reader: The stream to read newline-delimited events from.
+        """
+        batch = []
+        while line := await reader.readline():
+            if not line.strip():
+                continue
+            if line.rstrip() == END_OF_STREAM:
+                self._writer_done()
+                continue
+            try:
+                event = parse_event_line(line)
+            except ValueError:
+                self.rejected += 1
+                continue
+            if event[2] not in EVENT_CODES:
+                self.rejected += 1
+                continue
+            batch.append(event)
+            if len(batch) >= self.batch_size:
+                await self._queue.put(batch)
+                batch = []
+        if batch:
+            await self._queue.put(batch)
+
+    async def consume(self) -> None:
+        """Processes queued batches until the None sentinel arrives."""
+        while (batch := await self._queue.get()) is not None:
+            self._process(batch)
+
+    def _process(self, batch: list[tuple[str, int, str, int | None]]) -> None:
+        now = time.time_ns()
+        if not self.events:
+            self.first_batch_at = time.perf_counter()
+        first = self.events + 1
+        for _, _, _, sent in batch:
+            if sent is not None:
+                latency = now - sent
+                self.latency_samples += 1
+                self.latency_total_ns += latency
+                if latency > self.latency_max_ns:
+                    self.latency_max_ns = latency
+        LOL_CLASSIFIER.tally_codes(
+            self.counter,
+            [level for _, level, _, _ in batch],
+            array("H", [EVENT_CODES[event] for _, _, event, _ in batch])
+        )
+        self.sink.write([
+            (first + i, player, level, event)
+            for i, (player, level, event, _) in enumerate(batch)
+        ])
+        self.events += len(batch)
+        self.last_batch_at = time.perf_counter()
+
+    async def run(self, producers: list) -> None:
+        """
+        Runs producer coroutines concurrently against one consumer.
+
+        If the consumer fails, the producers are cancelled, since those
+        blocked on the full queue would otherwise wait forever, and the
+        consumer's error is raised.
+
+        Args:
+            producers: Coroutines that put batches on the queue.
+        """
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        consumer = asyncio.create_task(self.consume())
+        producing = asyncio.gather(*producers)
+        try:
+            await asyncio.wait(
+                (producing, consumer), return_when=asyncio.FIRST_COMPLETED
+            )
+            if consumer.done():
+                consumer.result()
+                raise RuntimeError("The consumer stopped before producers")
+            await producing
+            await self._queue.put(None)
+            await consumer
+        finally:
+            producing.cancel()
+            consumer.cancel()
+            await asyncio.gather(producing, consumer, return_exceptions=True)
+            self.sink.flush()
+
+    async def _serve(self, start_server: object, producers: int) -> None:
+        finished = asyncio.Event()
+        closed = 0
+
+        async def handle(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            nonlocal closed
+            try:
+                await self.produce(reader)
+            finally:
+                writer.close()
+                closed += 1
+                if closed >= producers:
+                    finished.set()
+
+        async def wait_for_producers() -> None:
+            server = await start_server(handle)
+            async with server:
+                await finished.wait()
+
+        await self.run([wait_for_producers()])
+
+    async def serve_tcp(self, host: str, port: int, producers: int) -> None:
+        """
+        Accepts producers on a TCP socket until producers of them closed.
+
+        Args:
+            host: Address to listen on.
+            port: Port to listen on.
+            producers: Number of producer connections to serve.
+        """
+        await self._serve(
+            lambda handle: asyncio.start_server(handle, host, port),
+            producers
+        )
+
+    async def serve_unix(self, path: str, producers: int) -> None:
+        """
+        Accepts producers on a Unix socket until producers of them closed.
+
+        Args:
+            path: Filesystem path of the socket.
+            producers: Number of producer connections to serve.
+        """
+        await self._serve(
+            lambda handle: asyncio.start_unix_server(handle, path),
+            producers
+        )
+
+    def _writer_done(self) -> None:
+        """Closes the FIFO keeper once every expected writer has ended."""
+        if self._keeper is None:
+            return
+        self._writers_left -= 1
+        if self._writers_left <= 0:
+            os.close(self._keeper)
+            self._keeper = None
+
+    async def read_fifo(self, path: str, producers: int = 1) -> None:
+        """
+        Reads events from a named pipe until every writer has ended.
+
+        The FIFO is held open by a writer of our own until `producers`
+        END_OF_STREAM lines have arrived, so a producer that closes
+        before the next one opens does not end the stream early. Several
+        writers may share the FIFO as long as each line fits in PIPE_BUF.
+
+        Args:
+            path: Filesystem path of the FIFO.
+            producers: Number of writers that will send END_OF_STREAM.
+        """
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        pipe = os.fdopen(os.open(path, os.O_RDONLY | os.O_NONBLOCK), "rb",
+                         buffering=0)
+        self._keeper = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+        self._writers_left = producers
+        with pipe:
+            transport, _ = await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(reader), pipe
+            )
+            try:
+                await self.run([self.produce(reader)])
+            finally:
+                transport.close()
+                if self._keeper is not None:
+                    os.close(self._keeper)
+                    self._keeper = None
+
+    def print_summary(self) -> None:
+        """
+        Prints the stream analytics plus the async ingestion metrics.
+
+        Time is measured from the first to the last processed batch, so
+        waiting for producers to connect is not counted.
+        """
+        elapsed = self.last_batch_at - self.first_batch_at
+        print_stream_summary(self.events, self.counter, elapsed)
+        print("=== Async Ingestion ===")
+        print(f"Rejected lines: {self.rejected}")
+        if elapsed > 0:
+            print(f"Throughput: {self.events / elapsed:.0f} events/s")
+        if self.latency_samples:
+            mean = self.latency_total_ns / self.latency_samples / 1e6
+            print(f"Mean latency: {mean:.3f} ms")
+            print(f"Max latency: {self.latency_max_ns / 1e6:.3f} ms")
+
+
+def main() -> None:
+    """
+    Runs the async stream processor from the command line.
+
+    Usage: python3 ft_stream_async.py <tcp HOST:PORT | unix PATH | fifo PATH>
+           [producers] [--quiet]
+    """
+    args = [arg for arg in argv[1:] if arg != "--quiet"]
+    quiet = len(args) != len(argv) - 1
+
+    print("=== Async Game Data Stream Processor ===\n")
+    if len(args) not in (2, 3) or args[0] not in ("tcp", "unix", "fifo"):
+        print("Usage: python3 ft_stream_async.py "
+              "<tcp HOST:PORT | unix PATH | fifo PATH> [producers] [--quiet]")
+        return
+
+    try:
+        mode, target = args[0], args[1]
+        producers = int(args[2]) if len(args) == 3 else 1
+        processor = AsyncStreamProcessor(QuietSink() if quiet else None)
+        if mode == "tcp":
+            host, port = target.rsplit(":", 1)
+            job = processor.serve_tcp(host, int(port), producers)
+        elif mode == "unix":
+            job = processor.serve_unix(target, producers)
+        else:
+            job = processor.read_fifo(target, producers)
+        asyncio.run(job)
+        processor.print_summary()
+    except ValueError as error:
+        print(f"Error: {error}")
+    except OSError as error:
+        print(f"Error opening the event source. {error}")
+    except Exception as error:
+        print(f"Unexpected error processing events. {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import json
+import sys
+from abc import ABC, abstractmethod
+
+
+class NullSink:
+    """
+    Output sink that discards every event record.
+
+    Every other sink derives from it; use it directly to benchmark the
+    event loop without any output cost.
+    """
+
+    def write(self, records: list[tuple[int, str, int, str]]) -> None:
+        """
+        Receives one chunk of event records.
+
+        Args:
+            records: (index, player, level, event) tuples, in stream order.
+        """
+
+    def flush(self) -> None:
+        """Pushes any buffered output to the underlying stream."""
+
+    def close(self) -> None:
+        """Flushes and releases the sink."""
+        self.flush()
+
+
+class QuietSink(NullSink):
+    """
+    Summary-only sink: events are counted but never written.
+    """
+
+    def __init__(self) -> None:
+        self.records_seen = 0
+
+    def write(self, records: list[tuple[int, str, int, str]]) -> None:
+        """
+        Counts one chunk of event records.
+
+        Args:
+            records: (index, player, level, event) tuples, in stream order.
+        """
+        self.records_seen += len(records)
+
+
+class _BufferedSink(NullSink, ABC):
+    """
+    Shared block buffering for sinks that emit one text line per event.
+    """
+
+    def __init__(
+        self, stream: object = None, buffer_size: int = 1 << 16
+    ) -> None:
+        """
+        Args:
+            stream: Text stream to write to; defaults to sys.stdout.
+            buffer_size: Number of characters gathered before each write.
+        """
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be positive")
+        self.stream = sys.stdout if stream is None else stream
+        self.buffer_size = buffer_size
+        self._lines: list[str] = []
+        self._pending = 0
+
+    @abstractmethod
+    def _format(self, records: list[tuple[int, str, int, str]]) -> list[str]:
+        """
+        Renders one chunk of records as output lines.
+
+        Args:
+            records: (index, player, level, event) tuples, in stream order.
+
+        Returns:
+            One newline-terminated line per record.
+        """
+
+    def write(self, records: list[tuple[int, str, int, str]]) -> None:
+        """
+        Formats one chunk of records and buffers it.
+
+        Args:
+            records: (index, player, level, event) tuples, in stream order.
+        """
+        lines = self._format(records)
+        self._lines.extend(lines)
+        self._pending += sum(map(len, lines))
+        if self._pending >= self.buffer_size:
+            self._drain()
+
+    def _drain(self) -> None:
+        if self._lines:
+            self.stream.write("".join(self._lines))
+            self._lines.clear()
+            self._pending = 0
+
+    def flush(self) -> None:
+        """Writes the buffered lines and flushes the stream."""
+        self._drain()
+        self.stream.flush()
+
+
+class TextSink(_BufferedSink):
+    """
+    Block-buffered writer for the human readable "Event N: ..." lines.
+    """
+
+    def _format(self, records: list[tuple[int, str, int, str]]) -> list[str]:
+        return [
+            f"Event {i}: Player {player} (level {level}) {event}\n"
+            for i, player, level, event in records
+        ]
+
+
+class JsonLinesSink(_BufferedSink):
+    """
+    Block-buffered writer emitting one JSON object per event.
+    """
+
+    def __init__(
+        self, target: object = None, buffer_size: int = 1 << 16
+    ) -> None:
+        """
+        Args:
+            target: Text stream or file path; defaults to sys.stdout.
+            buffer_size: Number of characters gathered before each write.
+        """
+        self._owned = isinstance(target, str)
+        if self._owned:
+            target = open(target, "w", encoding="utf-8")
+        super().__init__(target, buffer_size)
+
+    def _format(self, records: list[tuple[int, str, int, str]]) -> list[str]:
+        dumps = json.dumps
+        return [
+            dumps({
+                "index": i, "player": player, "level": level, "event": event
+            }) + "\n"
+            for i, player, level, event in records
+        ]
+
+    def close(self) -> None:
+        """Flushes the sink and closes the file it opened, if any."""
+        self.flush()
+        if self._owned:
+            self.stream.close()
@@ -0,0 +1,146 @@
+import json
+import time
+import tracemalloc
+
+
+STAGES = ("generate", "classify", "emit")
+
+
+class StreamStats:
+    """
+    Opt-in instrumentation for the event stream processor.
+
+    The processor reports every chunk it handles: per-stage durations from
+    time.perf_counter_ns and the number of events in the chunk. An event
+    waits for its whole chunk, so its latency is the chunk's generate to
+    emit time; latencies go into a log2-bucketed histogram.
+    """
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        """
+        Args:
+            trace_memory: Record tracemalloc current/peak memory. Tracing
+                slows allocation down, so it is off by default.
+        """
+        self.trace_memory = trace_memory
+        self.events = 0
+        self.chunks = 0
+        self.stage_ns = dict.fromkeys(STAGES, 0)
+        self.histogram = [0] * 64
+        self.wall_ns = 0
+        self.memory_current = 0
+        self.memory_peak = 0
+        self._started_at = 0
+        self._owns_tracing = False
+
+    def start(self) -> None:
+        """Starts the wall clock and, if requested, memory tracing."""
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        self._started_at = time.perf_counter_ns()
+
+    def stop(self) -> None:
+        """Stops the wall clock and takes the final memory snapshot."""
+        self.wall_ns += time.perf_counter_ns() - self._started_at
+        if self.trace_memory:
+            self.memory_current, self.memory_peak = (
+                tracemalloc.get_traced_memory()
+            )
+            if self._owns_tracing:
+                tracemalloc.stop()
+                self._owns_tracing = False
+
+    def add_chunk(
+        self, events: int, generate_ns: int, classify_ns: int, emit_ns: int
+    ) -> None:
+        """
+        Records one processed chunk.
+
+        Args:
+            events: Number of events in the chunk.
+            generate_ns: Time spent generating the chunk.
+            classify_ns: Time spent classifying it.
+            emit_ns: Time spent handing it to the sink.
+        """
+        self.events += events
+        self.chunks += 1
+        self.stage_ns["generate"] += generate_ns
+        self.stage_ns["classify"] += classify_ns
+        self.stage_ns["emit"] += emit_ns
+        latency = generate_ns + classify_ns + emit_ns
+        self.histogram[min(latency.bit_length(), 63)] += events
+
+    @property
+    def events_per_second(self) -> float:
+        """Throughput over the wall-clock time."""
+        return self.events * 1e9 / self.wall_ns if self.wall_ns else 0.0
+
+    def latency_percentile(self, pct: float) -> int:
+        """
+        Upper bound of the histogram bucket holding the pct-th latency.
+
+        Args:
+            pct: Percentile between 0 and 100.
+
+        Returns:
+            The latency bound in nanoseconds, 0 without data.
+        """
+        target = self.events * pct / 100
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= target:
+                return 1 << bucket
+        return 0
+
+    def to_dict(self) -> dict:
+        """
+        Returns:
+            Every metric as JSON-serializable data.
+        """
+        return {
+            "events": self.events,
+            "chunks": self.chunks,
+            "wall_ns": self.wall_ns,
+            "events_per_second": self.events_per_second,
+            "stage_ns": dict(self.stage_ns),
+            "latency_ns": {
+                "p50": self.latency_percentile(50),
+                "p95": self.latency_percentile(95),
+                "p99": self.latency_percentile(99),
+                "histogram": {
+                    f"<{1 << bucket}": count
+                    for bucket, count in enumerate(self.histogram) if count
+                }
+            },
+            "memory_bytes": {
+                "traced": self.trace_memory,
+                "current": self.memory_current,
+                "peak": self.memory_peak
+            }
+        }
+
+    def dump_json(self, path: str) -> None:
+        """
+        Writes the metrics to a JSON file.
+
+        Args:
+            path: Destination file.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+            file.write("\n")
+
+    def print_report(self) -> None:
+        """Prints the per-stage, latency and throughput figures."""
+        print("=== Stream Instrumentation ===")
+        for stage in STAGES:
+            print(f"{stage.capitalize()} stage: "
+                  f"({self.stage_ns[stage] / 1e9:.3f}) seconds")
+        print(f"Chunk latency p50/p95/p99: <{self.latency_percentile(50)}"
+              f" / <{self.latency_percentile(95)}"
+              f" / <{self.latency_percentile(99)} ns")
+        print(f"Throughput: {self.events_per_second:.0f} events/s")
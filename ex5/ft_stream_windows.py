@@ -0,0 +1,235 @@
+import heapq
+import time
+from collections import deque
+from itertools import islice
+from operator import itemgetter
+
+from ft_data_stream import lol_event_generator
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitter sketch with k counters.
+
+    Every item seen more than n / k times out of n is guaranteed to be
+    tracked, and each reported count overestimates the true count by at
+    most the recorded error. Memory is O(k) whatever the stream length.
+    """
+
+    def __init__(self, k: int) -> None:
+        """
+        Args:
+            k: Number of counters kept.
+        """
+        if k <= 0:
+            raise ValueError("k must be positive")
+        self.k = k
+        self.counts: dict[object, int] = {}
+        self.errors: dict[object, int] = {}
+
+    def add(self, item: object, count: int = 1) -> None:
+        """
+        Counts occurrences of an item.
+
+        Args:
+            item: The item seen.
+            count: How many times it was seen.
+        """
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.k:
+            self.counts[item] = count
+            self.errors[item] = 0
+        else:
+            victim = min(self.counts, key=self.counts.__getitem__)
+            floor = self.counts.pop(victim)
+            del self.errors[victim]
+            self.counts[item] = floor + count
+            self.errors[item] = floor
+
+    def top(self, n: int) -> list[tuple[object, int, int]]:
+        """
+        Returns the n heaviest tracked items.
+
+        Args:
+            n: Number of items wanted.
+
+        Returns:
+            (item, estimated count, maximum overestimate) tuples.
+        """
+        return [
+            (item, count, self.errors[item])
+            for item, count in heapq.nlargest(
+                n, self.counts.items(), key=itemgetter(1)
+            )
+        ]
+
+
+class WindowedAnalytics:
+    """
+    Tumbling and sliding window analytics over the event stream.
+
+    Windows are measured either in events (by="count") or in seconds
+    (by="time"). A report is produced every `step` units over the last
+    `size` units; step == size gives tumbling windows. Only the events of
+    the current window are kept, with per-player and per-event counts
+    maintained incrementally, plus a Space-Saving sketch of the lifetime
+    top players, so memory is O(window + k) on an endless stream.
+    """
+
+    def __init__(
+        self, size: float, step: float | None = None, by: str = "count",
+        top_k: int = 3, clock: object = time.monotonic
+    ) -> None:
+        """
+        Args:
+            size: Window length, in events or seconds.
+            step: Distance between reports; defaults to size (tumbling).
+            by: "count" or "time".
+            top_k: Number of top players per report.
+            clock: Time source for events added without a timestamp.
+        """
+        if by not in ("count", "time"):
+            raise ValueError(f"Unknown window kind: '{by}'")
+        step = size if step is None else step
+        if size <= 0 or step <= 0:
+            raise ValueError("size and step must be positive")
+        if by == "count" and (size != int(size) or step != int(step)):
+            raise ValueError("count windows need integer size and step")
+        self.size = size
+        self.step = step
+        self.by = by
+        self.top_k = top_k
+        self.clock = clock
+        self.window: deque = deque()
+        self.players: dict[str, int] = {}
+        self.event_types: dict[str, int] = {}
+        self.high_level = 0
+        self.seen = 0
+        self.lifetime = SpaceSaving(max(4 * top_k, 16))
+        self._next_report: float | None = None
+
+    def _evict(self) -> None:
+        _, player, level, event = self.window.popleft()
+        _decrement(self.players, player)
+        _decrement(self.event_types, event)
+        if level > 10:
+            self.high_level -= 1
+
+    def _report(self, end: float) -> dict:
+        events = len(self.window)
+        return {
+            "window_end": end,
+            "events": events,
+            "players": dict(self.players),
+            "event_types": dict(self.event_types),
+            "top_players": heapq.nlargest(
+                self.top_k, self.players.items(), key=itemgetter(1)
+            ),
+            "lifetime_top_players": self.lifetime.top(self.top_k),
+            "high_level_ratio": self.high_level / events if events else 0.0
+        }
+
+    def add(
+        self, player: str, level: int, event: str, ts: float | None = None
+    ) -> list[dict]:
+        """
+        Adds one event and returns the window reports it completes.
+
+        Args:
+            player: Player name.
+            level: Player level.
+            event: Event name.
+            ts: Event time in seconds, for time windows; defaults to the
+                clock. Timestamps must not go backwards.
+
+        Returns:
+            The reports closed by this event, oldest first (usually none).
+        """
+        reports = []
+        if self.by == "time":
+            ts = self.clock() if ts is None else ts
+            if self._next_report is None:
+                self._next_report = ts + self.step
+            while ts >= self._next_report:
+                start = self._next_report - self.size
+                while self.window and self.window[0][0] < start:
+                    self._evict()
+                reports.append(self._report(self._next_report))
+                self._next_report += self.step
+        elif len(self.window) == self.size:
+            self._evict()
+
+        self.seen += 1
+        self.window.append((ts, player, level, event))
+        self.players[player] = self.players.get(player, 0) + 1
+        self.event_types[event] = self.event_types.get(event, 0) + 1
+        if level > 10:
+            self.high_level += 1
+        self.lifetime.add(player)
+
+        if self.by == "count" and self.seen % self.step == 0:
+            reports.append(self._report(self.seen))
+        return reports
+
+    def consume(self, events: object) -> object:
+        """
+        Runs the analytics over an event stream, possibly endless.
+
+        Args:
+            events: Iterable of (player, level, event) tuples, or
+                (player, level, event, ts) tuples for time windows.
+
+        Yields:
+            Window reports, as soon as each window closes.
+        """
+        for item in events:
+            yield from self.add(*item)
+
+
+def _decrement(counts: dict[str, int], key: str) -> None:
+    """Lowers a count, dropping the key at zero to keep memory bounded."""
+    if counts[key] == 1:
+        del counts[key]
+    else:
+        counts[key] -= 1
+
+
+def print_window_report(report: dict) -> None:
+    """
+    Prints one window report.
+
+    Args:
+        report: A report returned by WindowedAnalytics.
+    """
+    top = ", ".join(f"{name} ({count})" for name, count in
+                    report["top_players"])
+    busiest = max(report["event_types"].items(), key=itemgetter(1),
+                  default=("-", 0))
+    print(f"Window ending at {report['window_end']}: "
+          f"{report['events']} events")
+    print(f"  Top players: {top}")
+    print(f"  Most frequent event: {busiest[0]} ({busiest[1]})")
+    print(f"  High-level ratio: {report['high_level_ratio']:.1%}")
+
+
+def main() -> None:
+    """Shows tumbling and sliding count windows over the mock stream."""
+    print("=== Windowed Stream Analytics ===\n")
+
+    try:
+        print("Tumbling windows of 1000 events:")
+        tumbling = WindowedAnalytics(1000)
+        for report in islice(tumbling.consume(lol_event_generator()), 3):
+            print_window_report(report)
+
+        print("\nSliding windows of 1000 events, every 250 events:")
+        sliding = WindowedAnalytics(1000, 250)
+        for report in islice(sliding.consume(lol_event_generator()), 6):
+            print_window_report(report)
+    except Exception as e:
+        print(f"Unexpected error in windowed analytics. {e}")
+
+
+if __name__ == "__main__":
+    main()
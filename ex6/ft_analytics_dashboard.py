@@ -1,135 +1,167 @@
-def comprehension() -> None:
-    """
-    Provides a dashboard for game analytics
-    using various comprehension techniques.
+from ft_dashboard_query import dashboard_query
+
+
+PLAYERS = {
+    'alice': {
+        'level': 15,
+        'score': 2824,
+        'sessions_played': 13,
+        'region': 'north',
+        'achievements': {
+            'first_blood', 'level_master', 'treasure_seeker',
+            'pixel_perfect', 'combo_king', 'explorer'
+        }
+    },
+    'bob': {
+        'level': 23,
+        'score': 4657,
+        'sessions_played': 27,
+        'region': 'north',
+        'achievements': {'first_blood', 'treasure_seeker', 'pixel_perfect'}
+        },
+    'charlie': {
+        'level': 44,
+        'score': 9935,
+        'sessions_played': 21,
+        'region': 'north',
+        'achievements': {
+            'first_blood', 'level_master', 'speed_runner',
+            'treasure_seeker', 'boss_hunter', 'pixel_perfect',
+            'combo_king', 'explorer'
+        }
+    },
+    'diana': {
+        'level': 3,
+        'score': 1488,
+        'sessions_played': 21,
+        'region': 'central',
+        'achievements': {'explorer', 'first_blood'}
+    },
+    'eve': {
+        'level': 3,
+        'score': 1434,
+        'sessions_played': 81,
+        'region': 'central',
+        'achievements': {'first_blood', 'treasure_seeker'}
+    },
+    'frank': {
+        'level': 40,
+        'score': 8359,
+        'sessions_played': 85,
+        'region': 'east',
+        'achievements': {
+            'first_blood', 'level_master', 'explorer', 'treasure_seeker',
+            'pixel_perfect', 'combo_king'
+        }
+    }
+}
+
+DASHBOARD_QUERY = dashboard_query()
 
-    This function processes player data (level, score, sessions, achievements)
-    using List, Dict, and Set comprehensions to demonstrate efficient data
-    filtering and transformation in Python.
+
+def print_dashboard(metrics: dict[str, object]) -> None:
+    """
+    Prints the dashboard sections from precomputed metrics.
 
     Args:
-        None.
+        metrics: The values computed by the dashboard query.
+    """
+    print("=== List Comprehension Examples ===\n")
 
-    Returns:
-        None.
+    print("High scorers (+2000):", metrics['high_score'])
+    print("Scores doubled:", metrics['double_score'])
+    print("Active players:", metrics['active_players'], end="\n\n")
+
+    print("=== Dict Comprehension Examples ===")
+
+    level_categories = {
+        "high": metrics['level_high'],
+        "medium": metrics['level_medium'],
+        "low": metrics['level_low']
+    }
+    print(f"Player scores: {metrics['player_scores']}")
+    print(f"Score categories: {level_categories}")
+    print(f"Achievement counts: {metrics['achievement_counts']}", end="\n\n")
+
+    print("=== Set Comprehension Examples ===")
+
+    print("Unique players:", metrics['unique_players'])
+    print("Unique achievements:", metrics['unique_ach'])
+    print("Active region:", metrics['regions'])
+
+
+def dashboard_metrics(players: dict[str, dict]) -> dict[str, object]:
     """
+    Computes every dashboard metric of in-memory players.
 
-    print("=== Game Analytics Dashboard ===\n")
+    Each metric is one comprehension over the player dict. They give the
+    same values as DASHBOARD_QUERY, which serves the streaming loader and
+    the materialized views, but they are the fastest path when all the
+    players are already in memory.
 
-    players = {
-        'alice': {
-            'level': 15,
-            'score': 2824,
-            'sessions_played': 13,
-            'region': 'north',
-            'achievements': {
-                'first_blood', 'level_master', 'treasure_seeker',
-                'pixel_perfect', 'combo_king', 'explorer'
-            }
-        },
-        'bob': {
-            'level': 23,
-            'score': 4657,
-            'sessions_played': 27,
-            'region': 'north',
-            'achievements': {'first_blood', 'treasure_seeker', 'pixel_perfect'}
-            },
-        'charlie': {
-            'level': 44,
-            'score': 9935,
-            'sessions_played': 21,
-            'region': 'north',
-            'achievements': {
-                'first_blood', 'level_master', 'speed_runner',
-                'treasure_seeker', 'boss_hunter', 'pixel_perfect',
-                'combo_king', 'explorer'
-            }
+    Args:
+        players: Player records keyed by name.
+
+    Returns:
+        The metric values keyed by name.
+    """
+    records = players.values()
+    return {
+        "high_score": [p['score'] for p in records if p['score'] > 2000],
+        "double_score": [p['score'] * 2 for p in records],
+        "active_players": [
+            name for name, data in players.items()
+            if data['sessions_played'] > 40
+        ],
+        "player_scores": {
+            name: data['score'] for name, data in players.items()
         },
-        'diana': {
-            'level': 3,
-            'score': 1488,
-            'sessions_played': 21,
-            'region': 'central',
-            'achievements': {'explorer', 'first_blood'}
+        "level_high": len([p for p in records if p['level'] >= 30]),
+        "level_medium": len([p for p in records if 20 <= p['level'] < 30]),
+        "level_low": len([p for p in records if p['level'] < 20]),
+        "achievement_counts": {
+            name: len(data['achievements'])
+            for name, data in players.items()
         },
-        'eve': {
-            'level': 3,
-            'score': 1434,
-            'sessions_played': 81,
-            'region': 'central',
-            'achievements': {'first_blood', 'treasure_seeker'}
+        "unique_players": {name for name in players},
+        "unique_ach": {
+            ach for data in records for ach in data['achievements']
         },
-        'frank': {
-            'level': 40,
-            'score': 8359,
-            'sessions_played': 85,
-            'region': 'east',
-            'achievements': {
-                'first_blood', 'level_master', 'explorer', 'treasure_seeker',
-                'pixel_perfect', 'combo_king'
-            }
-        }
+        "regions": {data['region'] for data in records}
     }
 
-    print("=== List Comprehension Examples ===\n")
 
-    try:
-        high_score = [
-            p['score'] for p in players.values() if p['score'] > 2000
-        ]
-        double_score = [p['score'] * 2 for p in players.values()]
-        active_players = [
-            p for p in players
-            if players[p]['sessions_played'] > 40
-        ]
-    except (KeyError, ValueError):
-        print("Error: Invalide players data in list comprehension.")
-    except Exception as e:
-        print(f"Unexpected error in list comprehension. {e}")
+def comprehension(players: dict[str, dict] | None = None) -> None:
+    """
+    Provides a dashboard for game analytics
+    using various comprehension techniques.
 
-    print("High scorers (+2000):", high_score)
-    print("Scores doubled:", double_score)
-    print("Active players:", active_players, end="\n\n")
+    This function processes player data (level, score, sessions, achievements)
+    using List, Dict, and Set comprehensions to demonstrate efficient data
+    filtering and transformation in Python.
 
-    print("=== Dict Comprehension Examples ===")
+    Args:
+        players: Player records keyed by name; defaults to PLAYERS.
 
-    try:
-        player_scores = {name: data['score'] for name, data in players.items()}
-        level_categories = {
-            "high": len([n for n, d in players.items() if d['level'] >= 30]),
-            "medium": len(
-                [n for n, d in players.items() if 20 <= d['level'] < 30]
-            ),
-            "low": len([n for n, d in players.items() if d['level'] < 20])
-        }
-        achievement_counts = {
-            name: len(data['achievements']) for name, data in players.items()
-        }
-    except (KeyError, ValueError):
-        print("Error: Invalide players data in dict comprehension.")
-    except Exception as e:
-        print(f"Unexpected error in dict comprehension. {e}")
+    Returns:
+        None.
+    """
 
-    print(f"Player scores: {player_scores}")
-    print(f"Score categories: {level_categories}")
-    print(f"Achievement counts: {achievement_counts}", end="\n\n")
+    print("=== Game Analytics Dashboard ===\n")
 
-    print("=== Set Comprehension Examples ===")
+    if players is None:
+        players = PLAYERS
 
     try:
-        unique_players = {player for player in players}
-        unique_ach = {
-            ach for data in players.values() for ach in data['achievements']
-        }
-        regions = {data['region'] for data in players.values()}
-    except (KeyError, ValueError):
-        print("Error: Invalide players data in set comprehension.")
+        metrics = dashboard_metrics(players)
+    except (KeyError, ValueError, TypeError):
+        print("Error: Invalide players data in comprehension.")
+        return
     except Exception as e:
-        print(f"Unexpected error in set comprehension. {e}")
+        print(f"Unexpected error in comprehension. {e}")
+        return
 
-    print("Unique players:", unique_players)
-    print("Unique achievements:", unique_ach)
-    print("Active region:", regions)
+    print_dashboard(metrics)
 
 
 if __name__ == "__main__":
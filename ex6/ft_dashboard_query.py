@@ -0,0 +1,425 @@
+import operator
+from abc import ABC, abstractmethod
+from itertools import chain, compress, islice, repeat
+
+
+SCAN_CHUNK = 2048
+
+
+OPERATORS = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt,
+    ">=": operator.ge, "==": operator.eq, "!=": operator.ne
+}
+
+
+class _Chunk:
+    """
+    A block of rows split into names and records. Field columns are
+    extracted once and shared by every expression reading them.
+    """
+
+    def __init__(self, items: list[tuple[str, dict]]) -> None:
+        self.names, self.recs = zip(*items)
+        self._fields: dict[str, list] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def field(self, field: str) -> list:
+        values = self._fields.get(field)
+        if values is None:
+            values = self._fields[field] = list(
+                map(operator.itemgetter(field), self.recs)
+            )
+        return values
+
+
+class Expr(ABC):
+    """
+    Node of a row expression, evaluated against (name, rec) pairs.
+
+    An expression compiles to a plain function of (name, rec) built from
+    closures over its children, for single rows, and evaluates a whole
+    chunk of rows as a pipeline of map() calls, so scans run their
+    per-row work in C. Constants are captured, never evaluated as code.
+    """
+
+    @abstractmethod
+    def compile(self) -> object:
+        """
+        Returns:
+            The expression as a function of (name, rec).
+        """
+
+    @abstractmethod
+    def values(self, chunk: _Chunk) -> object:
+        """
+        Args:
+            chunk: A block of rows.
+
+        Returns:
+            An iterable of the expression's value for every row.
+        """
+
+    def fields(self) -> set:
+        """
+        Returns:
+            The record fields the expression reads.
+        """
+        return _fields(vars(self).values())
+
+
+def _fields(nodes: object) -> set:
+    found: set = set()
+    for node in nodes:
+        if isinstance(node, (Expr, Aggregation)):
+            found |= node.fields()
+    return found
+
+
+class Name(Expr):
+    """The player name."""
+
+    def compile(self) -> object:
+        return lambda name, rec: name
+
+    def values(self, chunk: _Chunk) -> object:
+        return chunk.names
+
+
+class Field(Expr):
+    """A field of the player record, e.g. Field('score')."""
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+
+    def compile(self) -> object:
+        field = self.field
+        return lambda name, rec: rec[field]
+
+    def values(self, chunk: _Chunk) -> object:
+        return chunk.field(self.field)
+
+    def fields(self) -> set:
+        return {self.field}
+
+
+class Mul(Expr):
+    """An expression multiplied by a constant."""
+
+    def __init__(self, expr: Expr, factor: object) -> None:
+        self.expr = expr
+        self.factor = factor
+
+    def compile(self) -> object:
+        inner, factor = self.expr.compile(), self.factor
+        return lambda name, rec: inner(name, rec) * factor
+
+    def values(self, chunk: _Chunk) -> object:
+        return map(operator.mul, self.expr.values(chunk), repeat(self.factor))
+
+
+class Len(Expr):
+    """The length of an expression, e.g. Len(Field('achievements'))."""
+
+    def __init__(self, expr: Expr) -> None:
+        self.expr = expr
+
+    def compile(self) -> object:
+        inner = self.expr.compile()
+        return lambda name, rec: len(inner(name, rec))
+
+    def values(self, chunk: _Chunk) -> object:
+        return map(len, self.expr.values(chunk))
+
+
+class Compare(Expr):
+    """An expression compared with a constant, e.g. score > 2000."""
+
+    def __init__(self, expr: Expr, op: str, value: object) -> None:
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator: '{op}'")
+        self.expr = expr
+        self.op = op
+        self.value = value
+
+    def compile(self) -> object:
+        inner, compare = self.expr.compile(), OPERATORS[self.op]
+        value = self.value
+        return lambda name, rec: compare(inner(name, rec), value)
+
+    def values(self, chunk: _Chunk) -> object:
+        return map(
+            OPERATORS[self.op], self.expr.values(chunk), repeat(self.value)
+        )
+
+
+class Between(Expr):
+    """low <= expression < high."""
+
+    def __init__(self, expr: Expr, low: object, high: object) -> None:
+        self.expr = expr
+        self.low = low
+        self.high = high
+
+    def compile(self) -> object:
+        inner, low, high = self.expr.compile(), self.low, self.high
+        return lambda name, rec: low <= inner(name, rec) < high
+
+    def values(self, chunk: _Chunk) -> object:
+        values = self.expr.values(chunk)
+        if not isinstance(values, list):
+            values = list(values)
+        return map(
+            operator.and_, map(operator.le, repeat(self.low), values),
+            map(operator.lt, values, repeat(self.high))
+        )
+
+
+class Aggregation(ABC):
+    """
+    A dashboard metric computed by the fused scan.
+
+    Subclasses provide a fresh initial state, a fold of a chunk of rows
+    into the state and an associative merge for partial results.
+    """
+
+    def __init__(self, where: Expr | None = None) -> None:
+        self.where = where
+
+    @abstractmethod
+    def initial(self) -> object:
+        """Returns a new, empty state."""
+
+    @abstractmethod
+    def fold(
+        self, state: object, chunk: _Chunk, mask: list | None
+    ) -> object:
+        """
+        Folds the matching rows of a chunk into the state.
+
+        Args:
+            state: The current state.
+            chunk: A block of rows.
+            mask: The where predicate of every row; None keeps them all.
+
+        Returns:
+            The new state.
+        """
+
+    @abstractmethod
+    def merge(self, left: object, right: object) -> object:
+        """Combines the states of two partitions, left rows first."""
+
+    def fields(self) -> set:
+        """
+        Returns:
+            The record fields the aggregation reads.
+        """
+        return _fields(vars(self).values())
+
+
+class Collect(Aggregation):
+    """List of an expression over the matching rows, in row order."""
+
+    def __init__(self, expr: Expr, where: Expr | None = None) -> None:
+        super().__init__(where)
+        self.expr = expr
+
+    def initial(self) -> list:
+        return []
+
+    def fold(self, state: list, chunk: _Chunk, mask: list | None) -> list:
+        values = self.expr.values(chunk)
+        state.extend(values if mask is None else compress(values, mask))
+        return state
+
+    def merge(self, left: list, right: list) -> list:
+        return left + right
+
+
+class Mapping(Aggregation):
+    """Dict of key -> value over the matching rows."""
+
+    def __init__(
+        self, key: Expr, value: Expr, where: Expr | None = None
+    ) -> None:
+        super().__init__(where)
+        self.key = key
+        self.value = value
+
+    def initial(self) -> dict:
+        return {}
+
+    def fold(self, state: dict, chunk: _Chunk, mask: list | None) -> dict:
+        pairs = zip(self.key.values(chunk), self.value.values(chunk))
+        state.update(pairs if mask is None else compress(pairs, mask))
+        return state
+
+    def merge(self, left: dict, right: dict) -> dict:
+        return {**left, **right}
+
+
+class Count(Aggregation):
+    """Number of matching rows."""
+
+    def initial(self) -> int:
+        return 0
+
+    def fold(self, state: int, chunk: _Chunk, mask: list | None) -> int:
+        return state + (len(chunk) if mask is None else mask.count(True))
+
+    def merge(self, left: int, right: int) -> int:
+        return left + right
+
+
+class Distinct(Aggregation):
+    """Set of an expression's values; flatten=True unions iterables."""
+
+    def __init__(
+        self, expr: Expr, flatten: bool = False, where: Expr | None = None
+    ) -> None:
+        super().__init__(where)
+        self.expr = expr
+        self.flatten = flatten
+
+    def initial(self) -> set:
+        return set()
+
+    def fold(self, state: set, chunk: _Chunk, mask: list | None) -> set:
+        values = self.expr.values(chunk)
+        if mask is not None:
+            values = compress(values, mask)
+        state.update(chain.from_iterable(values) if self.flatten else values)
+        return state
+
+    def merge(self, left: set, right: set) -> set:
+        return left | right
+
+
+class FusedQuery:
+    """
+    Registry of aggregations evaluated together in a single scan.
+
+    The players are read once, in chunks of SCAN_CHUNK rows. Each chunk
+    is split into columns, every field a metric reads is extracted once,
+    and each aggregation folds the chunk through map(), compress() and
+    the container update methods, so the per-row work runs in C instead
+    of a Python call per row and metric. Partial states of separate
+    scans merge per aggregation.
+    """
+
+    def __init__(self) -> None:
+        self.aggregations: dict[str, Aggregation] = {}
+
+    def register(self, name: str, aggregation: Aggregation) -> None:
+        """
+        Adds a metric to the query.
+
+        Args:
+            name: Result key of the metric.
+            aggregation: How the metric is computed.
+        """
+        if name in self.aggregations:
+            raise KeyError(f"Metric '{name}' is already registered")
+        self.aggregations[name] = aggregation
+
+    def fields(self) -> set:
+        """
+        Returns:
+            The record fields read by any registered aggregation.
+        """
+        return _fields(self.aggregations.values())
+
+    def scan(self, items: object, states: list | None = None) -> list:
+        """
+        Runs every aggregation over (name, record) pairs in one pass.
+
+        Args:
+            items: Iterable of (player name, record) pairs.
+            states: States returned by a previous scan to continue from,
+                so chunked input folds into one state instead of keeping
+                a partial per chunk. Lists, dicts and sets are extended
+                in place, but immutable states such as a Count are
+                replaced, so continue from the returned list.
+
+        Returns:
+            The partial state of each aggregation, in registration order.
+        """
+        aggregations = list(self.aggregations.values())
+        if states is None:
+            states = [agg.initial() for agg in aggregations]
+        else:
+            states = list(states)
+        items = iter(items)
+        for block in iter(lambda: list(islice(items, SCAN_CHUNK)), []):
+            chunk = _Chunk(block)
+            for i, agg in enumerate(aggregations):
+                mask = None if agg.where is None \
+                    else list(agg.where.values(chunk))
+                states[i] = agg.fold(states[i], chunk, mask)
+        return states
+
+    def run(self, players: dict[str, dict]) -> dict[str, object]:
+        """
+        Computes every registered metric.
+
+        Args:
+            players: Player records keyed by name.
+
+        Returns:
+            The metric values keyed by name.
+        """
+        return self.collect([self.scan(players.items())])
+
+    def collect(self, partials: list[list]) -> dict[str, object]:
+        """
+        Merges partial scan states into final metric values.
+
+        Args:
+            partials: States returned by scan(), one list per partition,
+                in row order.
+
+        Returns:
+            The metric values keyed by name.
+        """
+        if not partials:
+            partials = [self.scan(())]
+        result = {}
+        for i, (name, agg) in enumerate(self.aggregations.items()):
+            value = partials[0][i]
+            for partial in partials[1:]:
+                value = agg.merge(value, partial[i])
+            result[name] = value
+        return result
+
+
+def dashboard_query() -> FusedQuery:
+    """
+    Builds the fused query behind the analytics dashboard.
+
+    Returns:
+        A query computing every dashboard metric in one scan.
+    """
+    query = FusedQuery()
+    score, level = Field('score'), Field('level')
+    query.register(
+        "high_score", Collect(score, where=Compare(score, ">", 2000))
+    )
+    query.register("double_score", Collect(Mul(score, 2)))
+    query.register("active_players", Collect(
+        Name(), where=Compare(Field('sessions_played'), ">", 40)
+    ))
+    query.register("player_scores", Mapping(Name(), score))
+    query.register("level_high", Count(where=Compare(level, ">=", 30)))
+    query.register("level_medium", Count(where=Between(level, 20, 30)))
+    query.register("level_low", Count(where=Compare(level, "<", 20)))
+    query.register(
+        "achievement_counts", Mapping(Name(), Len(Field('achievements')))
+    )
+    query.register("unique_players", Distinct(Name()))
+    query.register(
+        "unique_ach", Distinct(Field('achievements'), flatten=True)
+    )
+    query.register("regions", Distinct(Field('region')))
+    return query
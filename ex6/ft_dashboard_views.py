@@ -0,0 +1,406 @@
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+
+from ft_analytics_dashboard import DASHBOARD_QUERY, PLAYERS, print_dashboard
+from ft_dashboard_query import (
+    Aggregation, Collect, Count, Distinct, FusedQuery, Mapping
+)
+
+
+class ChangeLog:
+    """
+    Append-only log of player mutations.
+
+    Entries are (name, seq, old record, new record); old is None for an
+    insert and new is None for a delete. Versions are absolute entry
+    numbers, so they stay valid after compact() drops consumed entries.
+    """
+
+    def __init__(self) -> None:
+        self.entries: list[tuple] = []
+        self.start = 0
+
+    @property
+    def version(self) -> int:
+        return self.start + len(self.entries)
+
+    def append(self, entry: tuple) -> None:
+        self.entries.append(entry)
+
+    def since(self, version: int) -> list[tuple]:
+        """
+        Args:
+            version: A version previously read from this log.
+
+        Returns:
+            The entries appended after it.
+
+        Raises:
+            LookupError: If those entries were compacted away.
+        """
+        if version < self.start:
+            raise LookupError(f"Changes since version {version} are gone")
+        return self.entries[version - self.start:]
+
+    def compact(self, version: int) -> None:
+        """Drops the entries before `version`."""
+        drop = min(version, self.version) - self.start
+        if drop > 0:
+            del self.entries[:drop]
+            self.start += drop
+
+
+class PlayerStore:
+    """
+    Player records whose mutations are recorded in a ChangeLog.
+
+    Records are never modified in place: an update stores a new dict, so
+    the log can hand out both the old and the new version. Every player
+    keeps the sequence number of its first insert, which gives the
+    dashboard's row order.
+    """
+
+    def __init__(self, players: dict[str, dict] | None = None) -> None:
+        """
+        Args:
+            players: Initial records keyed by player name.
+        """
+        self.players: dict[str, dict] = {}
+        self.seq: dict[str, int] = {}
+        self.log = ChangeLog()
+        self._next_seq = 0
+        for name, record in (players or {}).items():
+            self.insert(name, record)
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def insert(self, name: str, record: dict) -> None:
+        """
+        Adds a player.
+
+        Raises:
+            KeyError: If the player exists already.
+        """
+        if name in self.players:
+            raise KeyError(f"Player '{name}' already exists")
+        record = dict(record)
+        self.players[name] = record
+        self.seq[name] = seq = self._next_seq
+        self._next_seq += 1
+        self.log.append((name, seq, None, record))
+
+    def update(self, name: str, changes: dict) -> None:
+        """
+        Changes some fields of a player.
+
+        Args:
+            name: The player name.
+            changes: New values keyed by field.
+        """
+        old = self.players[name]
+        new = {**old, **changes}
+        self.players[name] = new
+        self.log.append((name, self.seq[name], old, new))
+
+    def delete(self, name: str) -> None:
+        """Removes a player."""
+        old = self.players.pop(name)
+        self.log.append((name, self.seq.pop(name), old, None))
+
+
+class MaterializedView(ABC):
+    """
+    One dashboard metric kept up to date from player changes.
+
+    apply() retracts the contribution of a player's old record and adds
+    the one of its new record. value() memoizes the result until a later
+    change touches this view.
+    """
+
+    def __init__(self, aggregation: Aggregation) -> None:
+        self.where = None if aggregation.where is None \
+            else aggregation.where.compile()
+        self.dirty = True
+        self._value: object = None
+
+    def _matches(self, name: str, rec: dict | None) -> bool:
+        return rec is not None and (
+            self.where is None or bool(self.where(name, rec))
+        )
+
+    @abstractmethod
+    def apply(
+        self, name: str, seq: int, old: dict | None, new: dict | None
+    ) -> None:
+        """
+        Folds one logged change into the view.
+
+        Args:
+            name: The player name.
+            seq: The player's insert sequence number.
+            old: Its record before the change, None for an insert.
+            new: Its record after the change, None for a delete.
+        """
+
+    @abstractmethod
+    def _build(self) -> object:
+        """Computes the metric value from the maintained state."""
+
+    def value(self) -> object:
+        if self.dirty:
+            self._value = self._build()
+            self.dirty = False
+        return self._value
+
+
+class CountView(MaterializedView):
+    """Materialized Count."""
+
+    def __init__(self, aggregation: Count) -> None:
+        super().__init__(aggregation)
+        self.count = 0
+
+    def apply(
+        self, name: str, seq: int, old: dict | None, new: dict | None
+    ) -> None:
+        delta = self._matches(name, new) - self._matches(name, old)
+        if delta:
+            self.count += delta
+            self.dirty = True
+
+    def _build(self) -> int:
+        return self.count
+
+
+class RowsView(MaterializedView):
+    """
+    Materialized Collect or Mapping: one entry per matching player.
+
+    Values are kept in a dict keyed by the mapping key (the player name
+    for Collect), which is expected to be unique per player as with
+    Name(). A player that keeps matching is updated in place, so its
+    position does not move; only a player entering the view out of
+    sequence order forces the next read to re-sort the entries by
+    sequence number. Reads after a change are a C-level copy.
+    """
+
+    def __init__(self, aggregation: Collect | Mapping) -> None:
+        super().__init__(aggregation)
+        self.mapping = isinstance(aggregation, Mapping)
+        if self.mapping:
+            self.key = aggregation.key.compile()
+            self.expr = aggregation.value.compile()
+        else:
+            self.key = None
+            self.expr = aggregation.expr.compile()
+        self.seqs: dict[str, int] = {}
+        self.keys: dict[str, object] = {}
+        self.payloads: dict[object, object] = {}
+        self.last_seq = -1
+        self.ordered = True
+
+    def apply(
+        self, name: str, seq: int, old: dict | None, new: dict | None
+    ) -> None:
+        key = self.keys.pop(name, None)
+        if self._matches(name, new):
+            if name not in self.seqs:
+                if seq < self.last_seq:
+                    self.ordered = False
+                self.last_seq = max(self.last_seq, seq)
+                self.seqs[name] = seq
+            new_key = name if self.key is None else self.key(name, new)
+            if new_key != key and key is not None:
+                del self.payloads[key]
+            self.keys[name] = new_key
+            self.payloads[new_key] = self.expr(name, new)
+            self.dirty = True
+        elif self.seqs.pop(name, None) is not None:
+            del self.payloads[key]
+            self.dirty = True
+
+    def _build(self) -> list | dict:
+        if not self.ordered:
+            self.seqs = dict(sorted(self.seqs.items(), key=lambda s: s[1]))
+            self.payloads = {
+                self.keys[name]: self.payloads[self.keys[name]]
+                for name in self.seqs
+            }
+            self.ordered = True
+        if self.mapping:
+            return self.payloads.copy()
+        return list(self.payloads.values())
+
+
+class DistinctView(MaterializedView):
+    """
+    Materialized Distinct, with a reference count per value so values
+    disappear once no player contributes them.
+    """
+
+    def __init__(self, aggregation: Distinct) -> None:
+        super().__init__(aggregation)
+        self.expr = aggregation.expr.compile()
+        self.flatten = aggregation.flatten
+        self.counts: Counter = Counter()
+
+    def _values(self, name: str, rec: dict | None) -> object:
+        if not self._matches(name, rec):
+            return ()
+        value = self.expr(name, rec)
+        return value if self.flatten else (value,)
+
+    def apply(
+        self, name: str, seq: int, old: dict | None, new: dict | None
+    ) -> None:
+        counts = self.counts
+        for value in self._values(name, new):
+            if value not in counts:
+                self.dirty = True
+            counts[value] += 1
+        for value in self._values(name, old):
+            counts[value] -= 1
+            if not counts[value]:
+                del counts[value]
+                self.dirty = True
+
+    def _build(self) -> set:
+        return set(self.counts)
+
+
+VIEW_TYPES = (
+    (Count, CountView),
+    (Collect, RowsView),
+    (Mapping, RowsView),
+    (Distinct, DistinctView)
+)
+
+
+def materialize(aggregation: Aggregation) -> MaterializedView:
+    """
+    Args:
+        aggregation: A fused-query aggregation.
+
+    Returns:
+        The incremental view computing the same metric.
+    """
+    for kind, view in VIEW_TYPES:
+        if isinstance(aggregation, kind):
+            return view(aggregation)
+    raise TypeError(f"No view for {type(aggregation).__name__}")
+
+
+class DashboardViews:
+    """
+    Materialized views of every metric of a fused query.
+
+    refresh() consumes the store's change log since the last refresh, so
+    K changes cost O(K) view updates whatever the number of players.
+    invalidate() forces a metric to be rebuilt from the full store on the
+    next refresh instead.
+    """
+
+    def __init__(
+        self, store: PlayerStore, query: FusedQuery = DASHBOARD_QUERY
+    ) -> None:
+        """
+        Args:
+            store: The players to follow.
+            query: The metrics to materialize.
+        """
+        self.store = store
+        self.aggregations = query.aggregations
+        self.views: dict[str, MaterializedView] = {}
+        self.version = 0
+        self.last_refresh = (0, 0.0)
+        self.invalidate()
+
+    def invalidate(self, metric: str | None = None) -> None:
+        """
+        Drops a view so the next refresh rebuilds it from scratch.
+
+        Args:
+            metric: The metric name; None drops every view.
+        """
+        for name in (self.aggregations if metric is None else (metric,)):
+            if name not in self.aggregations:
+                raise KeyError(f"Unknown metric: '{name}'")
+            self.views.pop(name, None)
+
+    def _rebuild(self, names: list[str]) -> None:
+        views = {name: materialize(self.aggregations[name]) for name in names}
+        seq = self.store.seq
+        for player, record in self.store.players.items():
+            for view in views.values():
+                view.apply(player, seq[player], None, record)
+        self.views.update(views)
+
+    def refresh(self, compact: bool = True) -> int:
+        """
+        Brings every view up to date with the store.
+
+        Args:
+            compact: Drop the consumed log entries. Pass False when other
+                readers follow the same store.
+
+        Returns:
+            The number of changes applied.
+        """
+        start = time.perf_counter()
+        log = self.store.log
+        try:
+            changes = log.since(self.version)
+        except LookupError:
+            self.views.clear()
+            changes = []
+        stale = [name for name in self.aggregations if name not in self.views]
+        fresh = list(self.views.values())
+        for change in changes:
+            for view in fresh:
+                view.apply(*change)
+        if stale:
+            self._rebuild(stale)
+        self.version = log.version
+        if compact:
+            log.compact(self.version)
+        self.last_refresh = (len(changes), time.perf_counter() - start)
+        return len(changes)
+
+    def metrics(self) -> dict[str, object]:
+        """
+        Returns:
+            Every metric value, refreshed first. Values are shared with
+            the memo; copy them before modifying.
+        """
+        self.refresh()
+        return {name: self.views[name].value() for name in self.aggregations}
+
+
+def main() -> None:
+    """Refreshes the dashboard views after a few player changes."""
+    print("=== Materialized Dashboard Views ===\n")
+
+    try:
+        store = PlayerStore(PLAYERS)
+        views = DashboardViews(store)
+        views.metrics()
+        store.update("diana", {'level': 31, 'score': 2400})
+        store.update("eve", {'region': 'south'})
+        store.delete("frank")
+        store.insert("grace", {
+            'level': 27, 'score': 3100, 'sessions_played': 55,
+            'region': 'west', 'achievements': {'first_blood', 'collector'}
+        })
+        print_dashboard(views.metrics())
+        changes, seconds = views.last_refresh
+        print(f"\nRefresh: {changes} changes in {seconds * 1e6:.1f} us")
+    except (KeyError, ValueError, TypeError) as e:
+        print(f"Error: Invalide players data. {e}")
+    except Exception as e:
+        print(f"Unexpected error in dashboard views. {e}")
+
+
+if __name__ == "__main__":
+    main()
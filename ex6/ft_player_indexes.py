@@ -0,0 +1,426 @@
+from array import array
+from bisect import bisect_left, insort
+
+from ft_analytics_dashboard import PLAYERS
+
+
+ROW_BITS = 32
+ROW_MASK = (1 << ROW_BITS) - 1
+KEY_LIMIT = 1 << 31
+SCAN_THRESHOLD = 0.25
+SORTED_OPS = ("<", "<=", ">", ">=", "==", "between")
+
+
+class SortedIndex:
+    """
+    Ordered index of an integer field, for range filters.
+
+    Entries are packed as key << 32 | row into one sorted array('q'), so
+    a single bisect finds both a key range and an exact entry to delete.
+    Insert and delete shift the array with memmove, O(log N) comparisons.
+    Keys must be int32 ints: floats are rejected rather than truncated,
+    since the packing cannot order them.
+    """
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        self.entries = array("q")
+
+    @staticmethod
+    def check(key: object) -> None:
+        """
+        Validates a key before anything is indexed.
+
+        Raises:
+            TypeError: If the key is not an int.
+            ValueError: If the key is outside the int32 range.
+        """
+        if not isinstance(key, int):
+            raise TypeError(
+                f"Indexed value must be an int, got {type(key).__name__}"
+            )
+        if not -KEY_LIMIT <= key < KEY_LIMIT:
+            raise ValueError(f"Indexed value out of int32 range: {key}")
+
+    @classmethod
+    def _entry(cls, key: int, row: int) -> int:
+        cls.check(key)
+        return (key << ROW_BITS) | row
+
+    def insert(self, key: int, row: int) -> None:
+        insort(self.entries, self._entry(key, row))
+
+    def delete(self, key: int, row: int) -> None:
+        entry = self._entry(key, row)
+        i = bisect_left(self.entries, entry)
+        if i == len(self.entries) or self.entries[i] != entry:
+            raise KeyError(f"Row {row} is not indexed under {key}")
+        del self.entries[i]
+
+    def _bounds(self, low: int | None, high: int | None) -> tuple[int, int]:
+        """Positions of the entries with low <= key < high."""
+        entries = self.entries
+        start = 0 if low is None else bisect_left(entries, low << ROW_BITS)
+        stop = len(entries) if high is None \
+            else bisect_left(entries, high << ROW_BITS)
+        return start, max(start, stop)
+
+    def estimate(self, low: int | None, high: int | None) -> int:
+        """Exact number of rows in [low, high), in O(log N)."""
+        start, stop = self._bounds(low, high)
+        return stop - start
+
+    def rows(self, low: int | None, high: int | None) -> list[int]:
+        """Rows with low <= key < high, in key order."""
+        start, stop = self._bounds(low, high)
+        return [entry & ROW_MASK for entry in self.entries[start:stop]]
+
+
+class HashIndex:
+    """
+    Value -> rows index for equality filters, e.g. on region.
+    """
+
+    def __init__(self, field: str, multi: bool = False) -> None:
+        """
+        Args:
+            field: Indexed record field.
+            multi: The field holds a collection and every element is
+                indexed (an inverted index, e.g. achievement -> players).
+        """
+        self.field = field
+        self.multi = multi
+        self.buckets: dict[object, set] = {}
+
+    def _keys(self, value: object) -> object:
+        return value if self.multi else (value,)
+
+    def check(self, value: object) -> None:
+        """
+        Validates a value before anything is indexed.
+
+        Raises:
+            TypeError: If a key is unhashable.
+        """
+        for key in self._keys(value):
+            hash(key)
+
+    def insert(self, value: object, row: int) -> None:
+        for key in self._keys(value):
+            self.buckets.setdefault(key, set()).add(row)
+
+    def delete(self, value: object, row: int) -> None:
+        for key in self._keys(value):
+            bucket = self.buckets[key]
+            bucket.discard(row)
+            if not bucket:
+                del self.buckets[key]
+
+    def rows(self, key: object) -> set:
+        return self.buckets.get(key, set())
+
+
+def _range(op: str, value: object) -> tuple[int | None, int | None]:
+    """Translates a comparison into half-open [low, high) bounds."""
+    if op == ">":
+        return value + 1, None
+    if op == ">=":
+        return value, None
+    if op == "<":
+        return None, value
+    if op == "<=":
+        return None, value + 1
+    if op == "==":
+        return value, value + 1
+    if op == "between":
+        return value
+    raise ValueError(f"Operator '{op}' cannot use a sorted index")
+
+
+def _int_bounds(op: str, value: object) -> bool:
+    """Whether a filter's operand can be looked up in a SortedIndex."""
+    bounds = value if op == "between" else (value,)
+    return all(isinstance(bound, int) for bound in bounds)
+
+
+def _matches(record: dict, field: str, op: str, value: object) -> bool:
+    """Evaluates one filter directly on a record (the scan path)."""
+    actual = record[field]
+    if op == ">":
+        return actual > value
+    if op == ">=":
+        return actual >= value
+    if op == "<":
+        return actual < value
+    if op == "<=":
+        return actual <= value
+    if op == "==":
+        return actual == value
+    if op == "!=":
+        return actual != value
+    if op == "between":
+        return value[0] <= actual < value[1]
+    if op == "in":
+        return actual in value
+    if op == "contains":
+        return value in actual
+    raise ValueError(f"Unknown operator: '{op}'")
+
+
+class IndexedPlayers:
+    """
+    Player records with optional secondary indexes and a small planner.
+
+    Sorted indexes serve range filters, hash indexes serve equality and
+    membership, inverted indexes serve "contains" on collections. All of
+    them are maintained on insert, update and delete. query() takes a
+    list of (field, op, value) filters, ANDed together, and picks the
+    most selective indexed filter when it keeps under SCAN_THRESHOLD of
+    the rows; otherwise it scans.
+    """
+
+    def __init__(
+        self, players: dict[str, dict] | None = None,
+        sorted_fields: tuple = ("score", "level"),
+        hash_fields: tuple = ("region",),
+        inverted_fields: tuple = ("achievements",)
+    ) -> None:
+        """
+        Args:
+            players: Initial records keyed by player name.
+            sorted_fields: Integer fields given a SortedIndex.
+            hash_fields: Fields given a HashIndex.
+            inverted_fields: Collection fields given an inverted index.
+        """
+        self.records: list[dict | None] = []
+        self.names: list[str | None] = []
+        self.row_of: dict[str, int] = {}
+        self._free: list[int] = []
+        self.sorted = {field: SortedIndex(field) for field in sorted_fields}
+        self.hashed = {field: HashIndex(field) for field in hash_fields}
+        self.hashed.update({
+            field: HashIndex(field, multi=True) for field in inverted_fields
+        })
+        for name, record in (players or {}).items():
+            self.insert(name, record)
+
+    def __len__(self) -> int:
+        return len(self.row_of)
+
+    def _index(self, row: int, record: dict, fields: object = None) -> None:
+        for field, index in self.sorted.items():
+            if fields is None or field in fields:
+                index.insert(record[field], row)
+        for field, index in self.hashed.items():
+            if fields is None or field in fields:
+                index.insert(record[field], row)
+
+    def _check(self, record: dict, fields: object = None) -> None:
+        """Raises before any index changes if a value cannot be indexed."""
+        for field, index in self.sorted.items():
+            if fields is None or field in fields:
+                index.check(record[field])
+        for field, index in self.hashed.items():
+            if fields is None or field in fields:
+                index.check(record[field])
+
+    def _unindex(self, row: int, record: dict, fields: object = None) -> None:
+        for field, index in self.sorted.items():
+            if fields is None or field in fields:
+                index.delete(record[field], row)
+        for field, index in self.hashed.items():
+            if fields is None or field in fields:
+                index.delete(record[field], row)
+
+    def insert(self, name: str, record: dict) -> None:
+        """
+        Adds a player.
+
+        Args:
+            name: The player name.
+            record: The player's record; it is copied.
+
+        Raises:
+            KeyError: If the player exists already or an indexed field is
+                missing.
+            TypeError: If a sorted field is not an int (floats included)
+                or a hashed value is unhashable.
+            ValueError: If a sorted field is outside the int32 range.
+        """
+        if name in self.row_of:
+            raise KeyError(f"Player '{name}' already exists")
+        record = dict(record)
+        for field in self.hashed:
+            if self.hashed[field].multi:
+                record[field] = set(record[field])
+        self._check(record)
+        if self._free:
+            row = self._free.pop()
+            self.records[row], self.names[row] = record, name
+        else:
+            row = len(self.records)
+            self.records.append(record)
+            self.names.append(name)
+        self._index(row, record)
+        self.row_of[name] = row
+
+    def update(self, name: str, changes: dict) -> None:
+        """
+        Changes some fields of a player, reindexing only those fields.
+
+        The new values are validated first, so a rejected change leaves
+        both the record and its indexes untouched.
+
+        Args:
+            name: The player name.
+            changes: New values keyed by field.
+
+        Raises:
+            KeyError: If the player does not exist.
+            TypeError: If a sorted field is not an int (floats included)
+                or a hashed value is unhashable.
+            ValueError: If a sorted field is outside the int32 range.
+        """
+        row = self.row_of[name]
+        record = self.records[row]
+        changes = {
+            field: set(value)
+            if field in self.hashed and self.hashed[field].multi else value
+            for field, value in changes.items()
+        }
+        self._check(changes, changes)
+        self._unindex(row, record, changes)
+        record.update(changes)
+        self._index(row, record, changes)
+
+    def delete(self, name: str) -> dict:
+        """
+        Removes a player.
+
+        Args:
+            name: The player name.
+
+        Returns:
+            The removed record.
+        """
+        row = self.row_of.pop(name)
+        record = self.records[row]
+        self._unindex(row, record)
+        self.records[row] = self.names[row] = None
+        self._free.append(row)
+        return record
+
+    def get(self, name: str) -> dict:
+        """The record of a player."""
+        return self.records[self.row_of[name]]
+
+    def _estimate(self, field: str, op: str, value: object) -> int | None:
+        """Rows an index would return for a filter; None if unindexed."""
+        if field in self.sorted and op in SORTED_OPS \
+                and _int_bounds(op, value):
+            return self.sorted[field].estimate(*_range(op, value))
+        index = self.hashed.get(field)
+        if index is None:
+            return None
+        if op == ("contains" if index.multi else "=="):
+            return len(index.rows(value))
+        if op == "in" and not index.multi:
+            return sum(len(index.rows(v)) for v in set(value))
+        return None
+
+    def _fetch(self, field: str, op: str, value: object) -> object:
+        """Rows matching an indexed filter."""
+        if field in self.sorted and op in SORTED_OPS \
+                and _int_bounds(op, value):
+            return self.sorted[field].rows(*_range(op, value))
+        index = self.hashed[field]
+        if op == "in":
+            return set().union(*(index.rows(v) for v in value))
+        return index.rows(value)
+
+    def plan(self, filters: list) -> tuple[int | None, int]:
+        """
+        Chooses how to evaluate the filters.
+
+        Args:
+            filters: (field, op, value) filters, ANDed.
+
+        Returns:
+            (position of the filter driving an index lookup, or None for
+            a full scan; estimated rows read).
+        """
+        best, cost = None, len(self)
+        for i, (field, op, value) in enumerate(filters):
+            estimate = self._estimate(field, op, value)
+            if estimate is not None and (best is None or estimate < cost):
+                best, cost = i, estimate
+        if best is None or cost > SCAN_THRESHOLD * len(self):
+            return None, len(self)
+        return best, cost
+
+    def explain(self, filters: list) -> str:
+        """
+        Returns:
+            A one-line description of the chosen plan.
+        """
+        position, cost = self.plan(filters)
+        if position is None:
+            return f"full scan of {cost} rows"
+        field, op, value = filters[position]
+        return (f"index on {field} {op} {value!r} (~{cost} rows), "
+                f"then {len(filters) - 1} residual filter(s)")
+
+    def query(self, filters: list) -> set:
+        """
+        Finds the players matching every filter.
+
+        Supported ops: <, <=, >, >=, ==, !=, between (a (low, high)
+        half-open pair), in (a collection of values), contains (element
+        of a collection field). Non-int bounds, such as floats, skip the
+        sorted indexes and are evaluated by the scan.
+
+        Args:
+            filters: (field, op, value) filters, ANDed.
+
+        Returns:
+            The names of the matching players.
+        """
+        position, _ = self.plan(filters)
+        if position is None:
+            rows, residual = self.row_of.values(), filters
+        else:
+            rows = self._fetch(*filters[position])
+            residual = filters[:position] + filters[position + 1:]
+        records, names = self.records, self.names
+        return {
+            names[row] for row in rows
+            if all(_matches(records[row], *f) for f in residual)
+        }
+
+
+def main() -> None:
+    """Shows the planner choosing between indexes and scans."""
+    print("=== Indexed Player Queries ===\n")
+
+    try:
+        store = IndexedPlayers(PLAYERS)
+        queries = [
+            [("level", ">=", 30)],
+            [("level", "between", (20, 30))],
+            [("score", ">", 2000), ("region", "==", "north")],
+            [("achievements", "contains", "speed_runner")]
+        ]
+        for filters in queries:
+            print(f"{filters}: {sorted(store.query(filters))}")
+            print(f"  plan: {store.explain(filters)}")
+        store.update("diana", {'level': 31})
+        print("After diana reaches level 31:",
+              sorted(store.query([("level", ">=", 30)])))
+    except (KeyError, ValueError) as e:
+        print(f"Error: Invalide players data. {e}")
+    except Exception as e:
+        print(f"Unexpected error in indexed queries. {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,495 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from itertools import islice, repeat
+from sys import argv
+
+from ft_analytics_dashboard import DASHBOARD_QUERY, PLAYERS, print_dashboard
+from ft_dashboard_query import FusedQuery
+
+
+MAGIC = b"FTPLAYR1"
+GROUP_HEADER = struct.Struct("<I6Q")
+TRAILER = struct.Struct("<Q8s")
+COLUMNS = ("name", "level", "score", "sessions_played", "region",
+           "achievements")
+INT_COLUMNS = ("level", "score", "sessions_played")
+CHUNK_SIZE = 65536
+MASK_CACHE_SIZE = 65536
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class RecordWriter:
+    """
+    Writes players to the binary record format, one row group at a time.
+
+    Layout: MAGIC, then row groups, then a JSON footer holding the row
+    count and the region and achievement catalogs, then the footer length
+    and MAGIC again. A row group starts with its row count and the byte
+    length of each column, followed by the columns: names as u32 offsets
+    plus UTF-8 text, the int32 columns, u16 region codes and achievement
+    bitmasks as little-endian words. Readers can therefore skip every
+    column a query does not touch.
+    """
+
+    def __init__(self, stream: object, group_size: int = CHUNK_SIZE) -> None:
+        """
+        Args:
+            stream: A binary stream opened for writing.
+            group_size: Rows per row group.
+        """
+        if group_size <= 0:
+            raise ValueError("group_size must be positive")
+        self.stream = stream
+        self.group_size = group_size
+        self.rows = 0
+        self.regions: dict[str, int] = {}
+        self.achievements: dict[str, int] = {}
+        self._pending: list[tuple[str, dict]] = []
+        stream.write(MAGIC)
+
+    def write(self, name: str, record: dict) -> None:
+        """Buffers one player, flushing a full row group."""
+        self._pending.append((name, record))
+        if len(self._pending) == self.group_size:
+            self._flush()
+
+    def _code(self, catalog: dict[str, int], value: str) -> int:
+        code = catalog.get(value)
+        if code is None:
+            code = catalog[value] = len(catalog)
+        return code
+
+    def _flush(self) -> None:
+        rows = self._pending
+        if not rows:
+            return
+        names = [name.encode("utf-8") for name, _ in rows]
+        offsets = array("I", [0])
+        for name in names:
+            offsets.append(offsets[-1] + len(name))
+        columns = [_little_endian(offsets) + b"".join(names)]
+        for column in INT_COLUMNS:
+            columns.append(_little_endian(
+                array("i", [record[column] for _, record in rows])
+            ))
+        columns.append(_little_endian(array("H", [
+            self._code(self.regions, record['region']) for _, record in rows
+        ])))
+        masks = []
+        for _, record in rows:
+            mask = 0
+            for achievement in record['achievements']:
+                mask |= 1 << self._code(self.achievements, achievement)
+            masks.append(mask)
+        width = max(1, -(-len(self.achievements) // 64)) * 8
+        columns.append(b"".join(mask.to_bytes(width, "little")
+                                for mask in masks))
+        self.stream.write(GROUP_HEADER.pack(len(rows), *map(len, columns)))
+        for column in columns:
+            self.stream.write(column)
+        self.rows += len(rows)
+        self._pending = []
+
+    def close(self) -> None:
+        """Flushes the last row group and writes the footer."""
+        self._flush()
+        footer = json.dumps({
+            "rows": self.rows,
+            "regions": list(self.regions),
+            "achievements": list(self.achievements)
+        }).encode("utf-8")
+        self.stream.write(footer)
+        self.stream.write(TRAILER.pack(len(footer), MAGIC))
+
+
+def write_records(
+    players: object, path: str, group_size: int = CHUNK_SIZE
+) -> int:
+    """
+    Saves players in the binary record format.
+
+    Args:
+        players: A {name: record} dict or an iterable of (name, record).
+        path: Output file.
+        group_size: Rows per row group.
+
+    Returns:
+        The number of players written.
+    """
+    items = players.items() if isinstance(players, dict) else players
+    with open(path, "wb") as stream:
+        writer = RecordWriter(stream, group_size)
+        for name, record in items:
+            writer.write(name, record)
+        writer.close()
+    return writer.rows
+
+
+def write_jsonl(players: object, path: str) -> int:
+    """
+    Saves players as JSON Lines, one {"name": ..., ...} object per line.
+
+    Returns:
+        The number of players written.
+    """
+    items = players.items() if isinstance(players, dict) else players
+    rows = 0
+    with open(path, "w", encoding="utf-8") as stream:
+        for name, record in items:
+            line = {"name": name, **record}
+            line['achievements'] = sorted(record['achievements'])
+            stream.write(json.dumps(line) + "\n")
+            rows += 1
+    return rows
+
+
+class RecordChunk:
+    """
+    One row group of a binary record file, decoded column by column.
+
+    Each column is copied out of the memory map and decoded only when a
+    query reads it; achievement masks are decoded through a cache shared
+    by every chunk of the file.
+    """
+
+    def __init__(
+        self, reader: "PlayerReader", offset: int, rows: int,
+        lengths: tuple[int, ...]
+    ) -> None:
+        self.reader = reader
+        self.rows = rows
+        self.spans: dict[str, tuple[int, int]] = {}
+        for column, length in zip(COLUMNS, lengths):
+            self.spans[column] = (offset, offset + length)
+            offset += length
+        self._columns: dict[str, object] = {}
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def _raw(
+        self, column: str, typecode: str = "B", skip: int = 0,
+        size: int | None = None
+    ) -> array:
+        start, stop = self.spans[column]
+        start += skip
+        if size is not None:
+            stop = start + size
+        values = array(typecode)
+        with self.reader.view[start:stop] as view:
+            values.frombytes(view)
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+    def _decode(self, column: str) -> object:
+        rows = self.rows
+        if column in INT_COLUMNS:
+            return self._raw(column, "i")
+        if column == "name":
+            offsets = self._raw("name", "I", size=4 * (rows + 1))
+            text = self._raw("name", skip=4 * (rows + 1)).tobytes()
+            return [text[offsets[i]:offsets[i + 1]].decode("utf-8")
+                    for i in range(rows)]
+        if column == "region":
+            return list(map(self.reader.regions.__getitem__,
+                            self._raw("region", "H")))
+        if column == "achievements":
+            raw = self._raw("achievements").tobytes()
+            width = len(raw) // rows if rows else 8
+            decode = self.reader.decode_achievements
+            return [
+                decode(int.from_bytes(raw[i:i + width], "little"))
+                for i in range(0, len(raw), width)
+            ]
+        raise KeyError(f"Unknown column: '{column}'")
+
+    def column(self, column: str) -> object:
+        """
+        Args:
+            column: One of COLUMNS.
+
+        Returns:
+            The column values, decoded on first access.
+        """
+        values = self._columns.get(column)
+        if values is None:
+            values = self._columns[column] = self._decode(column)
+        return values
+
+    def records(self, fields: object = COLUMNS[1:]) -> object:
+        """
+        Args:
+            fields: The record fields to materialize.
+
+        Returns:
+            (name, record) pairs holding only those fields.
+        """
+        fields = tuple(fields)
+        columns = [self.column(field) for field in fields]
+        records = map(dict, map(zip, repeat(fields), zip(*columns)))
+        if not fields:
+            records = (dict() for _ in range(self.rows))
+        return zip(self.column("name"), records)
+
+
+class JsonLinesChunk:
+    """
+    A block of JSON Lines. Each line is parsed once, on the first call
+    to records(), and only the requested fields are kept in the records.
+    """
+
+    def __init__(self, lines: list[bytes]) -> None:
+        self.lines = lines
+        self._parsed: list[dict] | None = None
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def records(self, fields: object = COLUMNS[1:]) -> object:
+        """
+        Args:
+            fields: The record fields to materialize.
+
+        Returns:
+            (name, record) pairs holding only those fields.
+        """
+        fields = tuple(fields)
+        if self._parsed is None:
+            self._parsed = list(map(json.loads, self.lines))
+        for data in self._parsed:
+            record = {field: data[field] for field in fields}
+            if 'achievements' in record:
+                record['achievements'] = set(record['achievements'])
+            yield data['name'], record
+
+
+class PlayerReader:
+    """
+    Streams players from a binary record file or JSON Lines via mmap.
+
+    The file is never read as a whole: chunks are sliced out of the
+    memory map, so the resident set stays bounded by the chunk being
+    processed while the OS pages the file in and out.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path: A binary record file or a JSON Lines file.
+
+        Raises:
+            ValueError: If the file is a truncated record file; the file
+                is closed again before the error propagates.
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = None
+        if size:
+            self._map = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        self.view = memoryview(self._map if size else b"")
+        head = bytes(self.view[:len(MAGIC)])
+        self.binary = head == MAGIC
+        self.rows: int | None = None
+        self.regions: list[str] = []
+        self.achievements: list[str] = []
+        self._masks: dict[int, frozenset] = {}
+        try:
+            if size and size < len(MAGIC) and MAGIC.startswith(head):
+                raise self._truncated(f"{size} bytes, shorter than its magic")
+            if self.binary:
+                self._read_footer(size)
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> "PlayerReader":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.view.release()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def _truncated(self, detail: str) -> ValueError:
+        return ValueError(f"'{self.path}' is a truncated record file "
+                          f"({detail})")
+
+    def _read_footer(self, size: int) -> None:
+        offset = size - TRAILER.size
+        try:
+            length, magic = TRAILER.unpack_from(self.view, offset)
+        except struct.error:
+            raise self._truncated(f"{size} bytes, no room for the trailer")
+        if magic != MAGIC:
+            raise self._truncated(f"{size} bytes, no trailer at the end")
+        self._footer = offset - length
+        if self._footer < len(MAGIC):
+            raise self._truncated(
+                f"{size} bytes, footer length {length} runs past the start"
+            )
+        footer = json.loads(bytes(self.view[self._footer:size - TRAILER.size]))
+        self.rows = footer["rows"]
+        self.regions = footer["regions"]
+        self.achievements = footer["achievements"]
+
+    def decode_achievements(self, mask: int) -> frozenset:
+        """
+        Args:
+            mask: An achievement bitmask of this file.
+
+        Returns:
+            The achievement names it holds. Up to MASK_CACHE_SIZE distinct
+            masks are cached, so memory stays bounded on large files.
+        """
+        names = self._masks.get(mask)
+        if names is None:
+            catalog, found = self.achievements, []
+            rest = mask
+            while rest:
+                low = rest & -rest
+                found.append(catalog[low.bit_length() - 1])
+                rest ^= low
+            names = frozenset(found)
+            if len(self._masks) < MASK_CACHE_SIZE:
+                self._masks[mask] = names
+        return names
+
+    def _lines(self) -> object:
+        """Yields the lines of the map from its start, newline included."""
+        data, start = self._map, 0
+        size = 0 if data is None else len(data)
+        while start < size:
+            stop = data.find(b"\n", start) + 1 or size
+            yield data[start:stop]
+            start = stop
+
+    def chunks(self, chunk_size: int = CHUNK_SIZE) -> object:
+        """
+        Yields the file in chunks exposing records(fields).
+
+        Every call starts again from the first record and keeps its own
+        position, so the file can be iterated several times.
+
+        Args:
+            chunk_size: Lines per JSON Lines chunk; binary files yield
+                their row groups as written.
+
+        Raises:
+            ValueError: If a row group runs past the footer, with the
+                byte offset of its header.
+        """
+        if self.binary:
+            offset = len(MAGIC)
+            while offset < self._footer:
+                if offset + GROUP_HEADER.size > self._footer:
+                    raise self._truncated(
+                        f"row group header at byte {offset} overlaps the "
+                        "footer"
+                    )
+                rows, *lengths = GROUP_HEADER.unpack_from(self.view, offset)
+                if offset + GROUP_HEADER.size + sum(lengths) > self._footer:
+                    raise self._truncated(
+                        f"row group at byte {offset} runs past the footer"
+                    )
+                offset += GROUP_HEADER.size
+                yield RecordChunk(self, offset, rows, tuple(lengths))
+                offset += sum(lengths)
+            return
+        lines = (line for line in self._lines() if line.strip())
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                return
+            yield JsonLinesChunk(chunk)
+
+
+def stream_metrics(
+    path: str, query: FusedQuery = DASHBOARD_QUERY,
+    chunk_size: int = CHUNK_SIZE
+) -> dict[str, object]:
+    """
+    Computes the dashboard metrics of a player file chunk by chunk.
+
+    Only the fields the query reads are decoded, and every chunk is
+    folded into the same scan state, so the working memory is one chunk
+    plus the metric values themselves.
+
+    Args:
+        path: A binary record file or a JSON Lines file.
+        query: The metrics to compute.
+        chunk_size: Lines per chunk for JSON Lines input.
+
+    Returns:
+        The metric values keyed by name.
+    """
+    fields = sorted(query.fields())
+    states = None
+    with PlayerReader(path) as reader:
+        for chunk in reader.chunks(chunk_size):
+            states = query.scan(chunk.records(fields), states)
+    return query.collect([] if states is None else [states])
+
+
+def main() -> None:
+    """
+    Streams the dashboard from a player file, or converts JSON Lines.
+
+    Usage: python3 ft_player_loader.py [FILE | convert JSONL RECORDS]
+    Without arguments, the sample players go through both formats.
+    """
+    args = argv[1:]
+    print("=== Streaming Player Loader ===\n")
+    if len(args) not in (0, 1, 3) or (
+        len(args) == 3 and args[0] != "convert"
+    ):
+        print("Usage: python3 ft_player_loader.py "
+              "[FILE | convert JSONL RECORDS]")
+        return
+
+    try:
+        if len(args) == 3:
+            with PlayerReader(args[1]) as reader:
+                items = (pair for chunk in reader.chunks()
+                         for pair in chunk.records())
+                rows = write_records(items, args[2])
+            print(f"Converted {rows} players to '{args[2]}'")
+        elif len(args) == 1:
+            print_dashboard(stream_metrics(args[0]))
+        else:
+            with tempfile.TemporaryDirectory() as folder:
+                jsonl = os.path.join(folder, "players.jsonl")
+                records = os.path.join(folder, "players.bin")
+                write_jsonl(PLAYERS, jsonl)
+                write_records(PLAYERS, records, group_size=4)
+                same = stream_metrics(jsonl) == stream_metrics(records)
+                print_dashboard(stream_metrics(records))
+                print(f"\nJSON Lines and record file agree: {same}")
+    except (KeyError, ValueError, TypeError) as e:
+        print(f"Error: Invalide players data. {e}")
+    except OSError as e:
+        print(f"Error opening the player file. {e}")
+    except Exception as e:
+        print(f"Unexpected error in player loader. {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+import operator
+import sys
+from array import array
+from itertools import compress, repeat
+
+from ft_analytics_dashboard import PLAYERS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+INT_COLUMNS = ("level", "score", "sessions_played")
+
+_FLIP = bytes([1, 0]) + bytes(254)
+
+COMPARATORS = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt,
+    ">=": operator.ge, "==": operator.eq, "!=": operator.ne
+}
+
+
+class PlayerTable:
+    """
+    Columnar store for the dashboard's player records.
+
+    level, score and sessions_played are array('i') columns, region is
+    dictionary-encoded into array('B') codes and achievements are 64-bit
+    masks in array('Q') (a list of ints once the catalog outgrows 64).
+    Filters return row masks as bytes holding one 0/1 byte per row; they
+    are built by C-level map() calls, or by NumPy over zero-copy views of
+    the columns when NumPy is installed.
+    """
+
+    def __init__(self, use_numpy: bool = True) -> None:
+        """
+        Args:
+            use_numpy: Evaluate filters with NumPy when it is installed.
+        """
+        self.use_numpy = use_numpy and np is not None
+        self.names: list[str] = []
+        self.row_of: dict[str, int] = {}
+        self.level = array("i")
+        self.score = array("i")
+        self.sessions_played = array("i")
+        self.region = array("B")
+        self.region_names: list[str] = []
+        self.region_codes: dict[str, int] = {}
+        self.achievements: object = array("Q")
+        self.achievement_names: list[str] = []
+        self.achievement_bits: dict[str, int] = {}
+
+    @classmethod
+    def from_dict(
+        cls, players: dict[str, dict], use_numpy: bool = True
+    ) -> "PlayerTable":
+        """
+        Ingests the {name: {level, score, ...}} dashboard layout.
+
+        Args:
+            players: Player records keyed by name.
+            use_numpy: Evaluate filters with NumPy when it is installed.
+
+        Returns:
+            The populated table.
+        """
+        table = cls(use_numpy)
+        for name, data in players.items():
+            table.append(name, data)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _region_code(self, region: str) -> int:
+        code = self.region_codes.get(region)
+        if code is None:
+            code = len(self.region_names)
+            if code == 256:
+                self.region = array("H", self.region)
+            self.region_codes[region] = code
+            self.region_names.append(region)
+        return code
+
+    def _achievement_mask(self, achievements: object) -> int:
+        mask = 0
+        for name in achievements:
+            bit = self.achievement_bits.get(name)
+            if bit is None:
+                bit = len(self.achievement_names)
+                if bit == 64:
+                    self.achievements = list(self.achievements)
+                self.achievement_bits[name] = bit
+                self.achievement_names.append(name)
+            mask |= 1 << bit
+        return mask
+
+    def append(self, name: str, data: dict) -> None:
+        """
+        Adds one player record.
+
+        Args:
+            name: The player name.
+            data: A record in the dashboard layout.
+
+        Every field is converted before any column grows, so a rejected
+        record leaves the columns aligned.
+
+        Raises:
+            KeyError: If the player already exists or a field is missing.
+            TypeError: If level, score or sessions_played is not an int.
+            OverflowError: If one of them does not fit in 32 bits.
+        """
+        if name in self.row_of:
+            raise KeyError(f"Player '{name}' already exists")
+        level, score, sessions = array("i", (
+            data['level'], data['score'], data['sessions_played']
+        ))
+        region = self._region_code(data['region'])
+        mask = self._achievement_mask(data['achievements'])
+        self.level.append(level)
+        self.score.append(score)
+        self.sessions_played.append(sessions)
+        self.region.append(region)
+        self.achievements.append(mask)
+        self.row_of[name] = len(self.names)
+        self.names.append(name)
+
+    def row(self, name: str) -> dict:
+        """
+        Rebuilds one player's record in the dashboard layout.
+
+        Args:
+            name: The player name.
+
+        Returns:
+            The player's record.
+        """
+        i = self.row_of[name]
+        return {
+            'level': self.level[i],
+            'score': self.score[i],
+            'sessions_played': self.sessions_played[i],
+            'region': self.region_names[self.region[i]],
+            'achievements': self.decode_achievements(self.achievements[i])
+        }
+
+    def decode_achievements(self, mask: int) -> set:
+        """
+        Args:
+            mask: An achievement bitmask of this table.
+
+        Returns:
+            The achievement names it holds.
+        """
+        names = self.achievement_names
+        return {names[bit] for bit in range(mask.bit_length())
+                if mask >> bit & 1}
+
+    def _view(self, column: array) -> object:
+        return np.frombuffer(column, dtype=column.typecode)
+
+    def compare(self, column: str, op: str, value: int) -> bytes:
+        """
+        Evaluates `column op value` for every row.
+
+        Args:
+            column: "level", "score" or "sessions_played".
+            op: One of <, <=, >, >=, ==, !=.
+            value: The right-hand operand.
+
+        Returns:
+            The row mask.
+        """
+        if column not in INT_COLUMNS:
+            raise KeyError(f"Unknown numeric column: '{column}'")
+        compare = COMPARATORS[op]
+        values = getattr(self, column)
+        if self.use_numpy and values:
+            return compare(self._view(values), value).tobytes()
+        return bytes(map(compare, values, repeat(value)))
+
+    def between(self, column: str, low: int, high: int) -> bytes:
+        """
+        Rows where low <= column < high.
+
+        Args:
+            column: A numeric column name.
+            low: Inclusive lower bound.
+            high: Exclusive upper bound.
+
+        Returns:
+            The row mask.
+        """
+        return mask_and(
+            self.compare(column, ">=", low), self.compare(column, "<", high)
+        )
+
+    def region_is(self, region: str) -> bytes:
+        """
+        Args:
+            region: A region name.
+
+        Returns:
+            The mask of rows in that region.
+        """
+        code = self.region_codes.get(region)
+        if code is None:
+            return bytes(len(self))
+        if self.use_numpy and self.region:
+            return (self._view(self.region) == code).tobytes()
+        return bytes(map(code.__eq__, self.region))
+
+    def has_achievement(self, achievement: str) -> bytes:
+        """
+        Args:
+            achievement: An achievement name.
+
+        Returns:
+            The mask of rows holding it.
+        """
+        bit = self.achievement_bits.get(achievement)
+        if bit is None:
+            return bytes(len(self))
+        packed = isinstance(self.achievements, array)
+        if self.use_numpy and packed and self.achievements:
+            bits = self._view(self.achievements) >> np.uint64(bit)
+            return (bits & np.uint64(1)).astype("B").tobytes()
+        flag = 1 << bit
+        return bytes(map(bool, map(flag.__and__, self.achievements)))
+
+    def select(self, column: str, mask: bytes | None = None) -> list:
+        """
+        Reads a column, optionally filtered by a row mask.
+
+        Args:
+            column: "name", a numeric column, "region" or "achievements".
+            mask: Row mask; None keeps every row.
+
+        Returns:
+            The selected values, with regions decoded to names.
+        """
+        if column == "name":
+            values = self.names
+        elif column == "region":
+            values = list(map(self.region_names.__getitem__, self.region))
+        else:
+            values = getattr(self, column)
+        if mask is None:
+            return list(values)
+        return list(compress(values, mask))
+
+    def level_buckets(self) -> dict[str, int]:
+        """
+        Returns:
+            The dashboard's high (>= 30), medium (20-29) and low (< 20)
+            level counts.
+        """
+        high = count(self.compare("level", ">=", 30))
+        low = count(self.compare("level", "<", 20))
+        return {"high": high, "medium": len(self) - high - low, "low": low}
+
+    def achievement_counts(self) -> list[int]:
+        """
+        Returns:
+            The number of achievements of every row, by popcount.
+        """
+        return [mask.bit_count() for mask in self.achievements]
+
+    def memory_bytes(self) -> int:
+        """
+        Returns:
+            Approximate size of the columns, names included.
+        """
+        size = sum(sys.getsizeof(getattr(self, column))
+                   for column in (*INT_COLUMNS, "region", "achievements"))
+        size += sys.getsizeof(self.names) + sys.getsizeof(self.row_of)
+        return size + sum(map(sys.getsizeof, self.names))
+
+
+def count(mask: bytes) -> int:
+    """
+    Args:
+        mask: A row mask.
+
+    Returns:
+        How many rows it selects.
+    """
+    return mask.count(1)
+
+
+def mask_and(left: bytes, right: bytes) -> bytes:
+    """Rows selected by both masks."""
+    size = len(left)
+    return (int.from_bytes(left, "little")
+            & int.from_bytes(right, "little")).to_bytes(size, "little")
+
+
+def mask_or(left: bytes, right: bytes) -> bytes:
+    """Rows selected by either mask."""
+    size = len(left)
+    return (int.from_bytes(left, "little")
+            | int.from_bytes(right, "little")).to_bytes(size, "little")
+
+
+def mask_not(mask: bytes) -> bytes:
+    """Rows not selected by the mask."""
+    return mask.translate(_FLIP)
+
+
+def main() -> None:
+    """Runs the dashboard filters on the columnar store."""
+    print("=== Columnar Player Table ===\n")
+
+    try:
+        table = PlayerTable.from_dict(PLAYERS)
+        high = table.compare("score", ">", 2000)
+        active = table.compare("sessions_played", ">", 40)
+        print("High scorers (+2000):", table.select("score", high))
+        print("Active players:", table.select("name", active))
+        print("Active high scorers:",
+              table.select("name", mask_and(high, active)))
+        print(f"Score categories: {table.level_buckets()}")
+        print("North players:",
+              table.select("name", table.region_is("north")))
+        print(f"Column memory: {table.memory_bytes()} bytes")
+    except (KeyError, ValueError) as e:
+        print(f"Error: Invalide players data. {e}")
+    except Exception as e:
+        print(f"Unexpected error in player table. {e}")
+
+
+if __name__ == "__main__":
+    main()
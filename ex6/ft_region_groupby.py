@@ -0,0 +1,225 @@
+from array import array
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from ft_analytics_dashboard import PLAYERS
+
+
+ACTIVE_SESSIONS = 40
+
+
+class RegionStats:
+    """
+    Mergeable partial aggregate of the players of one region.
+
+    Every field combines associatively (sums, max, counters), so states
+    computed on separate partitions merge into the state of their union.
+    """
+
+    __slots__ = ("count", "score_sum", "score_max", "active", "levels")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.score_sum = 0
+        self.score_max: int | None = None
+        self.active = 0
+        self.levels: Counter = Counter()
+
+    @classmethod
+    def from_rows(
+        cls, levels: tuple, scores: tuple, sessions: tuple,
+        active_sessions: int = ACTIVE_SESSIONS
+    ) -> "RegionStats":
+        """
+        Aggregates the columns of one region's rows.
+
+        Args:
+            levels: Player levels.
+            scores: Player scores.
+            sessions: Sessions played.
+            active_sessions: Sessions above which a player is active.
+
+        Returns:
+            The region's state.
+        """
+        stats = cls()
+        stats.count = len(scores)
+        stats.score_sum = sum(scores)
+        stats.score_max = max(scores, default=None)
+        stats.active = sum(1 for played in sessions
+                           if played > active_sessions)
+        stats.levels = Counter(levels)
+        return stats
+
+    def merge(self, other: "RegionStats") -> "RegionStats":
+        """Adds another partial state of the same region into this one."""
+        self.count += other.count
+        self.score_sum += other.score_sum
+        if other.score_max is not None and (
+            self.score_max is None or other.score_max > self.score_max
+        ):
+            self.score_max = other.score_max
+        self.active += other.active
+        self.levels.update(other.levels)
+        return self
+
+    @property
+    def score_mean(self) -> float:
+        return self.score_sum / self.count if self.count else 0.0
+
+    def level_buckets(self) -> dict[str, int]:
+        """
+        Returns:
+            The dashboard's high (>= 30), medium (20-29) and low (< 20)
+            level counts for this region.
+        """
+        buckets = {"high": 0, "medium": 0, "low": 0}
+        for level, count in self.levels.items():
+            if level >= 30:
+                buckets["high"] += count
+            elif level >= 20:
+                buckets["medium"] += count
+            else:
+                buckets["low"] += count
+        return buckets
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "players": self.count,
+            "score_sum": self.score_sum,
+            "score_mean": round(self.score_mean, 2),
+            "score_max": self.score_max,
+            "active": self.active,
+            "levels": self.level_buckets()
+        }
+
+
+def _to_columns(items: list[tuple[str, dict]]) -> tuple:
+    """Packs a chunk of players into compact columns for a worker."""
+    return (
+        [record['region'] for _, record in items],
+        array("i", [record['level'] for _, record in items]),
+        array("i", [record['score'] for _, record in items]),
+        array("i", [record['sessions_played'] for _, record in items])
+    )
+
+
+def aggregate_chunk(
+    job: tuple, active_sessions: int = ACTIVE_SESSIONS
+) -> dict[str, RegionStats]:
+    """
+    Worker entry point: groups one chunk of player columns by region.
+
+    Args:
+        job: (regions, levels, scores, sessions) columns.
+        active_sessions: Sessions above which a player is active.
+
+    Returns:
+        A partial state per region present in the chunk.
+    """
+    regions, levels, scores, sessions = job
+    grouped: dict[str, list] = {}
+    for row in zip(regions, levels, scores, sessions):
+        rows = grouped.get(row[0])
+        if rows is None:
+            rows = grouped[row[0]] = []
+        rows.append(row)
+    return {
+        region: RegionStats.from_rows(*list(zip(*rows))[1:], active_sessions)
+        for region, rows in grouped.items()
+    }
+
+
+def merge_partials(partials: object) -> dict[str, RegionStats]:
+    """
+    Merges per-chunk states into one state per region.
+
+    Args:
+        partials: Iterable of {region: RegionStats} dicts, in any order.
+
+    Returns:
+        The merged states, sorted by region.
+    """
+    merged: dict[str, RegionStats] = {}
+    for partial in partials:
+        for region, stats in partial.items():
+            if region in merged:
+                merged[region].merge(stats)
+            else:
+                merged[region] = stats
+    return dict(sorted(merged.items()))
+
+
+def _pooled_partials(jobs: object, workers: int) -> object:
+    """
+    Yields aggregate_chunk() results from a process pool as they finish.
+
+    At most two tasks per worker are in flight, so the next chunks are
+    packed while the workers aggregate the previous ones instead of the
+    whole table being packed up front.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for job in jobs:
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(pool.submit(aggregate_chunk, job))
+        for future in pending:
+            yield future.result()
+
+
+def group_by_region(
+    players: dict[str, dict], workers: int = 1, chunk_size: int = 100_000
+) -> dict[str, RegionStats]:
+    """
+    Per-region score sum/mean/max, level distribution and active counts.
+
+    Players are cut into chunks of chunk_size rows, packed as columns and
+    aggregated by a process pool; partitioning on region alone would cap
+    the parallelism at the number of regions. The partial state of every
+    chunk is folded into the result as soon as its worker returns it.
+
+    Args:
+        players: Player records keyed by name.
+        workers: Number of processes; 1 aggregates in-process.
+        chunk_size: Players per task.
+
+    Returns:
+        The state of every region, sorted by region.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    items = iter(players.items())
+    jobs = (_to_columns(chunk) for chunk in
+            iter(lambda: list(islice(items, chunk_size)), []))
+    if workers <= 1:
+        return merge_partials(map(aggregate_chunk, jobs))
+    return merge_partials(_pooled_partials(jobs, workers))
+
+
+def print_region_report(stats: dict[str, RegionStats]) -> None:
+    """Prints one line per region."""
+    for region, state in stats.items():
+        print(f"{region:<8} players {state.count:<6} "
+              f"score mean {state.score_mean:<9.1f} "
+              f"max {state.score_max:<6} active {state.active:<5} "
+              f"levels {state.level_buckets()}")
+
+
+def main() -> None:
+    """Prints the per-region breakdown of the sample players."""
+    print("=== Players by Region ===\n")
+
+    try:
+        print_region_report(group_by_region(PLAYERS))
+    except (KeyError, ValueError, TypeError) as e:
+        print(f"Error: Invalide players data. {e}")
+    except Exception as e:
+        print(f"Unexpected error in region breakdown. {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import os
+import sys
+from random import Random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex3"))
+
+from ft_achievement_bitset import (  # noqa: E402
+    AchievementRegistry, BitsetTracker
+)
+
+
+def random_players(count: int, catalog: int, seed: int) -> dict[str, set]:
+    rng = Random(seed)
+    names = [f"Achievement {i}" for i in range(catalog)]
+    return {f"player{i}": set(rng.sample(names, rng.randrange(catalog)))
+            for i in range(count)}
+
+
+def brute_force(players: dict[str, set]) -> tuple[set, set, set]:
+    holders: dict[str, int] = {}
+    for achievements in players.values():
+        for name in achievements:
+            holders[name] = holders.get(name, 0) + 1
+    return (set(holders),
+            {name for name, n in holders.items() if n == len(players)},
+            {name for name, n in holders.items() if n == 1})
+
+
+@pytest.mark.parametrize("catalog", [20, 64, 150])
+def test_set_analytics_match_brute_force(catalog: int) -> None:
+    players = random_players(40, catalog, catalog)
+    players["everyone"] = {"Shared"}
+    for achievements in players.values():
+        achievements.add("Shared")
+    tracker = BitsetTracker.from_sets(players)
+    assert (tracker.all_unique(), tracker.common_to_all(), tracker.rare()) \
+        == brute_force(players)
+    for name, achievements in players.items():
+        assert tracker.registry.decode(tracker.mask(name)) == achievements
+        assert tracker.count(name) == len(achievements)
+    p1, p2 = players["player1"], players["player2"]
+    assert tracker.diff("player1", "player2") == (p1 & p2, p1 - p2, p2 - p1)
+
+
+def test_rows_widen_as_the_catalog_grows() -> None:
+    players = random_players(30, 200, 3)
+    tracker = BitsetTracker()
+    for name, achievements in players.items():
+        tracker.add_player(name, sorted(achievements))
+    assert tracker.words == 4
+    players["player0"] = {"Achievement 3", "Late Arrival"}
+    tracker.add_player("player0", players["player0"])
+    assert len(tracker) == 30
+    for name, achievements in players.items():
+        assert tracker.registry.decode(tracker.mask(name)) == achievements
+    assert (tracker.all_unique(), tracker.common_to_all(), tracker.rare()) \
+        == brute_force(players)
+
+
+def test_empty_tracker_and_lookup_encoding() -> None:
+    tracker = BitsetTracker()
+    assert tracker.all_unique() == tracker.common_to_all() == set()
+    registry = AchievementRegistry(["A", "B"])
+    assert registry.encode(["B", "Z"], register=False) == 0b10
+    assert len(registry) == 2
+    assert registry.encode(["Z"]) == 0b100
@@ -0,0 +1,65 @@
+import os
+import sys
+from random import Random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex3"))
+
+from ft_achievement_index import AchievementIndex  # noqa: E402
+from ft_achievement_tracker import (  # noqa: E402
+    get_all_unique_achievements, get_common_to_all
+)
+
+
+def recount(players: dict[str, set], k: int) -> set:
+    holders: dict[str, int] = {}
+    for achievements in players.values():
+        for name in achievements:
+            holders[name] = holders.get(name, 0) + 1
+    return {name for name, n in holders.items() if n == k}
+
+
+def assert_consistent(index: AchievementIndex, players: dict) -> None:
+    assert index.all_unique() == get_all_unique_achievements(players)
+    assert index.total_unique() == len(index.all_unique())
+    assert index.common_to_all() == get_common_to_all(players)
+    for k in range(1, len(players) + 1):
+        assert index.held_by_exactly(k) == recount(players, k)
+
+
+def test_random_mutations_keep_the_counts_exact() -> None:
+    rng = Random(12)
+    catalog = [f"Achievement {i}" for i in range(15)]
+    players = {f"player{i}": set(rng.sample(catalog, 5)) for i in range(6)}
+    index = AchievementIndex({name: set(ach) for name, ach in players.items()})
+    assert_consistent(index, players)
+    for step in range(400):
+        name = rng.choice(sorted(players))
+        achievement = rng.choice(catalog)
+        action = rng.randrange(4)
+        if action == 0:
+            assert index.grant(name, achievement) \
+                == (achievement not in players[name])
+            players[name].add(achievement)
+        elif action == 1:
+            assert index.revoke(name, achievement) \
+                == (achievement in players[name])
+            players[name].discard(achievement)
+        elif action == 2 and len(players) > 1:
+            assert index.remove_player(name) == players.pop(name)
+        else:
+            new = f"newcomer{step}"
+            players[new] = set(rng.sample(catalog, 3))
+            index.add_player(new, players[new])
+        assert_consistent(index, players)
+    assert len(index) == len(players)
+
+
+def test_duplicate_player_and_empty_index() -> None:
+    index = AchievementIndex()
+    assert index.common_to_all() == index.rare() == set()
+    index.add_player("Alice", ["A"])
+    with pytest.raises(KeyError):
+        index.add_player("Alice")
+    assert index.common_to_all() == index.rare() == {"A"}
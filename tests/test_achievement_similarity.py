@@ -0,0 +1,62 @@
+import os
+import sys
+from random import Random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex3"))
+
+from ft_achievement_similarity import (  # noqa: E402
+    SimilarityIndex, jaccard
+)
+
+
+def make_players(n: int, seed: int) -> dict[str, set]:
+    rng = Random(seed)
+    names = [f"ach_{i}" for i in range(120)]
+    bases = [set(rng.sample(names, rng.randint(6, 16))) for _ in range(40)]
+    players = {}
+    for i in range(n):
+        achievements = set(rng.choice(bases))
+        for _ in range(rng.randint(0, 2)):
+            achievements.discard(rng.choice(names))
+            achievements.add(rng.choice(names))
+        players[f"player_{i}"] = achievements
+    return players
+
+
+def test_lsh_recall_against_brute_force() -> None:
+    players = make_players(3000, 1)
+    index = SimilarityIndex(num_perm=64, bands=16)
+    index.add_many(players)
+    hits = wanted = 0
+    for name in list(players)[:100]:
+        exact = index.brute_force(name, 5)
+        approx = index.query(name, 5)
+        floor = exact[-1][1]
+        hits += min(len(exact),
+                    sum(1 for _, similarity in approx if similarity >= floor))
+        wanted += len(exact)
+    assert hits / wanted >= 0.9
+
+
+def test_brute_force_scores_are_exact_jaccard() -> None:
+    players = make_players(300, 2)
+    index = SimilarityIndex()
+    index.add_many(players)
+    for name, similarity in index.brute_force("player_0", 10):
+        assert similarity == jaccard(players["player_0"], players[name])
+
+
+def test_queries_do_not_grow_the_registry() -> None:
+    players = make_players(200, 3)
+    index = SimilarityIndex()
+    index.add_many(players)
+    names = list(index.registry.names)
+    probe = set(players["player_1"]) | {"unknown_a", "unknown_b"}
+    approx = index.query(probe, 3)
+    exact = index.brute_force(probe, 3)
+    assert index.registry.names == names
+    assert "unknown_a" not in index.hasher._vectors
+    for name, similarity in approx + exact:
+        assert similarity == jaccard(probe, players[name])
+    index.add("newcomer", {"unknown_a"})
+    assert index.registry.names == names + ["unknown_a"]
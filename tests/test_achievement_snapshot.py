@@ -0,0 +1,59 @@
+import os
+import sys
+import warnings
+from random import Random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex3"))
+
+from ft_achievement_bitset import BitsetTracker  # noqa: E402
+from ft_achievement_snapshot import (  # noqa: E402
+    load_snapshot, save_snapshot
+)
+
+
+def random_tracker(catalog: int, seed: int) -> BitsetTracker:
+    rng = Random(seed)
+    names = [f"Achievement {i}" for i in range(catalog)] + ["Zoë's Ünïcode"]
+    players = {f"{rng.choice('ZAMé')}player{i}": set(rng.sample(names, 9))
+               for i in range(50)}
+    return BitsetTracker.from_sets(players)
+
+
+@pytest.mark.parametrize("catalog", [10, 130])
+def test_snapshot_round_trips(tmp_path: object, catalog: int) -> None:
+    tracker = random_tracker(catalog, catalog)
+    path = str(tmp_path / "snapshot.bin")
+    assert save_snapshot(tracker, path) == os.path.getsize(path)
+    with load_snapshot(path) as snapshot:
+        assert len(snapshot) == len(tracker)
+        assert list(snapshot.players) == tracker.players
+        assert snapshot.registry.names == tracker.registry.names
+        for name in tracker.players:
+            assert name in snapshot.index
+            assert snapshot.mask(name) == tracker.mask(name)
+        assert "nobody" not in snapshot.index
+        with pytest.raises(KeyError):
+            snapshot.mask("nobody")
+        assert snapshot.all_unique() == tracker.all_unique()
+        assert snapshot.common_to_all() == tracker.common_to_all()
+        assert snapshot.rare() == tracker.rare()
+        with pytest.raises(TypeError):
+            snapshot.add_player("new", ["Achievement 1"])
+        copy = snapshot.to_tracker()
+    copy.add_player("new", ["Brand New"])
+    assert copy.rare_mask() == tracker.rare_mask() | copy.mask("new")
+
+
+def test_invalid_snapshots_are_rejected(tmp_path: object) -> None:
+    path = tmp_path / "snapshot.bin"
+    save_snapshot(random_tracker(10, 1), str(path))
+    data = path.read_bytes()
+    broken = [b"", b"FTACHSN1", b"X" * len(data), data[:-8]]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        for content in broken:
+            path.write_bytes(content)
+            with pytest.raises(ValueError):
+                load_snapshot(str(path))
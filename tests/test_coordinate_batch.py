@@ -0,0 +1,83 @@
+import os
+import sys
+from random import Random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex2"))
+
+from ft_coordinate_batch import (  # noqa: E402
+    distances_from, nearest, pack_positions, pairwise_blocks,
+    squared_distances_from
+)
+from ft_coordinate_system import calculating_distance  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def make_positions(n: int, span: int, seed: int) -> list[tuple]:
+    rng = Random(seed)
+    return [tuple(rng.randint(-span, span) for _ in range(3))
+            for _ in range(n)]
+
+
+def formats(positions: list[tuple]) -> list:
+    found = [positions, pack_positions(positions)]
+    if np is not None:
+        found.append(np.array(positions, dtype=np.int32).reshape(-1, 3))
+    return found
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("span", [1000, 1 << 30])
+def test_distances_equal_calculating_distance(
+    use_numpy: bool, span: int
+) -> None:
+    origin = (17, -3, 250)
+    positions = make_positions(500, span, span)
+    expected = [calculating_distance(origin, p) for p in positions]
+    squared = [sum((a - b) ** 2 for a, b in zip(origin, p))
+               for p in positions]
+    for batch in formats(positions):
+        assert list(map(float, distances_from(origin, batch, use_numpy))) \
+            == expected
+        assert list(map(int, squared_distances_from(
+            origin, batch, use_numpy))) == squared
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_pairwise_blocks_and_nearest_match_brute_force(
+    use_numpy: bool
+) -> None:
+    first = make_positions(60, 50, 1)
+    second = make_positions(45, 50, 2) + [(0, 0, 0), (0, 0, 0)]
+    seen = []
+    for start, block in pairwise_blocks(first, second, block_bytes=2000,
+                                        use_numpy=use_numpy):
+        assert start == len(seen)
+        seen.extend(list(map(float, row)) for row in block)
+    assert seen == [[calculating_distance(a, b) for b in second]
+                    for a in first]
+    indices, distances = nearest(pack_positions(first), second,
+                                 block_bytes=2000, use_numpy=use_numpy)
+    for point, index, distance in zip(first, indices, distances):
+        row = [calculating_distance(point, b) for b in second]
+        assert index == row.index(min(row))
+        assert distance == min(row)
+
+
+def test_huge_squares_stay_exact() -> None:
+    far = [(-(1 << 31), -(1 << 31), -(1 << 31))]
+    origin = ((1 << 31) - 1,) * 3
+    squared = squared_distances_from(origin, far)
+    assert list(squared) == [3 * ((1 << 32) - 1) ** 2]
+
+
+def test_malformed_positions_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        pack_positions([(1, 2)])
+    with pytest.raises(ValueError):
+        distances_from((0, 0, 0), pack_positions([(1, 2, 3)])[:2])
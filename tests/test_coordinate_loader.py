@@ -0,0 +1,85 @@
+import os
+import sys
+from random import Random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex2"))
+
+import ft_coordinate_loader  # noqa: E402
+from ft_coordinate_loader import (  # noqa: E402
+    PARSE_ERROR, load_positions, parse_position
+)
+
+BAD_LINES = ["abc,def,ghi", "1,2", "1,2,3,4", "0,0,9999999999", "1-2,3,4",
+             "-,1,2", "1,,3", "7,8,9x"]
+ODD_LINES = ["", "   ", " 4, 5 ,6", "+5,-0,12", "1,2,3\r", "-2147483648,0,0"]
+
+
+def make_lines(n: int, seed: int, bad: bool) -> list[str]:
+    rng = Random(seed)
+    lines = []
+    for _ in range(n):
+        if bad and rng.random() < 0.05:
+            lines.append(rng.choice(BAD_LINES + ODD_LINES))
+        else:
+            lines.append(",".join(str(rng.randint(-(1 << 31), (1 << 31) - 1))
+                                  for _ in range(3)))
+    return lines
+
+
+def reference(lines: list[str]) -> tuple[list[tuple], list[int]]:
+    positions, errors = [], []
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            position = parse_position(line)
+        except ValueError:
+            errors.append(number)
+            continue
+        if all(-(1 << 31) <= value < (1 << 31) for value in position):
+            positions.append(position)
+        else:
+            errors.append(number)
+    return positions, errors
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("bad", [False, True])
+def test_loader_matches_line_by_line_parsing(
+    tmp_path: object, monkeypatch: object, use_numpy: bool, bad: bool
+) -> None:
+    if not use_numpy:
+        monkeypatch.setattr(ft_coordinate_loader, "np", None)
+    lines = make_lines(3000, 2 + bad, bad)
+    path = tmp_path / "positions.txt"
+    path.write_text("\n".join(lines) + "\n")
+    positions, errors = reference(lines)
+    for chunk_size, use_mmap in ((1 << 20, True), (333, True), (50, False)):
+        batch = load_positions(str(path), chunk_size=chunk_size,
+                               use_mmap=use_mmap)
+        assert batch.lines == len(lines)
+        assert list(batch.positions()) == positions
+        assert [number for number, _ in batch.errors] == errors
+        packed = batch.packed()
+        assert list(zip(packed[0::3], packed[1::3], packed[2::3])) \
+            == positions
+
+
+def test_errors_carry_line_numbers(tmp_path: object) -> None:
+    path = tmp_path / "positions.txt"
+    path.write_text("10,20,5\n3,4,0\nabc,def,ghi\n\n-7,2,9\n1,2\n"
+                    "0,0,9999999999")
+    batch = load_positions(str(path), chunk_size=4, use_mmap=False)
+    assert list(batch.positions()) == [(10, 20, 5), (3, 4, 0), (-7, 2, 9)]
+    assert [number for number, _ in batch.errors] == [3, 6, 7]
+    assert "Coordinate out of int32 range" in batch.errors[2][1]
+    path.write_text("")
+    assert len(load_positions(str(path))) == 0
+
+
+def test_parse_position_accepts_str_and_bytes() -> None:
+    assert parse_position("1,-2,3") == parse_position(b"1,-2,3") == (1, -2, 3)
+    with pytest.raises(ValueError, match=PARSE_ERROR):
+        parse_position("1,2")
@@ -0,0 +1,49 @@
+import os
+import sys
+from random import Random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex6"))
+
+from ft_analytics_dashboard import (  # noqa: E402
+    DASHBOARD_QUERY, PLAYERS, dashboard_metrics
+)
+import ft_dashboard_query  # noqa: E402
+
+REGIONS = ("north", "east", "central", "west")
+
+
+def make_players(n: int, seed: int) -> dict[str, dict]:
+    rng = Random(seed)
+    return {
+        f"player_{i}": {
+            'level': rng.randrange(1, 60),
+            'score': rng.randrange(10_000),
+            'sessions_played': rng.randrange(100),
+            'region': rng.choice(REGIONS),
+            'achievements': {f"ach_{rng.randrange(30)}"
+                             for _ in range(rng.randrange(6))}
+        }
+        for i in range(n)
+    }
+
+
+def test_fused_query_matches_comprehensions() -> None:
+    assert DASHBOARD_QUERY.run(PLAYERS) == dashboard_metrics(PLAYERS)
+    players = make_players(5000, 1)
+    assert DASHBOARD_QUERY.run(players) == dashboard_metrics(players)
+
+
+def test_chunked_scans_fold_into_one_state(monkeypatch: object) -> None:
+    monkeypatch.setattr(ft_dashboard_query, "SCAN_CHUNK", 7)
+    players = make_players(500, 2)
+    items = list(players.items())
+    states = DASHBOARD_QUERY.scan(items[:123])
+    states = DASHBOARD_QUERY.scan(items[123:], states)
+    assert DASHBOARD_QUERY.collect([states]) == dashboard_metrics(players)
+    partials = [DASHBOARD_QUERY.scan(items[:250]),
+                DASHBOARD_QUERY.scan(items[250:])]
+    assert DASHBOARD_QUERY.collect(partials) == dashboard_metrics(players)
+
+
+def test_empty_scan_gives_empty_metrics() -> None:
+    assert DASHBOARD_QUERY.run({}) == dashboard_metrics({})
@@ -0,0 +1,75 @@
+import os
+import sys
+from random import Random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex6"))
+
+from ft_analytics_dashboard import PLAYERS, dashboard_metrics  # noqa: E402
+from ft_dashboard_views import DashboardViews, PlayerStore  # noqa: E402
+
+REGIONS = ("north", "east", "central", "west")
+
+
+def make_record(rng: Random) -> dict:
+    return {
+        'level': rng.randrange(1, 60),
+        'score': rng.randrange(10_000),
+        'sessions_played': rng.randrange(100),
+        'region': rng.choice(REGIONS),
+        'achievements': {f"ach_{rng.randrange(30)}"
+                         for _ in range(rng.randrange(6))}
+    }
+
+
+def mutate(store: PlayerStore, rng: Random, step: int) -> None:
+    name = rng.choice(sorted(store.players))
+    action = rng.randrange(4)
+    if action == 0 and len(store) > 1:
+        store.delete(name)
+    elif action == 1:
+        store.insert(f"new_{step}", make_record(rng))
+    elif action == 2:
+        store.update(name, {'score': rng.randrange(10_000),
+                            'sessions_played': rng.randrange(100)})
+    else:
+        record = make_record(rng)
+        store.update(name, {field: record[field] for field in
+                            rng.sample(sorted(record), 2)})
+
+
+def test_refresh_matches_a_full_recompute() -> None:
+    rng = Random(6)
+    store = PlayerStore({f"player_{i}": make_record(rng) for i in range(300)})
+    views = DashboardViews(store)
+    assert views.metrics() == dashboard_metrics(store.players)
+    step = 0
+    for batch in (1, 1, 5, 40, 200):
+        for _ in range(batch):
+            mutate(store, rng, step)
+            step += 1
+        assert views.metrics() == dashboard_metrics(store.players)
+        assert views.last_refresh[0] == batch
+    assert store.log.entries == []
+
+
+def test_readers_survive_compaction_and_invalidation() -> None:
+    rng = Random(2)
+    store = PlayerStore(PLAYERS)
+    first, second = DashboardViews(store), DashboardViews(store)
+    second.refresh(compact=False)
+    for step in range(30):
+        mutate(store, rng, step)
+    assert second.refresh(compact=False) == 30
+    assert first.metrics() == dashboard_metrics(store.players)
+    mutate(store, rng, 30)
+    assert first.refresh() == 1
+    assert second.refresh() == 0
+    assert second.metrics() == dashboard_metrics(store.players)
+
+    first.invalidate("high_score")
+    store.update(next(iter(store.players)), {'score': 9999})
+    assert first.metrics() == dashboard_metrics(store.players)
+    with pytest.raises(KeyError):
+        first.invalidate("missing")
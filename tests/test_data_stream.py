@@ -0,0 +1,81 @@
+import os
+import sys
+from itertools import islice
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex5"))
+
+import ft_data_stream  # noqa: E402
+from ft_data_stream import (  # noqa: E402
+    count_lol_events, count_lol_events_parallel, fib_nth, fibonacci_gen,
+    lol_event_generator, prime_gen, primes_below, shard_plan
+)
+
+WINDOW = 8
+
+
+def shard_events(event_num: int, seed: int) -> list[tuple]:
+    return list(islice(lol_event_generator(seed), event_num))
+
+
+def test_shards_share_no_event_subsequence() -> None:
+    shards = [shard_events(size, seed)
+              for size, seed, _ in shard_plan(4000, 8, seed=42)]
+    seen: dict[tuple, int] = {}
+    for number, events in enumerate(shards):
+        for i in range(len(events) - WINDOW + 1):
+            window = tuple(events[i:i + WINDOW])
+            assert seen.setdefault(window, number) == number
+
+
+def test_shards_tile_the_master_stream() -> None:
+    plan = shard_plan(1001, 6, seed=7)
+    joined = [event for size, seed, _ in plan
+              for event in shard_events(size, seed)]
+    assert joined == shard_events(1001, 7)
+
+
+def test_parallel_count_matches_single_stream() -> None:
+    expected = count_lol_events(20001, seed=3)
+    for workers in (2, 5):
+        assert count_lol_events_parallel(20001, workers, seed=3) == expected
+
+
+def is_prime(n: int) -> bool:
+    return n >= 2 and all(n % d for d in range(2, int(n ** 0.5) + 1))
+
+
+def test_sieve_matches_trial_division(monkeypatch: object) -> None:
+    expected = [n for n in range(5000) if is_prime(n)]
+    assert primes_below(5000) == expected
+    assert list(prime_gen(len(expected))) == expected
+    monkeypatch.setattr(ft_data_stream, "SIEVE_SEGMENT_SIZE", 7)
+    for bound in (0, 2, 3, 4, 30, 31, 32, 1009, 5000):
+        assert primes_below(bound) == [p for p in expected if p < bound]
+    assert list(prime_gen(0)) == []
+    assert list(prime_gen(400)) == expected[:400]
+
+
+def iterative_fibonacci(count: int) -> list[int]:
+    numbers, a, b = [], 0, 1
+    for _ in range(count):
+        numbers.append(a)
+        a, b = b, a + b
+    return numbers
+
+
+def test_fibonacci_random_access_matches_iteration() -> None:
+    expected = iterative_fibonacci(1500)
+    assert [fib_nth(n) for n in range(1500)] == expected
+    assert list(fibonacci_gen(1500)) == expected
+    assert list(fibonacci_gen(0)) == []
+    for start, stop in ((0, 10), (7, 8), (500, 1500), (1499, 1499)):
+        assert list(fibonacci_gen(start, stop)) == expected[start:stop]
+
+
+def test_fibonacci_rejects_negative_indexes() -> None:
+    with pytest.raises(ValueError):
+        fib_nth(-1)
+    with pytest.raises(ValueError):
+        list(fibonacci_gen(-3, 4))
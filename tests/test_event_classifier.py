@@ -0,0 +1,80 @@
+import os
+import re
+import sys
+from array import array
+from random import Random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex5"))
+
+from ft_data_stream import LOL_EVENTS  # noqa: E402
+from ft_event_classifier import EventClassifier  # noqa: E402
+
+
+def reference_counter(levels: list[int], events: list[str]) -> dict:
+    counter = {"High-level": 0, "Kill": 0, "Destroyed": 0}
+    for level, event in zip(levels, events):
+        if level > 10:
+            counter["High-level"] += 1
+        elif "Kill" in event:
+            counter["Kill"] += 1
+        elif "Destroyed" in event:
+            counter["Destroyed"] += 1
+    return counter
+
+
+def random_batch(size: int, seed: int) -> tuple[list[int], list[str]]:
+    rng = Random(seed)
+    return ([rng.randrange(1, 19) for _ in range(size)],
+            [rng.choice(LOL_EVENTS) for _ in range(size)])
+
+
+def test_byte_and_loop_paths_match_the_elif_chain() -> None:
+    levels, events = random_batch(3000, 5)
+    expected = reference_counter(levels, events)
+    classifier = EventClassifier(LOL_EVENTS)
+    codes = classifier.encode(events)
+
+    by_bytes = classifier.new_counter()
+    classifier.tally_codes(
+        by_bytes, array("B", levels), array("B", codes)
+    )
+    by_loop = classifier.new_counter()
+    classifier.tally_codes(by_loop, levels, codes)
+    by_name = classifier.new_counter()
+    classifier.tally(by_name, levels, events)
+    assert by_bytes == by_loop == by_name == expected
+
+
+def test_wide_codes_use_the_loop_path() -> None:
+    classifier = EventClassifier([f"Filler {i}" for i in range(300)])
+    levels, events = random_batch(500, 8)
+    counter = classifier.new_counter()
+    classifier.tally(counter, array("B", levels), events)
+    assert classifier.encode(events).typecode == "H"
+    assert counter == reference_counter(levels, events)
+
+
+def test_custom_rules_match_in_order() -> None:
+    classifier = EventClassifier(rules=[
+        ("Objective", re.compile(r"(Dragon|Baron Nashor) Slain")),
+        ("Result", {"Victory", "Defeat"}),
+        ("Kill", "Kill"),
+    ], high_level=15)
+    assert classifier.category(3, "Baron Nashor Slain") == "Objective"
+    assert classifier.category(3, "Defeat") == "Result"
+    assert classifier.category(3, "Penta Kill") == "Kill"
+    assert classifier.category(3, "Rift Herald Slain") is None
+    assert classifier.category(16, "Victory") == "High-level"
+    counter = classifier.new_counter()
+    classifier.tally(
+        counter, [1, 2, 15, 16], ["Victory", "Dragon Slain", "Ace", "Ace"]
+    )
+    assert counter == {"High-level": 1, "Objective": 1, "Result": 1,
+                       "Kill": 0}
+
+
+def test_reserved_category_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        EventClassifier(rules=[("High-level", "Godlike")])
@@ -0,0 +1,102 @@
+import os
+import sys
+from random import Random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex6"))
+
+from ft_player_indexes import IndexedPlayers, _matches  # noqa: E402
+
+REGIONS = ("north", "east", "central", "west")
+
+
+def make_record(rng: Random) -> dict:
+    return {
+        'level': rng.randrange(1, 60),
+        'score': rng.randrange(10_000),
+        'sessions_played': rng.randrange(100),
+        'region': rng.choice(REGIONS),
+        'achievements': {f"ach_{rng.randrange(30)}"
+                         for _ in range(rng.randrange(6))}
+    }
+
+
+def random_filters(rng: Random) -> list:
+    choices = [
+        ("score", rng.choice(("<", "<=", ">", ">=", "==")),
+         rng.randrange(10_000)),
+        ("level", "between", tuple(sorted(rng.sample(range(60), 2)))),
+        ("level", ">", rng.randrange(60) + 0.5),
+        ("region", "==", rng.choice(REGIONS)),
+        ("region", "in", set(rng.sample(REGIONS, 2))),
+        ("region", "!=", rng.choice(REGIONS)),
+        ("achievements", "contains", f"ach_{rng.randrange(30)}"),
+        ("sessions_played", "<", rng.randrange(100)),
+    ]
+    return rng.sample(choices, rng.randrange(1, 4))
+
+
+def scan(players: dict[str, dict], filters: list) -> set:
+    return {name for name, record in players.items()
+            if all(_matches(record, *f) for f in filters)}
+
+
+def test_queries_match_a_scan_across_mutations() -> None:
+    rng = Random(3)
+    players = {f"player_{i}": make_record(rng) for i in range(800)}
+    store = IndexedPlayers(players)
+    planned = 0
+    for step in range(300):
+        filters = random_filters(rng)
+        assert store.query(filters) == scan(players, filters)
+        planned += store.plan(filters)[0] is not None
+        name = rng.choice(sorted(players))
+        action = rng.randrange(3)
+        if action == 0:
+            changes = make_record(rng)
+            del changes['sessions_played']
+            store.update(name, changes)
+            players[name].update(changes)
+        elif action == 1:
+            assert store.delete(name) == players.pop(name)
+        else:
+            players[f"new_{step}"] = make_record(rng)
+            store.insert(f"new_{step}", players[f"new_{step}"])
+    assert len(store) == len(players)
+    assert planned > 50
+    assert len(store.records) < 800 + 100
+
+
+@pytest.mark.parametrize("changes, error", [
+    ({'level': 12.5}, TypeError),
+    ({'score': 1 << 40}, ValueError),
+    ({'region': ["north"]}, TypeError),
+    ({'score': 50, 'achievements': [["nested"]]}, TypeError),
+])
+def test_rejected_update_leaves_indexes_intact(
+    changes: dict, error: type
+) -> None:
+    rng = Random(5)
+    players = {f"player_{i}": make_record(rng) for i in range(200)}
+    store = IndexedPlayers(players)
+    with pytest.raises(error):
+        store.update("player_7", changes)
+    assert store.get("player_7") == players["player_7"]
+    for field in ("score", "level"):
+        assert len(store.sorted[field].entries) == len(players)
+    for filters in ([("score", "<", 5000)], [("level", "==", 10)],
+                    [("region", "==", "north")],
+                    [("achievements", "contains", "ach_3")]):
+        assert store.query(filters) == scan(players, filters)
+
+
+def test_planner_prefers_selective_indexes() -> None:
+    rng = Random(8)
+    store = IndexedPlayers({f"p{i}": make_record(rng) for i in range(1000)})
+    position, cost = store.plan([("region", "==", "north"),
+                                 ("score", ">", 9900)])
+    assert position == 1 and cost < 50
+    assert store.plan([("score", ">", 10)]) == (None, 1000)
+    assert store.plan([("level", ">", 58.5)])[0] is None
+    assert store.explain([("score", ">", 10)]) == "full scan of 1000 rows"
@@ -0,0 +1,94 @@
+import os
+import sys
+import warnings
+from random import Random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex6"))
+
+from ft_analytics_dashboard import dashboard_metrics  # noqa: E402
+from ft_player_loader import (  # noqa: E402
+    MAGIC, PlayerReader, stream_metrics, write_jsonl, write_records
+)
+
+REGIONS = ("north", "east", "central", "west")
+
+
+def make_players(n: int, seed: int) -> dict[str, dict]:
+    rng = Random(seed)
+    return {
+        f"player_{i}": {
+            'level': rng.randrange(1, 60),
+            'score': rng.randrange(10_000),
+            'sessions_played': rng.randrange(100),
+            'region': rng.choice(REGIONS),
+            'achievements': {f"ach_{rng.randrange(70)}"
+                             for _ in range(rng.randrange(6))}
+        }
+        for i in range(n)
+    }
+
+
+def read_all(path: str, chunk_size: int = 97) -> dict[str, dict]:
+    with PlayerReader(path) as reader:
+        return {name: record for chunk in reader.chunks(chunk_size)
+                for name, record in chunk.records()}
+
+
+def test_both_formats_round_trip(tmp_path: object) -> None:
+    players = make_players(1000, 1)
+    records, jsonl = tmp_path / "p.bin", tmp_path / "p.jsonl"
+    assert write_records(players, str(records), group_size=64) == 1000
+    assert write_jsonl(players, str(jsonl)) == 1000
+    assert read_all(str(records)) == players
+    assert read_all(str(jsonl)) == players
+
+
+def test_streamed_metrics_match_in_memory_metrics(tmp_path: object) -> None:
+    players = make_players(800, 2)
+    records, jsonl = tmp_path / "p.bin", tmp_path / "p.jsonl"
+    write_records(players, str(records), group_size=50)
+    write_jsonl(players, str(jsonl))
+    expected = dashboard_metrics(players)
+    assert stream_metrics(str(records)) == expected
+    assert stream_metrics(str(jsonl), chunk_size=33) == expected
+
+
+def test_json_lines_chunks_can_be_iterated_again(tmp_path: object) -> None:
+    players = make_players(100, 3)
+    path = tmp_path / "p.jsonl"
+    write_jsonl(players, str(path))
+    with PlayerReader(str(path)) as reader:
+        first, second = reader.chunks(7), reader.chunks(11)
+        names = [name for chunk in first for name, _ in chunk.records()]
+        again = [name for chunk in second for name, _ in chunk.records()]
+        chunk = next(reader.chunks(10))
+        assert list(chunk.records(["level"])) \
+            == list(chunk.records(["level"]))
+    assert names == again == list(players)
+
+
+@pytest.mark.parametrize("cut", [3, len(MAGIC) + 5, 200, -1])
+def test_truncated_record_file_is_rejected_and_closed(
+    tmp_path: object, cut: int
+) -> None:
+    path = tmp_path / "p.bin"
+    write_records(make_players(50, 4), str(path), group_size=8)
+    data = path.read_bytes()
+    path.write_bytes(data[:cut])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        with pytest.raises(ValueError, match="truncated record file"):
+            PlayerReader(str(path))
+
+
+def test_row_group_past_the_footer_is_reported(tmp_path: object) -> None:
+    path = tmp_path / "p.bin"
+    write_records(make_players(50, 5), str(path), group_size=8)
+    data = bytearray(path.read_bytes())
+    data[len(MAGIC) + 11] = 0x7f
+    path.write_bytes(bytes(data))
+    with PlayerReader(str(path)) as reader:
+        with pytest.raises(ValueError, match=f"at byte {len(MAGIC)}"):
+            list(reader.chunks())
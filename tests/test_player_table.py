@@ -0,0 +1,97 @@
+import os
+import sys
+from random import Random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex6"))
+
+from ft_analytics_dashboard import PLAYERS  # noqa: E402
+from ft_player_table import (  # noqa: E402
+    COMPARATORS, PlayerTable, count, mask_and, mask_not, mask_or
+)
+
+REGIONS = ("north", "east", "central", "west")
+
+
+def make_players(n: int, seed: int, catalog: int) -> dict[str, dict]:
+    rng = Random(seed)
+    return {
+        f"player_{i}": {
+            'level': rng.randrange(1, 60),
+            'score': rng.randrange(10_000),
+            'sessions_played': rng.randrange(100),
+            'region': rng.choice(REGIONS),
+            'achievements': {f"ach_{rng.randrange(catalog)}"
+                             for _ in range(rng.randrange(6))}
+        }
+        for i in range(n)
+    }
+
+
+def where(players: dict[str, dict], keep: object) -> list[str]:
+    return [name for name, data in players.items() if keep(data)]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("catalog", [30, 100])
+def test_filters_match_a_brute_force_scan(
+    use_numpy: bool, catalog: int
+) -> None:
+    players = make_players(2000, catalog, catalog)
+    table = PlayerTable.from_dict(players, use_numpy)
+    for column in ("level", "score", "sessions_played"):
+        for op, compare in COMPARATORS.items():
+            mask = table.compare(column, op, 40)
+            assert table.select("name", mask) \
+                == where(players, lambda d: compare(d[column], 40))
+    band = table.between("score", 2000, 5000)
+    assert table.select("name", band) \
+        == where(players, lambda d: 2000 <= d['score'] < 5000)
+    north = table.region_is("north")
+    assert table.select("name", north) \
+        == where(players, lambda d: d['region'] == "north")
+    assert count(table.region_is("south")) == 0
+    holds = table.has_achievement("ach_7")
+    assert table.select("name", holds) \
+        == where(players, lambda d: "ach_7" in d['achievements'])
+    assert count(table.has_achievement("missing")) == 0
+    either = mask_or(mask_not(north), holds)
+    assert table.select("name", mask_and(either, band)) == where(
+        players, lambda d: 2000 <= d['score'] < 5000
+        and (d['region'] != "north" or "ach_7" in d['achievements'])
+    )
+    assert table.select("region") == [d['region'] for d in players.values()]
+    assert table.achievement_counts() \
+        == [len(d['achievements']) for d in players.values()]
+    for name, data in players.items():
+        assert table.row(name) == data
+
+
+def test_level_buckets_match_the_dashboard() -> None:
+    table = PlayerTable.from_dict(PLAYERS)
+    levels = [data['level'] for data in PLAYERS.values()]
+    assert table.level_buckets() == {
+        "high": sum(level >= 30 for level in levels),
+        "medium": sum(20 <= level < 30 for level in levels),
+        "low": sum(level < 20 for level in levels)
+    }
+
+
+def test_rejected_records_leave_columns_aligned() -> None:
+    table = PlayerTable.from_dict(PLAYERS)
+    record = dict(PLAYERS['alice'])
+    with pytest.raises(KeyError):
+        table.append('alice', record)
+    with pytest.raises(TypeError):
+        table.append('zed', {**record, 'score': "high"})
+    with pytest.raises(OverflowError):
+        table.append('zed', {**record, 'score': 1 << 40})
+    with pytest.raises(KeyError):
+        del record['region']
+        table.append('zed', record)
+    sizes = {len(getattr(table, column)) for column in (
+        "names", "level", "score", "sessions_played", "region",
+        "achievements")}
+    assert sizes == {len(PLAYERS)}
+    assert table.select("name") == list(PLAYERS)
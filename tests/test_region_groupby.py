@@ -0,0 +1,71 @@
+import os
+import sys
+from random import Random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex6"))
+
+from ft_analytics_dashboard import PLAYERS  # noqa: E402
+from ft_region_groupby import group_by_region  # noqa: E402
+
+REGIONS = ("north", "east", "central", "west", "south")
+
+
+def make_players(n: int, seed: int) -> dict[str, dict]:
+    rng = Random(seed)
+    return {
+        f"player_{i}": {
+            'level': rng.randrange(1, 60),
+            'score': rng.randrange(10_000),
+            'sessions_played': rng.randrange(100),
+            'region': rng.choice(REGIONS),
+            'achievements': set()
+        }
+        for i in range(n)
+    }
+
+
+def brute_force(players: dict[str, dict]) -> dict[str, dict]:
+    report = {}
+    for region in sorted({data['region'] for data in players.values()}):
+        rows = [data for data in players.values()
+                if data['region'] == region]
+        scores = [data['score'] for data in rows]
+        levels = [data['level'] for data in rows]
+        report[region] = {
+            "players": len(rows),
+            "score_sum": sum(scores),
+            "score_mean": round(sum(scores) / len(rows), 2),
+            "score_max": max(scores),
+            "active": sum(data['sessions_played'] > 40 for data in rows),
+            "levels": {
+                "high": sum(level >= 30 for level in levels),
+                "medium": sum(20 <= level < 30 for level in levels),
+                "low": sum(level < 20 for level in levels)
+            }
+        }
+    return report
+
+
+def as_dicts(stats: dict) -> dict[str, dict]:
+    return {region: state.to_dict() for region, state in stats.items()}
+
+
+@pytest.mark.parametrize("workers, chunk_size", [
+    (1, 100_000), (1, 37), (3, 250), (2, 1)
+])
+def test_group_by_region_matches_brute_force(
+    workers: int, chunk_size: int
+) -> None:
+    players = make_players(2000 if chunk_size > 1 else 60, 4)
+    stats = group_by_region(players, workers, chunk_size)
+    assert list(stats) == sorted(REGIONS)
+    assert as_dicts(stats) == brute_force(players)
+
+
+def test_small_and_invalid_inputs() -> None:
+    assert as_dicts(group_by_region(PLAYERS)) == brute_force(PLAYERS)
+    assert group_by_region({}) == {}
+    with pytest.raises(ValueError):
+        group_by_region(PLAYERS, chunk_size=0)
@@ -0,0 +1,73 @@
+import io
+import os
+import sys
+from random import Random
+from statistics import pvariance
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex1"))
+
+from ft_score_analytics import (  # noqa: E402
+    ScoreStats, read_scores, stream_analysis
+)
+from ft_score_sketches import KLLSketch  # noqa: E402
+
+
+def random_scores(n: int, seed: int) -> list[int]:
+    rng = Random(seed)
+    return [rng.randrange(100_000) for _ in range(n)]
+
+
+def as_text(scores: list[int], seed: int) -> bytes:
+    rng = Random(seed)
+    return b"".join(str(score).encode() + rng.choice([b" ", b"\n", b"\t",
+                                                      b"\r\n", b"  "])
+                    for score in scores)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 20])
+def test_read_scores_splits_tokens_across_chunks(chunk_size: int) -> None:
+    scores = random_scores(3000, 1)
+    data = as_text(scores, 2)
+    chunks = read_scores(io.BytesIO(data), chunk_size)
+    assert [score for chunk in chunks for score in chunk] == scores
+    unterminated = io.BytesIO(data.rstrip() + b" 17")
+    assert sum(read_scores(unterminated, chunk_size), [])[-2:] \
+        == [scores[-1], 17]
+
+
+def test_chunked_stats_match_one_pass() -> None:
+    scores = random_scores(10_001, 3)
+    stats = ScoreStats()
+    for i in range(0, len(scores), 777):
+        stats.update(scores[i:i + 777])
+    stats.update([])
+    assert stats.count == len(scores)
+    assert stats.total == sum(scores)
+    assert (stats.min, stats.max) == (min(scores), max(scores))
+    assert stats.mean == pytest.approx(sum(scores) / len(scores))
+    assert stats.variance == pytest.approx(pvariance(scores))
+    assert not stats.echoable
+    assert stats.head == scores[:20]
+
+
+def test_stream_analysis_reads_files_and_stdin(
+    tmp_path: object, monkeypatch: object
+) -> None:
+    first, second = random_scores(5000, 4), random_scores(200, 5)
+    path = tmp_path / "scores.txt"
+    path.write_bytes(as_text(first, 6))
+    stdin = io.TextIOWrapper(io.BytesIO(as_text(second, 7)))
+    monkeypatch.setattr(sys, "stdin", stdin)
+    sketch = KLLSketch(seed=1)
+    stats = stream_analysis([str(path), "-"], sketch)
+    scores = first + second
+    assert stats.count == sketch.count == len(scores)
+    assert stats.total == sum(scores)
+    assert stats.variance == pytest.approx(pvariance(scores))
+    assert abs(sketch.rank(sorted(scores)[len(scores) // 2]) - 0.5) < 0.02
+
+    path.write_bytes(b"12 13 oops 14")
+    with pytest.raises(ValueError):
+        stream_analysis([str(path)])
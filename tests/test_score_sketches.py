@@ -0,0 +1,74 @@
+import os
+import sys
+from bisect import bisect_right
+from random import Random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex1"))
+
+from ft_score_sketches import KLLSketch, ScoreHistogram  # noqa: E402
+
+K = 50
+BOUND = 2 / K
+
+
+def test_periodic_stream_stays_within_rank_bound() -> None:
+    warm_up = list(range(1000)) * 200
+    for seed in range(20):
+        sketch = KLLSketch(K, seed=seed)
+        sketch.update(warm_up)
+        sampled = 0
+        while sketch._capacity(sampled) == 2:
+            sampled += 1
+        assert sampled
+        period = 1 << sampled
+        stream = [0 if i % period < period // 2 else 5000
+                  for i in range(400_000)]
+        sketch.update(stream)
+        truth = (len(warm_up) + len(stream) // 2) \
+            / (len(warm_up) + len(stream))
+        assert abs(sketch.rank(4999) - truth) < BOUND
+
+
+def test_quantiles_match_sorted_scores() -> None:
+    rng = Random(5)
+    scores = [int(rng.lognormvariate(8, 1.2)) for _ in range(200_000)]
+    ordered = sorted(scores)
+    sketch = KLLSketch(K, seed=1)
+    for i in range(0, len(scores), 7919):
+        sketch.update(scores[i:i + 7919])
+    assert len(sketch) == len(scores)
+    assert sketch.quantiles([0, 1]) == [ordered[0], ordered[-1]]
+    for q in (0.1, 0.5, 0.9, 0.99):
+        rank = bisect_right(ordered, sketch.quantile(q)) / len(ordered)
+        assert abs(rank - q) < BOUND
+
+
+def test_merged_and_restored_sketches_keep_the_bound() -> None:
+    rng = Random(6)
+    scores = [rng.randrange(1_000_000) for _ in range(100_000)]
+    left, right = KLLSketch(K, seed=2), KLLSketch(K, seed=3)
+    left.update(scores[:60_000])
+    right.update(scores[60_000:])
+    merged = KLLSketch.from_bytes(left.merge(right).to_bytes())
+    assert merged.count == len(scores)
+    ordered = sorted(scores)
+    median = bisect_right(ordered, merged.quantile(0.5)) / len(ordered)
+    assert abs(median - 0.5) < BOUND
+
+
+def test_histogram_counts_match_exact_buckets() -> None:
+    rng = Random(7)
+    scores = [rng.randrange(-100, 1100) for _ in range(50_000)]
+    histogram = ScoreHistogram(0, 1000, 10)
+    histogram.update(scores[:20_000])
+    other = ScoreHistogram(0, 1000, 10)
+    other.update(scores[20_000:])
+    histogram = ScoreHistogram.from_bytes(histogram.merge(other).to_bytes())
+    assert histogram.underflow == sum(score < 0 for score in scores)
+    assert histogram.overflow == sum(score >= 1000 for score in scores)
+    assert [count for _, _, count in histogram.buckets()] == [
+        sum(low <= score < low + 100 for score in scores)
+        for low in range(0, 1000, 100)
+    ]
+    exact = sorted(scores)[len(scores) // 2]
+    assert abs(histogram.quantile(0.5) - exact) <= 100
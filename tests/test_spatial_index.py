@@ -0,0 +1,83 @@
+import os
+import sys
+from math import sqrt
+from random import Random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex2"))
+
+from ft_spatial_index import GridIndex, KDTree  # noqa: E402
+
+
+def brute_within(points: dict, center: tuple, radius: float) -> list:
+    found = []
+    for entity, position in points.items():
+        d2 = sum((p - c) ** 2 for p, c in zip(position, center))
+        if d2 <= radius * radius:
+            found.append(sqrt(d2))
+    return sorted(found)
+
+
+def brute_nearest(points: dict, center: tuple, k: int) -> list:
+    return sorted(
+        sqrt(sum((p - c) ** 2 for p, c in zip(position, center)))
+        for position in points.values()
+    )[:k]
+
+
+def make_points(n: int, span: int, seed: int) -> dict[int, tuple]:
+    rng = Random(seed)
+    return {i: tuple(rng.randint(-span, span) for _ in range(3))
+            for i in range(n)}
+
+
+def make_queries(seed: int) -> list[tuple]:
+    rng = Random(seed)
+    queries = [tuple(rng.randint(-1200, 1200) for _ in range(3))
+               for _ in range(20)]
+    queries += [tuple(rng.uniform(-1200, 1200) for _ in range(3))
+                for _ in range(20)]
+    return queries + [(1.5, 2.0, -0.5)]
+
+
+def check(index: object, points: dict, queries: list) -> None:
+    for center in queries:
+        for radius in (0, 150, 400.5):
+            found = [d for _, d in index.within(center, radius)]
+            assert found == brute_within(points, center, radius)
+        for k in (1, 7, 40):
+            found = [d for _, d in index.nearest(center, k)]
+            assert found == brute_nearest(points, center, k)
+
+
+def test_grid_matches_brute_force_after_moves() -> None:
+    points = make_points(1500, 1000, 1)
+    grid = GridIndex(100)
+    for entity, position in points.items():
+        grid.insert(entity, position)
+    rng = Random(2)
+    for entity in rng.sample(sorted(points), 300):
+        points[entity] = tuple(rng.randint(-1000, 1000) for _ in range(3))
+        grid.move(entity, points[entity])
+    for entity in rng.sample(sorted(points), 100):
+        del points[entity]
+        grid.remove(entity)
+    assert len(grid) == len(points)
+    check(grid, points, make_queries(3))
+
+
+def test_kd_tree_matches_brute_force() -> None:
+    points = make_points(2000, 1000, 4)
+    tree = KDTree(list(points.values()), ids=list(points), leaf_size=8)
+    assert len(tree) == len(points)
+    check(tree, points, make_queries(5))
+
+
+def test_float_centers_agree_between_indexes() -> None:
+    points = make_points(300, 50, 6)
+    grid = GridIndex(16)
+    for entity, position in points.items():
+        grid.insert(entity, position)
+    tree = KDTree(list(points.values()))
+    for center in ((1.5, 2.0, 0.0), (-7.25, 33.5, 49.9)):
+        assert [d for _, d in grid.nearest(center, 5)] \
+            == [d for _, d in tree.nearest(center, 5)]
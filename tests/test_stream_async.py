@@ -0,0 +1,80 @@
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex5"))
+
+from ft_data_stream import LOL_EVENTS  # noqa: E402
+from ft_stream_async import (  # noqa: E402
+    AsyncStreamProcessor, parse_event_line
+)
+from ft_stream_sinks import NullSink, QuietSink  # noqa: E402
+
+
+class FailingSink(NullSink):
+    def write(self, records: list) -> None:
+        raise RuntimeError("sink broke")
+
+
+def reader_of(lines: list[bytes]) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"".join(lines))
+    reader.feed_eof()
+    return reader
+
+
+def reference_category(level: int, event: str) -> str | None:
+    if level > 10:
+        return "High-level"
+    if "Kill" in event:
+        return "Kill"
+    if "Destroyed" in event:
+        return "Destroyed"
+    return None
+
+
+def test_parse_event_line_accepts_both_wire_formats() -> None:
+    assert parse_event_line(b"Chaos,7,Kill,123\n") == ("Chaos", 7, "Kill", 123)
+    assert parse_event_line(b"Darius,3,Kill") == ("Darius", 3, "Kill", None)
+    line = json.dumps({"player": "Spasha", "level": 12, "event": "Kill"})
+    assert parse_event_line(line.encode()) == ("Spasha", 12, "Kill", None)
+    for bad in (b"Chaos,7\n", b"Chaos,x,Kill\n", b'{"player": "a"}\n'):
+        with pytest.raises(ValueError):
+            parse_event_line(bad)
+
+
+def test_counts_match_the_reference_classifier() -> None:
+    events = [(f"p{i}", i % 18, LOL_EVENTS[i % len(LOL_EVENTS)])
+              for i in range(3000)]
+    lines = [f"{p},{level},{event}\n".encode() for p, level, event in events]
+    lines[10:10] = [b"garbage\n", b"Chaos,3,Unknown event\n"]
+    processor = AsyncStreamProcessor(QuietSink(), queue_size=2, batch_size=7)
+    half = len(lines) // 2
+    asyncio.run(processor.run([processor.produce(reader_of(lines[:half])),
+                               processor.produce(reader_of(lines[half:]))]))
+    expected = dict.fromkeys(processor.counter, 0)
+    for _, level, event in events:
+        category = reference_category(level, event)
+        if category:
+            expected[category] += 1
+    assert processor.events == processor.sink.records_seen == 3000
+    assert processor.rejected == 2
+    assert processor.counter == expected
+
+
+def test_failing_consumer_cancels_blocked_producers() -> None:
+    lines = [b"Chaos,3,Penta Kill\n"] * 2000
+    processor = AsyncStreamProcessor(FailingSink(), queue_size=1,
+                                     batch_size=4)
+
+    async def run() -> None:
+        await asyncio.wait_for(processor.run([
+            processor.produce(reader_of(lines)),
+            processor.produce(reader_of(lines))
+        ]), timeout=5)
+
+    with pytest.raises(RuntimeError, match="sink broke"):
+        asyncio.run(run())
@@ -0,0 +1,56 @@
+import io
+import json
+import os
+import sys
+from itertools import islice
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex5"))
+
+from ft_data_stream import count_lol_events, lol_event_generator  # noqa: E402
+from ft_stream_sinks import (  # noqa: E402
+    JsonLinesSink, QuietSink, TextSink, _BufferedSink
+)
+
+
+def reference_lines(event_num: int, seed: int) -> list[str]:
+    events = islice(lol_event_generator(seed), event_num)
+    return [f"Event {i}: Player {player} (level {level}) {event}\n"
+            for i, (player, level, event) in enumerate(events, 1)]
+
+
+@pytest.mark.parametrize("buffer_size", [1, 100, 1 << 16])
+def test_text_sink_writes_the_reference_lines(buffer_size: int) -> None:
+    stream = io.StringIO()
+    sink = TextSink(stream, buffer_size)
+    count_lol_events(2500, seed=9, chunk_size=300, sink=sink)
+    sink.close()
+    assert stream.getvalue() == "".join(reference_lines(2500, 9))
+
+
+def test_json_lines_sink_round_trips(tmp_path: object) -> None:
+    path = str(tmp_path / "events.jsonl")
+    sink = JsonLinesSink(path, buffer_size=50)
+    count_lol_events(700, seed=4, chunk_size=64, sink=sink)
+    sink.close()
+    with open(path, encoding="utf-8") as file:
+        records = [json.loads(line) for line in file]
+    events = list(islice(lol_event_generator(4), 700))
+    assert [(r["index"], r["player"], r["level"], r["event"])
+            for r in records] \
+        == [(i, *event) for i, event in enumerate(events, 1)]
+
+
+def test_quiet_sink_only_counts() -> None:
+    sink = QuietSink()
+    counter = count_lol_events(1234, seed=2, chunk_size=100, sink=sink)
+    assert sink.records_seen == 1234
+    assert counter == count_lol_events(1234, seed=2)
+
+
+def test_buffered_sink_needs_a_formatter() -> None:
+    with pytest.raises(TypeError):
+        _BufferedSink()
+    with pytest.raises(ValueError):
+        TextSink(io.StringIO(), buffer_size=0)
@@ -0,0 +1,42 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex5"))
+
+from ft_data_stream import count_lol_events  # noqa: E402
+from ft_stream_stats import STAGES, StreamStats  # noqa: E402
+
+
+def test_chunks_fill_stages_and_histogram() -> None:
+    stats = StreamStats()
+    stats.add_chunk(10, 100, 200, 700)
+    stats.add_chunk(30, 5, 5, 5)
+    assert stats.events == 40
+    assert stats.chunks == 2
+    assert stats.stage_ns == {"generate": 105, "classify": 205, "emit": 705}
+    assert stats.histogram[(1000).bit_length()] == 10
+    assert stats.histogram[(15).bit_length()] == 30
+    assert stats.latency_percentile(50) == 16
+    assert stats.latency_percentile(99) == 1024
+    assert StreamStats().latency_percentile(50) == 0
+
+
+def test_stream_run_reports_every_event(tmp_path: object) -> None:
+    stats = StreamStats(trace_memory=True)
+    stats.start()
+    count_lol_events(5000, seed=1, chunk_size=512, stats=stats)
+    stats.stop()
+    assert stats.events == 5000
+    assert stats.chunks == 10
+    assert sum(stats.histogram) == 5000
+    assert stats.wall_ns >= sum(stats.stage_ns.values())
+    assert 0 < stats.memory_current <= stats.memory_peak
+
+    path = tmp_path / "stats.json"
+    stats.dump_json(str(path))
+    data = json.loads(path.read_text())
+    assert data["events"] == 5000
+    assert set(data["stage_ns"]) == set(STAGES)
+    assert sum(data["latency_ns"]["histogram"].values()) == 5000
+    assert data["memory_bytes"]["traced"] is True
@@ -0,0 +1,68 @@
+import os
+import sys
+from collections import Counter
+from itertools import islice
+from random import Random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ex5"))
+
+from ft_data_stream import lol_event_generator  # noqa: E402
+from ft_stream_windows import SpaceSaving, WindowedAnalytics  # noqa: E402
+
+
+def expected_report(window: list[tuple]) -> tuple:
+    return (len(window), dict(Counter(player for player, _, _ in window)),
+            dict(Counter(event for _, _, event in window)),
+            sum(level > 10 for _, level, _ in window))
+
+
+def summary(report: dict) -> tuple:
+    return (report["events"], report["players"], report["event_types"],
+            round(report["high_level_ratio"] * report["events"]))
+
+
+@pytest.mark.parametrize("size, step", [(100, 100), (100, 30), (50, 75)])
+def test_count_windows_match_a_recount(size: int, step: int) -> None:
+    events = list(islice(lol_event_generator(11), 1000))
+    reports = list(WindowedAnalytics(size, step).consume(events))
+    assert [report["window_end"] for report in reports] \
+        == list(range(step, 1001, step))
+    for report in reports:
+        end = report["window_end"]
+        window = events[max(0, end - size):end]
+        assert summary(report) == expected_report(window)
+
+
+def test_time_windows_match_a_recount() -> None:
+    rng = Random(4)
+    events = list(islice(lol_event_generator(6), 2000))
+    stamps = sorted(rng.uniform(0, 100) for _ in events)
+    analytics = WindowedAnalytics(10.0, 2.5, by="time")
+    reports = list(analytics.consume(
+        (*event, ts) for event, ts in zip(events, stamps)
+    ))
+    assert len(reports) == int((stamps[-1] - stamps[0]) // 2.5)
+    for report in reports:
+        end = report["window_end"]
+        window = [event for event, ts in zip(events, stamps)
+                  if end - 10.0 <= ts < end]
+        assert summary(report) == expected_report(window)
+
+
+def test_space_saving_bounds_hold_on_a_skewed_stream() -> None:
+    rng = Random(9)
+    stream = [min(int(rng.paretovariate(1.2)), 500) for _ in range(20000)]
+    truth = Counter(stream)
+    sketch = SpaceSaving(20)
+    for item in stream:
+        sketch.add(item)
+    assert len(sketch.counts) == 20
+    for item, count, error in sketch.top(20):
+        assert count - error <= truth[item] <= count
+    for item, count in truth.items():
+        if count > len(stream) / 20:
+            assert item in sketch.counts
+    assert [item for item, _, _ in sketch.top(3)] \
+        == [item for item, _ in truth.most_common(3)]